@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+""" Autotiler
+
+This module chooses the glyph of each wall ('x', '0'...'9') from its
+neighbours : a level only needs 'x' for its walls. The mask of a wall is
+the sum of its wall neighbours : north 1, east 2, south 4, west 8, and
+with the diagonals north-east 16, south-east 32, south-west 64, north-west
+128 (the border of the grid is not a wall).
+
+The whole grid is handled at once : one byte per tile in a big integer,
+so a shift of the integer moves all the tiles towards a neighbour.
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python int : https://docs.python.org/3.6/library/stdtypes.html#int
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# PROGRAM IMPORTS
+from backend.grid import WALLS
+
+# Weight and index offset (line, column) of the neighbours of a tile
+NEIGHBOURS_4 = (
+    (1, (-1, 0)),
+    (2, (0, 1)),
+    (4, (1, 0)),
+    (8, (0, -1))
+)
+NEIGHBOURS_8 = NEIGHBOURS_4 + (
+    (16, (-1, 1)),
+    (32, (1, 1)),
+    (64, (1, -1)),
+    (128, (-1, -1))
+)
+
+# Glyph of each mask of the 4 neighbours
+WALL_GLYPHS = b'x72x84249600153x'
+
+# Glyph of each mask of the 8 neighbours, the walls have no corner glyph
+# yet : the diagonals do not change the glyph
+WALL_GLYPHS_8 = WALL_GLYPHS * 16
+
+# Tile to 1 for walls, 0 for other tiles
+WALL_FLAGS = bytes(tile in WALLS for tile in range(256))
+
+# Tile to 0xff for the walls to autotile ('x'), 0 for other tiles
+AUTOTILE_SELECTION = bytes(0xff * (tile == WALLS[0]) for tile in range(256))
+
+
+def padded_bytes(grid, table):
+    """ Translate the tiles of a grid, with a border of zeros
+
+    Args:
+        grid(Grid): Labyrinth.
+        table(bytes): Translation table of the tiles.
+
+    Return:
+        bytes: (height + 2) lines of (width + 2) bytes.
+
+    """
+
+    border = bytes(grid.width + 2)
+    lines = [border]
+
+    for line_number in range(grid.height):
+        lines.append(b'\x00' + bytes(grid.row(line_number)).translate(table)
+                     + b'\x00')
+
+    lines.append(border)
+
+    return b''.join(lines)
+
+
+def unpadded_bytes(grid, data):
+    """ Remove the border of padded bytes (see padded_bytes) """
+
+    padded_width = grid.width + 2
+
+    return b''.join(
+        data[line_start:line_start + grid.width]
+        for line_start in range(
+            padded_width + 1, padded_width * (grid.height + 1), padded_width
+        )
+    )
+
+
+def neighbour_counts(grid, table, neighbours=NEIGHBOURS_4):
+    """ Weighted sum of the flags of the neighbours of each tile
+
+    Args:
+        grid(Grid): Labyrinth.
+        table(bytes): Translation table of the tiles to flags (0 or 1).
+        neighbours(tuple): (weight, (line, column) offset) of each
+        neighbour, the sum of the weights must be lower than 256.
+
+    Return:
+        bytes: One sum per tile of the grid.
+
+    """
+
+    data = padded_bytes(grid, table)
+    size = len(data)
+    padded_width = grid.width + 2
+
+    flags = int.from_bytes(data, 'big')
+    counts = 0
+
+    # Big-endian : the next byte of a tile is 8 bits lower
+    for weight, (line_offset, column_offset) in neighbours:
+
+        shift = 8 * (line_offset * padded_width + column_offset)
+
+        if shift > 0:
+            counts += (flags << shift) * weight
+        else:
+            counts += (flags >> -shift) * weight
+
+    counts &= (1 << 8 * size) - 1
+
+    return unpadded_bytes(grid, counts.to_bytes(size, 'big'))
+
+
+def autotile(grid, glyphs=WALL_GLYPHS):
+    """ Set the glyph of each 'x' wall of a grid from its neighbours
+
+    The other walls keep their glyph : a level author can force a glyph.
+
+    Args:
+        grid(Grid): Labyrinth.
+        glyphs(bytes): Glyph of each mask, WALL_GLYPHS (4 neighbours) or
+        WALL_GLYPHS_8 (8 neighbours).
+
+    """
+
+    if len(glyphs) > 16:
+        neighbours = NEIGHBOURS_8
+    else:
+        neighbours = NEIGHBOURS_4
+
+    masks = neighbour_counts(grid, WALL_FLAGS, neighbours=neighbours)
+    new_tiles = masks.translate(glyphs + bytes(256 - len(glyphs)))
+
+    cells = grid.cells
+    size = len(cells)
+
+    selection = int.from_bytes(
+        bytes(cells).translate(AUTOTILE_SELECTION), 'big'
+    )
+    tiles = (int.from_bytes(new_tiles, 'big') & selection) | (
+        int.from_bytes(cells, 'big') & ~selection
+    )
+
+    cells[:] = tiles.to_bytes(size, 'big')
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+""" Batch engine
+
+This module plays many games of the same labyrinth at once, for the
+balancing of the levels (scripted or random players) : the state of each
+game is a line of NumPy arrays, a step moves the players of all the
+games with a few operations on these arrays.
+
+The rules are the rules of Engine.apply_move :
+- a player moves on paths and items, an item is picked up once per game.
+- armor, key and sword count for the win, a life item gives a life (up to
+MAX_LIFE).
+- fire takes a life and sends the player back on the start (0, 0), or
+ends the game on the last life.
+- the arrival ends the game, won with ITEMS_TO_WIN items.
+- walls, borders and finished games block the move.
+
+The labyrinth is padded with a border of walls, the players never leave
+it : a position is an index in the padded labyrinth, a move adds an
+offset. Each item of the labyrinth is a bit of the items picked up by a
+game.
+
+Requires NumPy.
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+NumPy : https://numpy.org/doc/stable/
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# pylint: disable=too-many-instance-attributes
+
+# LIBRARY IMPORTS
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# PROGRAM IMPORTS
+from backend.engine import MOVEMENTS
+from backend.engine import MAX_LIFE
+from backend.engine import ITEMS_TO_WIN
+from backend.grid import PATH
+from backend.grid import FIRE
+from backend.grid import PLAYER
+from backend.grid import ARRIVAL
+from backend.grid import LIFE
+from backend.grid import ITEMS
+
+# KINDS OF TILES
+WALL_KIND = 0
+PATH_KIND = 1
+ITEM_KIND = 2
+FIRE_KIND = 3
+ARRIVAL_KIND = 4
+
+# RESULTS
+RUNNING = 0
+WIN = 1
+DEFEAT = 2
+
+# Movement ids, in the order of MOVEMENTS
+MOVEMENT_NAMES = tuple(MOVEMENTS)
+
+MAX_ITEMS = 64
+
+
+def kinds_table():
+    """ Return the kind of each tile byte (256 bytes) """
+
+    table = bytearray(256)
+
+    table[PATH] = PATH_KIND
+    table[PLAYER] = PATH_KIND
+    table[FIRE] = FIRE_KIND
+    table[ARRIVAL] = ARRIVAL_KIND
+
+    for tile in ITEMS:
+        table[tile] = ITEM_KIND
+
+    return bytes(table)
+
+
+KINDS_TABLE = kinds_table()
+
+
+class BatchEngine():
+    """ Batch engine
+
+    Plays games of the same labyrinth, each game has its own player and
+    its own items. The arrays have one value per game.
+
+    """
+
+    def __init__(self, grid, games, remaining_life=MAX_LIFE):
+        """ Batch engine initialization
+
+        Args:
+            grid(Grid): Labyrinth with items, it is not modified.
+            games(int): Number of games.
+            remaining_life(int): Player remaining life at the start.
+
+        Attributes:
+            width(int): Number of columns of the labyrinth.
+            height(int): Number of lines of the labyrinth.
+            kinds(ndarray): Kind of each tile of the padded labyrinth.
+            item_bits(ndarray): Bit of the item of each tile of the padded
+            labyrinth, 0 without item.
+            goal_items(ndarray): The tile of the padded labyrinth is an
+            item counted for the win.
+            offsets(ndarray): Offset of each movement id.
+            start(int): Padded index of the start (0, 0).
+            position(ndarray): Padded index of the player.
+            remaining_life(ndarray): Player remaining life.
+            collected(ndarray): Bits of the items picked up.
+            items(ndarray): Items counted for the win picked up.
+            result(ndarray): RUNNING, WIN or DEFEAT.
+            moves(ndarray): Moves applied before the end of the game.
+
+        """
+
+        if numpy is None:
+            raise ImportError("BatchEngine requires NumPy")
+
+        # Args
+        self.games = games
+        self.initial_life = remaining_life
+
+        # Attributes
+        self.width = grid.width
+        self.height = grid.height
+
+        padded_width = self.width + 2
+        tiles = numpy.frombuffer(bytes(grid.cells), dtype=numpy.uint8)
+
+        kinds = numpy.zeros((self.height + 2, padded_width), numpy.uint8)
+        kinds[1:-1, 1:-1] = numpy.frombuffer(
+            KINDS_TABLE, dtype=numpy.uint8
+        )[tiles].reshape(self.height, self.width)
+        self.kinds = kinds.ravel()
+
+        item_cells = numpy.flatnonzero(self.kinds == ITEM_KIND)
+
+        if len(item_cells) > MAX_ITEMS:
+            raise ValueError(
+                "The labyrinth has {} items, {} at most".format(
+                    len(item_cells), MAX_ITEMS
+                )
+            )
+
+        self.item_bits = numpy.zeros(len(self.kinds), numpy.uint64)
+        self.item_bits[item_cells] = numpy.left_shift(
+            numpy.uint64(1),
+            numpy.arange(len(item_cells), dtype=numpy.uint64)
+        )
+
+        padded_tiles = numpy.zeros_like(kinds)
+        padded_tiles[1:-1, 1:-1] = tiles.reshape(self.height, self.width)
+        self.goal_items = (
+            (self.kinds == ITEM_KIND) & (padded_tiles.ravel() != LIFE)
+        )
+
+        self.offsets = numpy.array(
+            [
+                line_move * padded_width + column_move
+                for line_move, column_move in MOVEMENTS.values()
+            ],
+            dtype=numpy.int64
+        )
+        self.start = padded_width + 1
+
+        self.position = numpy.full(games, self.start, numpy.int64)
+        self.remaining_life = numpy.full(games, remaining_life, numpy.int8)
+        self.collected = numpy.zeros(games, numpy.uint64)
+        self.items = numpy.zeros(games, numpy.int8)
+        self.result = numpy.zeros(games, numpy.int8)
+        self.moves = numpy.zeros(games, numpy.int32)
+
+    def step(self, movements):
+        """ Move the player of each game
+
+        Args:
+            movements(ndarray): Movement id of each game (index in
+            MOVEMENT_NAMES).
+
+        """
+
+        running = self.result == RUNNING
+        target = self.position + self.offsets[movements]
+        kinds = self.kinds[target]
+        bits = self.item_bits[target]
+
+        # The items picked up by a game are paths for this game, the
+        # finished games are blocked
+        kinds[(self.collected & bits) != 0] = PATH_KIND
+        kinds[~running] = WALL_KIND
+
+        # 1 : Paths and items
+        picked_up = kinds == ITEM_KIND
+        moved = picked_up | (kinds == PATH_KIND)
+
+        numpy.copyto(self.position, target, where=moved)
+        self.collected |= bits * picked_up
+
+        goal = picked_up & self.goal_items[target]
+        self.items += goal
+        numpy.minimum(
+            self.remaining_life + (picked_up ^ goal),
+            MAX_LIFE,
+            out=self.remaining_life
+        )
+
+        # 2 : Fire
+        fire = kinds == FIRE_KIND
+        death = fire & (self.remaining_life == 1)
+        burn = fire ^ death
+
+        self.remaining_life -= burn
+        self.position[burn] = self.start
+        self.result[death] = DEFEAT
+
+        # 3 : Arrival
+        arrival = kinds == ARRIVAL_KIND
+
+        self.result[arrival] = numpy.where(
+            self.items[arrival] == ITEMS_TO_WIN, WIN, DEFEAT
+        )
+
+        self.moves += running
+
+    def run(self, policy, max_steps):
+        """ Run the games
+
+        Args:
+            policy(function): Called with the batch engine, returns the
+            movement ids of the step.
+            max_steps(int): Maximum number of steps.
+
+        Return:
+            int: Number of steps.
+
+        """
+
+        for steps in range(max_steps):
+
+            if not (self.result == RUNNING).any():
+                return steps
+
+            self.step(policy(self))
+
+        return max_steps
+
+    def reset(self, games=None):
+        """ Start the games again
+
+        Args:
+            games(ndarray): Mask of the games to start again, all the
+            games if None.
+
+        """
+
+        if games is None:
+            games = slice(None)
+
+        self.position[games] = self.start
+        self.remaining_life[games] = self.initial_life
+        self.collected[games] = 0
+        self.items[games] = 0
+        self.result[games] = RUNNING
+        self.moves[games] = 0
+
+    def positions(self):
+        """ Positions of the players
+
+        Return:
+            tuple: (lines, columns) arrays.
+
+        """
+
+        lines, columns = numpy.divmod(self.position, self.width + 2)
+
+        return lines - 1, columns - 1
+
+    def results(self):
+        """ Number of games by result
+
+        Return:
+            dict: Number of 'running', 'win' and 'defeat' games.
+
+        """
+
+        counts = numpy.bincount(self.result, minlength=3)
+
+        return {
+            'running': int(counts[RUNNING]),
+            'win': int(counts[WIN]),
+            'defeat': int(counts[DEFEAT])
+        }
+
+
+def random_policy(seed=None):
+    """ Random policy
+
+    Args:
+        seed(int): Seed of the movements, random if None.
+
+    Return:
+        function: Policy for BatchEngine.run, a random movement for each
+        game.
+
+    """
+
+    generator = numpy.random.default_rng(seed)
+
+    def policy(batch_engine):
+        return generator.integers(
+            0, len(MOVEMENT_NAMES), batch_engine.games, dtype=numpy.int8
+        )
+
+    return policy
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+""" Engine
+
+This module contains the rules of the game, without Pygame : the engine
+can be used by the interfaces, by simulations or by tests.
+
+Each move returns a tuple of events :
+- moved : the player moved (previous_line/previous_column to
+line_number/column_number).
+- blocked : the player did not move (wall, border of the labyrinth or
+finished game).
+- item : the player picked up an item (last_item).
+- fire : the player walked on fire, he lost a life.
+- win : the player is on the arrival with the 3 items.
+- defeat : the player is on the arrival without the 3 items, or walked on
+fire with his last life.
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# pylint: disable=too-many-instance-attributes
+
+# PROGRAM IMPORTS
+from backend.grid import PATH
+from backend.grid import FIRE as FIRE_TILE
+from backend.grid import PLAYER
+from backend.grid import ARRIVAL
+from backend.grid import ITEMS
+
+# EVENTS
+MOVED = "moved"
+BLOCKED = "blocked"
+ITEM = "item"
+FIRE = "fire"
+WIN = "win"
+DEFEAT = "defeat"
+
+MOVED_EVENTS = (MOVED,)
+BLOCKED_EVENTS = (BLOCKED,)
+ITEM_EVENTS = (ITEM, MOVED)
+FIRE_EVENTS = (FIRE, MOVED)
+FIRE_DEFEAT_EVENTS = (FIRE, DEFEAT)
+WIN_EVENTS = (WIN,)
+DEFEAT_EVENTS = (DEFEAT,)
+
+# MOVEMENTS (line, column)
+MOVEMENTS = {
+    'right': (0, 1),
+    'left': (0, -1),
+    'down': (1, 0),
+    'up': (-1, 0)
+}
+
+MAX_LIFE = 5
+ITEMS_TO_WIN = 3
+
+
+class Engine():
+    """ Engine
+
+    This class is instanciated by an instance of Game, or alone for
+    simulations.
+
+    """
+
+    def __init__(self, grid, remaining_life=MAX_LIFE):
+        """ Engine initialization
+
+        Args:
+            grid(Grid): Labyrinth with items.
+            remaining_life(int): Player remaining life.
+
+        Attributes:
+            labyrinth(GridLines): List of lists view of the grid.
+            armor(int): Player armor quantity.
+            key(int): Player key quantity.
+            sword(int): Player sword quantity.
+            items(int): Player item quantity.
+            line_number(int): Pos X of player in labyrinth.
+            column_number(int): Pos Y of player in labyrinth.
+            previous_line(int): Pos X of player before the last move.
+            previous_column(int): Pos Y of player before the last move.
+            height(int): Number of lines of the labyrinth.
+            width(int): Number of columns of the labyrinth.
+            cells(bytearray): Tiles of the grid.
+            index(int): Grid index of the player.
+            offsets(dict): Movement name to (line move, column move, grid
+            index move).
+            last_item(str): Tile of the last item picked up.
+            result(str): None, 'win' or 'defeat'.
+            subscribers(list): Functions called with (event, engine).
+
+        """
+
+        # Args
+        self.grid = grid
+        self.remaining_life = remaining_life
+
+        # Attributes
+        self.labyrinth = grid.lines
+        self.armor = 0
+        self.key = 0
+        self.sword = 0
+        self.items = 0
+        self.line_number = 0
+        self.column_number = 0
+        self.previous_line = 0
+        self.previous_column = 0
+        self.height = grid.height
+        self.width = grid.width
+        self.cells = grid.cells
+        self.index = 0
+        self.offsets = {
+            movement_name: (
+                line_move, column_move, line_move * grid.width + column_move
+            )
+            for movement_name, (line_move, column_move) in MOVEMENTS.items()
+        }
+        self.last_item = None
+        self.result = None
+        self.subscribers = []
+
+    def subscribe(self, subscriber):
+        """ Subscribe
+
+        Args:
+            subscriber(function): Called with (event, engine) for each event.
+
+        """
+
+        self.subscribers.append(subscriber)
+
+    def move(self, movement_name):
+        """ Move the player
+
+        Args:
+            movement_name(str): 'right', 'left', 'down' or 'up'.
+
+        Return:
+            tuple: Events of the move.
+
+        """
+
+        events = self.apply_move(movement_name)
+
+        for subscriber in self.subscribers:
+            for event in events:
+                subscriber(event, self)
+
+        return events
+
+    def apply_move(self, movement_name):
+        """ Apply the rules of the game to a move
+
+        Args:
+            movement_name(str): 'right', 'left', 'down' or 'up'.
+
+        Return:
+            tuple: Events of the move.
+
+        """
+
+        if self.result is not None:
+            return BLOCKED_EVENTS
+
+        line_move, column_move, index_move = self.offsets[movement_name]
+        line_number = self.line_number + line_move
+        column_number = self.column_number + column_move
+
+        # 1 : We test that we don't leave the frame of the labyrinth
+        if not (0 <= line_number < self.height
+                and 0 <= column_number < self.width):
+            return BLOCKED_EVENTS
+
+        # The grid index follows the player, no index computation
+        index = self.index + index_move
+        tile = self.cells[index]
+
+        # 2 : Take an action based on the tile
+        if tile == PATH:
+            self.go_to(line_number, column_number, index)
+            return MOVED_EVENTS
+
+        if tile in ITEMS:
+            self.add_item(chr(tile))
+            self.go_to(line_number, column_number, index)
+            return ITEM_EVENTS
+
+        if tile == FIRE_TILE:
+
+            # if the player has no more life / He dies
+            if self.remaining_life == 1:
+                self.result = DEFEAT
+                return FIRE_DEFEAT_EVENTS
+
+            # the player lose one life point and returns on the start
+            self.remaining_life -= 1
+            self.go_to(0, 0, 0)
+            return FIRE_EVENTS
+
+        if tile == ARRIVAL:
+
+            # if the player to pick up the 3 objects / He win
+            if self.items == ITEMS_TO_WIN:
+                self.result = WIN
+                return WIN_EVENTS
+
+            self.result = DEFEAT
+            return DEFEAT_EVENTS
+
+        # Walls
+        return BLOCKED_EVENTS
+
+    def go_to(self, line_number, column_number, index=None):
+        """ Move the character on a tile
+
+        Args:
+            line_number(int): Destination line.
+            column_number(int): Destination column.
+            index(int): Grid index of the destination, computed if None.
+
+        """
+
+        if index is None:
+            index = line_number * self.width + column_number
+
+        cells = self.cells
+
+        self.previous_line = self.line_number
+        self.previous_column = self.column_number
+
+        cells[self.index] = PATH
+        cells[index] = PLAYER
+
+        self.line_number = line_number
+        self.column_number = column_number
+        self.index = index
+
+    def add_item(self, item_type):
+        """ Add item
+
+        Args:
+            item_type(str): Tile of the item to "pick up".
+
+        """
+
+        self.last_item = item_type
+
+        # Armor
+        if item_type == "a":
+            self.items += 1
+            self.armor += 1
+        # Key
+        elif item_type == "k":
+            self.items += 1
+            self.key += 1
+        # Sword
+        elif item_type == "s":
+            self.items += 1
+            self.sword += 1
+        # Life
+        elif item_type == "l":
+
+            if self.remaining_life < MAX_LIFE:
+                self.remaining_life += 1
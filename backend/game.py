@@ -7,23 +7,29 @@
 #### DOCUMENTATIONS
 ! For more informations about this app, consult : README.md
 Pygame docs : https://www.pygame.org/docs/
-Pygame mixer : https://www.pygame.org/docs/ref/mixer.html
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
 
 # pylint: disable=too-many-instance-attributes
-# pylint: disable=too-many-branches
 
 # LIBRARY IMPORTS
-import pygame.mixer
+from random import SystemRandom
 
 # PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import MOVED
+from backend.engine import ITEM
+from backend.engine import FIRE
+from backend.engine import WIN
+from backend.engine import DEFEAT
 from backend.labyrinth import Labyrinth
+from backend.recording import Recording
 from settings import LEVELS
+from settings import ITEMS_SEED
 
 class Game():
     """ Game
@@ -31,24 +37,38 @@ class Game():
     This class is instanciated by an instance of Program.
     (new_game method)
 
+    The rules of the game are applied by an instance of Engine, the game
+    subscribes to its events to update the interfaces.
+
     """
 
-    def __init__(self, program, level):
+    menu_slots = {
+        'a': 'armor',
+        'k': 'key',
+        's': 'sword',
+        'l': 'life'
+    }
+
+    def __init__(self, program, level, seed=None):
         """ Game initialization
 
             Args:
                 program(instance): Program instance.
                 level(int): Game level.
+                seed(int): Seed of the placement of the items, ITEMS_SEED
+                if None, a random seed if ITEMS_SEED is None. A signed 64
+                bits integer (see Recording).
 
             Params:
-                remaining_life(int): Player remaining life.
-                armor(int): Player item quantity.
-                key(int): Player key quantity.
-                sword(int): Player sword quantity.
-                items(int): Player item quantity.
-                line_number(int): Pos X of player in labyrinth.
-                column_number(int): Pos Y of player in labyrinth.
-                labyrinth(list): List of lists who represent labyrinth.
+                seed(int): Seed of the placement of the items.
+                recording(Recording): Level, seed and moves of the game.
+                engine(instance): Engine instance, player state.
+                grid(Grid): Labyrinth with items.
+                labyrinth(GridLines): List of lists view of the grid.
+                dirty_tiles(set): Tiles (line, column) modified since
+                the last render.
+                dirty_menu(set): Menu slots modified since the last render.
+                win(bool): The game is won.
 
         """
 
@@ -57,159 +77,71 @@ class Game():
         self.level = level
 
         # Params
-        self.remaining_life = 5
-        self.armor = 0
-        self.key = 0
-        self.sword = 0
-        self.items = 0
-        self.line_number = 0
-        self.column_number = 0
-        self.labyrinth = Labyrinth(
-            level=self.level
-        ).labyrinth
+        # The seed is always known : the game can be recorded and replayed
+        if seed is None:
+            seed = ITEMS_SEED
+
+        if seed is None:
+            seed = SystemRandom().getrandbits(63)
+
+        self.seed = seed
+        self.recording = Recording(
+            level=self.level,
+            seed=self.seed
+        )
+        self.engine = Engine(
+            grid=Labyrinth(
+                level=self.level,
+                seed=self.seed
+            ).grid
+        )
+        self.grid = self.engine.grid
+        self.labyrinth = self.engine.labyrinth
+        self.dirty_tiles = set()
+        self.dirty_menu = set()
+        self.win = False
+
+        self.engine.subscribe(self.engine_event)
 
     def movement_collusion(self, movement_name):
         """ Movement collusion test
 
-        Test the sprite where wish to move the player
+        Record the move and ask the engine to move the player.
 
         Args:
-            movement(str) : Movement name of the character.
-
-        Params:
-            line_number(int) : line where the character is / Then he will be
-            column_number(int) : column where the character is / Then he will be
+            movement_name(str) : Movement name of the character.
 
         """
 
-        line_number = self.line_number
-        column_number = self.column_number
-
-        # 1 : We calculate the sprite where wish to move the player
-        if movement_name == "right":
-            column_number += 1
-        elif movement_name == "left":
-            column_number -= 1
-        elif movement_name == "down":
-            line_number += 1
-        elif movement_name == "up":
-            line_number -= 1
-
-        # 2 : We test that we don't leave the frame of the labyrinth
-        if movement_name == "right" and column_number <= 14:
-            sprite_content = self.labyrinth[
-                line_number
-            ][column_number]
-        elif movement_name == "left" and column_number >= 0:
-            sprite_content = self.labyrinth[
-                line_number
-            ][column_number]
-        elif movement_name == "down" and line_number <= 14:
-            sprite_content = self.labyrinth[
-                line_number
-            ][column_number]
-        elif movement_name == "up" and line_number >= 0:
-            sprite_content = self.labyrinth[
-                line_number
-            ][column_number]
-        else:
-            sprite_content = "offFields"
-
-        # 3 : Take an action based on the result of the previous tests
-
-        if sprite_content == "offFields":
-            pass
-        # Sprite points to a wall
-        elif sprite_content == "x":
-            pass
-        # Sprite points to a path
-        elif sprite_content == "c":
-            self.movement(movement_name)
-        # Sprite points to a fire path
-        elif sprite_content == "f":
-            self.game_result("fire")
-        # Sprite points to an life
-        elif sprite_content == "l":
-            self.add_item("l")
-            self.movement(movement_name)
-        # Sprite points to an armor item
-        elif sprite_content == "a":
-            self.add_item("a")
-            self.movement(movement_name)
-        # Sprite points to an sword item
-        elif sprite_content == "s":
-            self.add_item("s")
-            self.movement(movement_name)
-        # Sprite points to an key item
-        elif sprite_content == "k":
-            self.add_item("k")
-            self.movement(movement_name)
-        # Sprite points on the arrival
-        elif sprite_content == "A":
-            self.game_result("arrival")
-
-    def movement(self, movement_name):
-        """ Movement of character
-
-        Manage character moves
+        self.recording.add(movement_name)
+        self.engine.move(movement_name)
+
+    def engine_event(self, event, engine):
+        """ Engine event
 
         Args:
-            movement_name(str) : Movement name of the character.
-            (Right, left, down or start.)
+            event(str): Event name (see backend.engine).
+            engine(instance): Engine instance.
 
         """
 
-        # 1 : We modify the sprite where the character is located before moving
-        self.labyrinth[
-            self.line_number
-        ][self.column_number] = "c"
-
-        # 2 : We calculate the sprite where move the player
-
-        if movement_name == "right":
-            self.column_number += 1
-        elif movement_name == "left":
-            self.column_number -= 1
-        elif movement_name == "down":
-            self.line_number += 1
-        elif movement_name == "up":
-            self.line_number -= 1
-        elif movement_name == "start":
-            self.line_number = 0
-            self.column_number = 0
-
-        # 3 : We modify the sprite on which we juste moved the character
-        self.labyrinth[
-            self.line_number
-        ][self.column_number] = "P"
-
-    def add_item(self, item_type):
-        """ Add item
+        if event == MOVED:
 
-        Args:
-            item_type (int) : Type of the item to "pick up"
+            self.dirty_tiles.add(
+                (engine.previous_line, engine.previous_column)
+            )
+            self.dirty_tiles.add(
+                (engine.line_number, engine.column_number)
+            )
 
-        """
+        elif event == ITEM:
+            self.dirty_menu.add(self.menu_slots[engine.last_item])
 
-        item_type = item_type
-
-        # Armor
-        if item_type == "a":
-            self.items += 1
-            self.armor += 1
-        # Key
-        elif item_type == "k":
-            self.items += 1
-            self.key += 1
-        # Sword
-        elif item_type == "s":
-            self.items += 1
-            self.sword += 1
-        # Life
-        elif item_type == "l":
-
-            if self.remaining_life < 5:
-                self.remaining_life += 1
+        elif event == FIRE:
+            self.dirty_menu.add("life")
+
+        elif event in (WIN, DEFEAT):
+            self.game_result(event)
 
     def game_result(self, values):
         """ Game result
@@ -217,40 +149,48 @@ class Game():
         Victory or defeat.
 
         Args:
-            values(str) : 'arrival' or 'fire'
+            values(str) : 'win' or 'defeat'
 
         """
 
         result_game = values
 
-        # if the player shows up on the finish square
-        if result_game == "arrival":
+        self.program.save_recording()
+
+        if result_game == DEFEAT:
 
-            # if the player to pick up the 3 objects / He win
-            if self.items < 3:
+            self.program.activate_interface(
+                interface=self.program.get_interface('defeat_interface')
+            )
+            self.program.defeat = True
 
-                self.program.active_interface = self.program.defeat_interface
-                self.program.defeat = True
+        elif result_game == WIN:
 
-            elif self.items == 3:
+            if self.level < LEVELS:
+                self.program.activate_interface(
+                    interface=self.program.get_interface('win_interface')
+                )
+                self.win = True
+            else:
+                self.program.sound_manager.music_stop()
+                self.program.activate_interface(
+                    interface=self.program.home_interface
+                )
 
-                if self.program.game.level < LEVELS:
-                    self.program.active_interface = self.program.win_interface
-                    self.program.game.win = True
-                else:
-                    pygame.mixer.music.stop()
-                    self.program.active_interface = self.program.home_interface
+    def pop_changes(self):
+        """ Pop changes
 
-        # if the player has walked on fire
-        elif result_game == "fire":
+        Return the tiles and menu slots modified since the last call,
+        then forget them.
 
-            # if the player has no more life / He dies
-            if self.remaining_life == 1:
-                self.program.active_interface = self.program.defeat_interface
-            else:
+        Return:
+            tuple: (set of (line, column), set of menu slot names).
+
+        """
+
+        changes = self.dirty_tiles, self.dirty_menu
 
-                # the player lose one life point
-                self.remaining_life -= 1
+        self.dirty_tiles = set()
+        self.dirty_menu = set()
 
-                # the player returns on the start square
-                self.movement("start")
+        return changes
@@ -0,0 +1,631 @@
+# -*- coding: utf-8 -*-
+""" Generator
+
+This module generates labyrinths in the alphabet of the level files :
+walls with their glyphs, paths, fire and the arrival. The start is the
+top left tile, the items are placed by Labyrinth.
+
+The cells of the maze are the tiles of even line and even column, the
+tiles between two cells are walls or passages. A perfect maze (one way
+between two cells) is a spanning tree of the cells :
+- backtracker : depth-first search, long corridors.
+- wilson : loop-erased random walks, uniform spanning tree.
+- kruskal : random passages joined with a union-find. With NumPy, the
+same tree is computed with Boruvka's algorithm, all the components at
+once.
+
+The weights of the passages of kruskal come from a hash of the seed and
+of the passage (see passage_key), computed the same way with and without
+NumPy : a seed gives the same maze on every computer.
+
+Only kruskal with NumPy generates a 4096x4096 labyrinth in a few seconds
+(about 6 s), backtracker takes about 13 s, wilson about 36 s and kruskal
+without NumPy about 35 s.
+
+Fire is only put on dead ends and the arrival on the dead end nearest to
+the bottom right corner, so a generated labyrinth can always be won.
+
+Generate a level from the root of the project :
+
+    python -m backend.generator 31 31 --algorithm wilson --seed 3
+
+### REQUIREMENTS
+> NumPy (optional, fast kruskal)
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Maze generation : https://en.wikipedia.org/wiki/Maze_generation_algorithm
+Boruvka's algorithm : https://en.wikipedia.org/wiki/Bor%C5%AFvka%27s_algorithm
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# pylint: disable=too-many-locals
+
+# LIBRARY IMPORTS
+import argparse
+from random import Random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# PROGRAM IMPORTS
+from backend.autotiler import autotile
+from backend.autotiler import neighbour_counts
+from backend.autotiler import NEIGHBOURS_4
+from backend.grid import Grid
+from backend.grid import PATH
+from backend.grid import FIRE
+from backend.grid import PLAYER
+from backend.grid import ARRIVAL
+from backend.grid import LEVEL_ITEMS
+from backend.level_format import write_level
+
+ALGORITHMS = ('backtracker', 'wilson', 'kruskal')
+
+# Passage flag to tile
+PASSAGE_TILES = b'xc' + bytes(254)
+
+# Weight 1 for each of the 4 neighbours
+ONE_BY_NEIGHBOUR = tuple(
+    (1, offset) for _, offset in NEIGHBOURS_4
+)
+
+# Tile to 1 for paths, 0 for other tiles
+PATH_FLAGS = bytes(tile == PATH for tile in range(256))
+
+# SplitMix64 constants (see passage_key)
+MASK_64 = 2 ** 64 - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MIX_1 = 0xBF58476D1CE4E5B9
+MIX_2 = 0x94D049BB133111EB
+
+
+def passage_key(key, passage):
+    """ Weight of a passage of kruskal
+
+    SplitMix64 of the passage : the same 64 bits integers as
+    passage_keys_numpy.
+
+    Args:
+        key(int): 64 bits key of the maze.
+        passage(int): Passage number (see carve_kruskal).
+
+    Return:
+        int: Weight of the passage, distinct for each passage.
+
+    """
+
+    mixed = (key + GOLDEN_GAMMA * (passage + 1)) & MASK_64
+    mixed = ((mixed ^ (mixed >> 30)) * MIX_1) & MASK_64
+    mixed = ((mixed ^ (mixed >> 27)) * MIX_2) & MASK_64
+
+    return mixed ^ (mixed >> 31)
+
+
+def passage_keys_numpy(key, passages_number):
+    """ Weights of all the passages of kruskal, with NumPy
+
+    Args:
+        key(int): 64 bits key of the maze.
+        passages_number(int): Number of passages.
+
+    Return:
+        ndarray: passage_key of each passage.
+
+    """
+
+    # The unsigned operations of NumPy wrap around like the masks of
+    # passage_key
+    mixed = numpy.arange(1, passages_number + 1, dtype=numpy.uint64)
+    mixed *= numpy.uint64(GOLDEN_GAMMA)
+    mixed += numpy.uint64(key)
+    mixed ^= mixed >> numpy.uint64(30)
+    mixed *= numpy.uint64(MIX_1)
+    mixed ^= mixed >> numpy.uint64(27)
+    mixed *= numpy.uint64(MIX_2)
+    mixed ^= mixed >> numpy.uint64(31)
+
+    return mixed
+
+
+def carve_backtracker(cells_width, cells_height, random):
+    """ Recursive backtracker, with a stack
+
+    Args:
+        cells_width(int): Number of cells per line.
+        cells_height(int): Number of cells per column.
+        random(Random): Random generator.
+
+    Return:
+        tuple: (east, south) bytearrays, 1 if a cell has a passage to the
+        next cell on the east / on the south.
+
+    """
+
+    cells_number = cells_width * cells_height
+    east = bytearray(cells_number)
+    south = bytearray(cells_number)
+    visited = bytearray(cells_number)
+
+    start = random.randrange(cells_number)
+    visited[start] = 1
+    stack = [start]
+
+    while stack:
+
+        cell = stack[-1]
+        column_number = cell % cells_width
+        neighbours = []
+
+        if column_number + 1 < cells_width and not visited[cell + 1]:
+            neighbours.append(cell + 1)
+        if column_number and not visited[cell - 1]:
+            neighbours.append(cell - 1)
+        if (cell + cells_width < cells_number
+                and not visited[cell + cells_width]):
+            neighbours.append(cell + cells_width)
+        if cell >= cells_width and not visited[cell - cells_width]:
+            neighbours.append(cell - cells_width)
+
+        if not neighbours:
+            stack.pop()
+            continue
+
+        neighbour = random.choice(neighbours)
+        visited[neighbour] = 1
+        stack.append(neighbour)
+
+        open_passage(east, south, cells_width, cell, neighbour)
+
+    return east, south
+
+
+def carve_wilson(cells_width, cells_height, random):
+    """ Wilson's algorithm
+
+    Args:
+        cells_width(int): Number of cells per line.
+        cells_height(int): Number of cells per column.
+        random(Random): Random generator.
+
+    Return:
+        tuple: (east, south) bytearrays (see carve_backtracker).
+
+    """
+
+    cells_number = cells_width * cells_height
+    east = bytearray(cells_number)
+    south = bytearray(cells_number)
+    in_tree = bytearray(cells_number)
+
+    # Last cell left from each cell by the current walk
+    exits = [0] * cells_number
+
+    in_tree[random.randrange(cells_number)] = 1
+
+    for walk_start in range(cells_number):
+
+        # Random walk until the tree, a loop is erased when the walk
+        # leaves a cell again
+        cell = walk_start
+
+        while not in_tree[cell]:
+
+            column_number = cell % cells_width
+            neighbours = []
+
+            if column_number + 1 < cells_width:
+                neighbours.append(cell + 1)
+            if column_number:
+                neighbours.append(cell - 1)
+            if cell + cells_width < cells_number:
+                neighbours.append(cell + cells_width)
+            if cell >= cells_width:
+                neighbours.append(cell - cells_width)
+
+            exits[cell] = random.choice(neighbours)
+            cell = exits[cell]
+
+        # Add the loop-erased walk to the tree
+        cell = walk_start
+
+        while not in_tree[cell]:
+            in_tree[cell] = 1
+            open_passage(east, south, cells_width, cell, exits[cell])
+            cell = exits[cell]
+
+    return east, south
+
+
+def carve_kruskal(cells_width, cells_height, random):
+    """ Kruskal's algorithm, with a union-find
+
+    The passages are numbered : first the passages to the east, then the
+    passages to the south, each in the order of the cells. They are joined
+    by weight (see passage_key).
+
+    Args:
+        cells_width(int): Number of cells per line.
+        cells_height(int): Number of cells per column.
+        random(Random): Random generator.
+
+    Return:
+        tuple: (east, south) bytearrays (see carve_backtracker).
+
+    """
+
+    cells_number = cells_width * cells_height
+    east = bytearray(cells_number)
+    south = bytearray(cells_number)
+
+    east_cells = [
+        cell for cell in range(cells_number)
+        if cell % cells_width + 1 < cells_width
+    ]
+    east_number = len(east_cells)
+    passages_number = east_number + cells_number - cells_width
+
+    key = random.getrandbits(64)
+    passages = sorted(
+        range(passages_number),
+        key=lambda passage: passage_key(key, passage)
+    )
+
+    parents = list(range(cells_number))
+
+    for passage in passages:
+
+        if passage < east_number:
+            cell = east_cells[passage]
+            neighbour = cell + 1
+        else:
+            cell = passage - east_number
+            neighbour = cell + cells_width
+
+        # Roots of the 2 cells, with path halving
+        root = cell
+        while parents[root] != root:
+            parents[root] = parents[parents[root]]
+            root = parents[root]
+
+        neighbour_root = neighbour
+        while parents[neighbour_root] != neighbour_root:
+            parents[neighbour_root] = parents[parents[neighbour_root]]
+            neighbour_root = parents[neighbour_root]
+
+        if root != neighbour_root:
+            parents[root] = neighbour_root
+
+            if passage < east_number:
+                east[cell] = 1
+            else:
+                south[cell] = 1
+
+    return east, south
+
+
+def carve_kruskal_numpy(cells_width, cells_height, random):
+    """ Kruskal's maze with Boruvka's algorithm and NumPy
+
+    The passages get distinct weights, their rank in the order of
+    carve_kruskal : the tree of Kruskal is the minimum spanning tree,
+    Boruvka's algorithm finds the same tree in a few rounds where each
+    component takes its lightest passage to another component.
+
+    Args:
+        cells_width(int): Number of cells per line.
+        cells_height(int): Number of cells per column.
+        random(Random): Random generator.
+
+    Return:
+        tuple: (east, south) bytearrays (see carve_backtracker).
+
+    """
+
+    cells_number = cells_width * cells_height
+
+    # Indexes on 32 bits when possible, half of the memory to read
+    if 2 * cells_number < 2 ** 31:
+        index_type = numpy.int32
+    else:
+        index_type = numpy.int64
+
+    cells = numpy.arange(cells_number, dtype=index_type).reshape(
+        cells_height, cells_width
+    )
+
+    east_cells = cells[:, :-1].ravel()
+    south_cells = cells[:-1, :].ravel()
+
+    # Passages in the numbers of carve_kruskal
+    first_cells = numpy.concatenate((east_cells, south_cells))
+    second_cells = numpy.concatenate(
+        (east_cells + 1, south_cells + cells_width)
+    )
+
+    # Distinct weights, the passages stay in the order of the cells so the
+    # arrays are read in order. The keys are distinct (SplitMix64 is a
+    # bijection), any sort gives the order of carve_kruskal.
+    passages_number = len(first_cells)
+    order = numpy.argsort(
+        passage_keys_numpy(random.getrandbits(64), passages_number)
+    ).astype(index_type)
+    weights = numpy.empty(passages_number, dtype=index_type)
+    weights[order] = numpy.arange(passages_number, dtype=index_type)
+
+    chosen = numpy.zeros(passages_number, dtype=bool)
+
+    # Passages between two components, and the components of their cells
+    passages = numpy.arange(passages_number, dtype=index_type)
+    first_components = first_cells
+    second_components = second_cells
+
+    # Root of each component, only up to date for the last roots
+    parents = numpy.arange(cells_number, dtype=index_type)
+
+    # Weight of the lightest passage of each component
+    lightest = numpy.full(cells_number, passages_number, dtype=index_type)
+
+    # Position of each passage in the passages between two components
+    positions = numpy.zeros(passages_number, dtype=index_type)
+
+    while True:
+
+        between = first_components != second_components
+        passages = passages[between]
+
+        if not passages.size:
+            break
+
+        first_components = first_components[between]
+        second_components = second_components[between]
+        passages_weights = weights[passages]
+
+        numpy.minimum.at(lightest, first_components, passages_weights)
+        numpy.minimum.at(lightest, second_components, passages_weights)
+
+        roots = numpy.flatnonzero(lightest < passages_number)
+        passages_chosen = order[lightest[roots]]
+        lightest[roots] = passages_number
+        chosen[passages_chosen] = True
+
+        positions[passages] = numpy.arange(passages.size, dtype=index_type)
+        chosen_positions = positions[passages_chosen]
+
+        others = numpy.where(
+            first_components[chosen_positions] == roots,
+            second_components[chosen_positions],
+            first_components[chosen_positions]
+        )
+
+        # Join each component to the other end of its passage, two
+        # components which chose the same passage keep the smaller root
+        parents[roots] = others
+
+        mutual = (parents[others] == roots) & (roots < others)
+        parents[roots[mutual]] = roots[mutual]
+
+        while True:
+            grand_parents = parents[parents[roots]]
+            if numpy.array_equal(grand_parents, parents[roots]):
+                break
+            parents[roots] = grand_parents
+
+        first_components = parents[first_components]
+        second_components = parents[second_components]
+
+    passages_chosen = numpy.flatnonzero(chosen)
+    east_number = len(east_cells)
+
+    east = numpy.zeros(cells_number, dtype=numpy.uint8)
+    south = numpy.zeros(cells_number, dtype=numpy.uint8)
+
+    east[east_cells[passages_chosen[passages_chosen < east_number]]] = 1
+    south[south_cells[
+        passages_chosen[passages_chosen >= east_number] - east_number
+    ]] = 1
+
+    return bytearray(east.tobytes()), bytearray(south.tobytes())
+
+
+def open_passage(east, south, cells_width, cell, neighbour):
+    """ Open the passage between two neighbour cells
+
+    Args:
+        east(bytearray): Passages to the east.
+        south(bytearray): Passages to the south.
+        cells_width(int): Number of cells per line.
+        cell(int): First cell.
+        neighbour(int): Second cell.
+
+    """
+
+    first_cell = min(cell, neighbour)
+
+    if cell // cells_width == neighbour // cells_width:
+        east[first_cell] = 1
+    else:
+        south[first_cell] = 1
+
+
+def passages_to_grid(width, height, cells_width, east, south):
+    """ Grid of a maze
+
+    Args:
+        width(int): Number of columns of the grid.
+        height(int): Number of lines of the grid.
+        cells_width(int): Number of cells per line.
+        east(bytearray): Passages to the east.
+        south(bytearray): Passages to the south.
+
+    Return:
+        Grid instance, paths and 'x' walls.
+
+    """
+
+    cells = bytearray(b'x') * (width * height)
+    cells_height = len(east) // cells_width
+    line_length = 2 * cells_width - 1
+
+    for cell_line in range(cells_height):
+
+        cell_start = cell_line * cells_width
+        tile_start = 2 * cell_line * width
+
+        cells[tile_start:tile_start + line_length:2] = (
+            bytes((PATH,)) * cells_width
+        )
+        cells[tile_start + 1:tile_start + line_length:2] = east[
+            cell_start:cell_start + cells_width - 1
+        ].translate(PASSAGE_TILES)
+
+        if cell_line + 1 < cells_height:
+            tile_start += width
+            cells[tile_start:tile_start + line_length:2] = south[
+                cell_start:cell_start + cells_width
+            ].translate(PASSAGE_TILES)
+
+    return Grid(width=width, height=height, cells=cells)
+
+
+def dead_ends(grid):
+    """ Return the Grid indexes of the paths with one path neighbour """
+
+    counts = neighbour_counts(grid, PATH_FLAGS, neighbours=ONE_BY_NEIGHBOUR)
+    size = len(counts)
+
+    # Paths with one neighbour become 17
+    codes = (
+        int.from_bytes(counts, 'big')
+        + (int.from_bytes(bytes(grid.cells).translate(PATH_FLAGS), 'big') << 4)
+    ).to_bytes(size, 'big')
+
+    indexes = []
+    index = codes.find(17)
+
+    while index != -1:
+        indexes.append(index)
+        index = codes.find(17, index + 1)
+
+    return indexes
+
+
+def generate(width, height, algorithm='kruskal', seed=None, fire_ratio=0.1):
+    """ Generate a labyrinth
+
+    Args:
+        width(int): Number of columns, the last column is a wall if even.
+        height(int): Number of lines, the last line is a wall if even.
+        algorithm(str): 'backtracker', 'wilson' or 'kruskal'.
+        seed(int): Seed of the maze, a new maze if None. The maze of a
+        seed does not depend on NumPy.
+        fire_ratio(float): Part of the dead ends with fire.
+
+    Return:
+        Grid instance.
+
+    """
+
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            "Unknown algorithm {}, use one of {}".format(
+                algorithm, ', '.join(ALGORITHMS)
+            )
+        )
+
+    cells_width = (width + 1) // 2
+    cells_height = (height + 1) // 2
+
+    if cells_width * cells_height < 2:
+        raise ValueError(
+            "A labyrinth of {}x{} is too small".format(width, height)
+        )
+
+    random = Random(seed)
+
+    if algorithm == 'kruskal' and numpy is not None:
+        east, south = carve_kruskal_numpy(cells_width, cells_height, random)
+    else:
+        carve = globals()['carve_' + algorithm]
+        east, south = carve(cells_width, cells_height, random)
+
+    grid = passages_to_grid(width, height, cells_width, east, south)
+
+    ends = [index for index in dead_ends(grid) if index]
+
+    # Arrival on the dead end nearest to the bottom right corner, the
+    # dead ends are searched from the last line
+    arrival = None
+    arrival_distance = -1
+
+    for index in reversed(ends):
+
+        line_number, column_number = divmod(index, width)
+
+        if line_number + width - 1 <= arrival_distance:
+            break
+
+        if line_number + column_number > arrival_distance:
+            arrival = index
+            arrival_distance = line_number + column_number
+
+    ends.remove(arrival)
+
+    grid.cells[arrival] = ARRIVAL
+    grid.cells[0] = PLAYER
+
+    for index in random.sample(ends, int(len(ends) * fire_ratio)):
+        grid.cells[index] = FIRE
+
+    autotile(grid)
+
+    return grid
+
+
+def main():
+    """ Print a generated labyrinth, or write it in a level file """
+
+    parser = argparse.ArgumentParser(
+        description="Generate a labyrinth level"
+    )
+    parser.add_argument("width", type=int)
+    parser.add_argument("height", type=int)
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default='kruskal')
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--fire-ratio", type=float, default=0.1)
+    parser.add_argument(
+        "--output", help="Level file (.txt or .lab), printed if None"
+    )
+
+    args = parser.parse_args()
+
+    grid = generate(
+        width=args.width,
+        height=args.height,
+        algorithm=args.algorithm,
+        seed=args.seed,
+        fire_ratio=args.fire_ratio
+    )
+
+    if args.output is None:
+        print(grid.to_text())
+        return
+
+    # Binary level file (see backend.level_format)
+    if args.output.endswith('.lab'):
+        write_level(args.output, grid, LEVEL_ITEMS)
+        return
+
+    with open(args.output, "w") as level_file:
+        level_file.write(grid.to_text() + '\n')
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+""" Grid
+
+This module stores labyrinths : a Grid has one byte per tile (the
+character of the tile in the level file) in a flat bytearray, the tile of
+(line, column) is at the index line * width + column. It does not import
+the other modules of the program, they all import it.
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python bytearray : https://docs.python.org/3.6/library/stdtypes.html#bytearray
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# TILES
+PATH = ord('c')
+FIRE = ord('f')
+PLAYER = ord('P')
+ARRIVAL = ord('A')
+LIFE = ord('l')
+ARMOR = ord('a')
+KEY = ord('k')
+SWORD = ord('s')
+WALLS = b'x0123456789'
+ITEMS = b'laks'
+
+# Items counted for the win, name to tile of the level files
+LEVEL_ITEMS = {
+    'armor': 'a',
+    'key': 'k',
+    'sword': 's'
+}
+
+
+class Grid():
+    """ Grid
+
+    Compact labyrinth : a flat bytearray of tiles with a width and a height.
+
+    """
+
+    def __init__(self, width, height, cells=None):
+        """ Grid initialization
+
+        Args:
+            width(int): Number of columns.
+            height(int): Number of lines.
+            cells(bytearray): width * height tiles, walls if None. A Grid
+            of bytes (or of a read-only memory map) is read-only.
+
+        Attributes:
+            lines(GridLines): List of lists view of the grid.
+
+        """
+
+        # Args
+        self.width = width
+        self.height = height
+
+        if cells is None:
+            cells = bytearray(WALLS[:1] * (width * height))
+
+        if len(cells) != width * height:
+            raise ValueError(
+                "Grid of {}x{} needs {} tiles, not {}".format(
+                    width, height, width * height, len(cells)
+                )
+            )
+
+        self.cells = cells
+
+        # Attributes
+        self.lines = GridLines(self)
+
+    @classmethod
+    def from_text(cls, labyrinth_txt):
+        """ Grid from text
+
+        Args:
+            labyrinth_txt(str): One line of tiles per labyrinth line.
+
+        Return:
+            Grid instance.
+
+        """
+
+        lines = [line for line in labyrinth_txt.split('\n') if line]
+
+        width = len(lines[0])
+
+        for line in lines:
+
+            if len(line) != width:
+                raise ValueError(
+                    "Labyrinth lines must have {} tiles : {}".format(
+                        width, line
+                    )
+                )
+
+        return cls(
+            width=width,
+            height=len(lines),
+            cells=bytearray(''.join(lines).encode('ascii'))
+        )
+
+    def to_text(self):
+        """ Grid to text
+
+        Return:
+            str: One line of tiles per labyrinth line.
+
+        """
+
+        return '\n'.join(
+            bytes(self.row(line_number)).decode('ascii')
+            for line_number in range(self.height)
+        )
+
+    def get(self, line_number, column_number):
+        """ Get the tile of a position
+
+        A method call and an index computation : slower than a list of
+        lists on small grids, the hot loops read cells with a known index
+        (see Engine.apply_move).
+
+        Args:
+            line_number(int): Line of the tile.
+            column_number(int): Column of the tile.
+
+        Return:
+            int: Tile (byte of the tile character).
+
+        """
+
+        return self.cells[line_number * self.width + column_number]
+
+    def set(self, line_number, column_number, tile):
+        """ Set the tile of a position
+
+        Args:
+            line_number(int): Line of the tile.
+            column_number(int): Column of the tile.
+            tile(int): Tile (byte of the tile character).
+
+        """
+
+        self.cells[line_number * self.width + column_number] = tile
+
+    def row(self, line_number):
+        """ Row view
+
+        Args:
+            line_number(int): Line of the labyrinth.
+
+        Return:
+            memoryview: Tiles of the line, without copy.
+
+        """
+
+        start = line_number * self.width
+
+        return memoryview(self.cells)[start:start + self.width]
+
+    def find_all(self, tiles):
+        """ Find all the positions of some tiles
+
+        Args:
+            tiles(bytes): Tiles to find, for example b'f' or ITEMS.
+
+        Return:
+            list: Flat indexes of the tiles, in order.
+
+        """
+
+        cells = self.cells
+        indexes = []
+
+        for tile in tiles:
+
+            # Bytes of one tile, memory maps do not find integers
+            tile = bytes((tile,))
+            index = cells.find(tile)
+
+            while index != -1:
+                indexes.append(index)
+                index = cells.find(tile, index + 1)
+
+        if len(tiles) > 1:
+            indexes.sort()
+
+        return indexes
+
+    def positions(self, indexes):
+        """ Positions of flat indexes
+
+        Args:
+            indexes(list): Flat indexes.
+
+        Return:
+            list: (line, column) of the indexes.
+
+        """
+
+        return [divmod(index, self.width) for index in indexes]
+
+    def fire_cells(self):
+        """ Return the (line, column) of all fire tiles """
+
+        return self.positions(self.find_all(b'f'))
+
+    def path_cells(self):
+        """ Return the (line, column) of all free path tiles """
+
+        return self.positions(self.find_all(b'c'))
+
+    def copy(self):
+        """ Return a copy of the grid """
+
+        return Grid(
+            width=self.width,
+            height=self.height,
+            cells=bytearray(self.cells)
+        )
+
+
+class GridLines():
+    """ Grid lines
+
+    Compatibility view of a Grid as a list of lists of one character
+    strings : grid.lines[line][column] reads and writes the grid.
+
+    """
+
+    def __init__(self, grid):
+        """ Grid lines initialization
+
+        Args:
+            grid(instance): Grid instance.
+
+        """
+
+        self.grid = grid
+
+    def __len__(self):
+        return self.grid.height
+
+    def __getitem__(self, line_number):
+
+        if not 0 <= line_number < self.grid.height:
+            raise IndexError(line_number)
+
+        return GridLine(self.grid, line_number)
+
+    def __iter__(self):
+
+        for line_number in range(self.grid.height):
+            yield GridLine(self.grid, line_number)
+
+
+class GridLine():
+    """ Grid line
+
+    One line of a GridLines view.
+
+    """
+
+    def __init__(self, grid, line_number):
+        """ Grid line initialization
+
+        Args:
+            grid(instance): Grid instance.
+            line_number(int): Line of the grid.
+
+        """
+
+        self.grid = grid
+        self.start = line_number * grid.width
+
+    def __len__(self):
+        return self.grid.width
+
+    def __getitem__(self, column_number):
+
+        if not 0 <= column_number < self.grid.width:
+            raise IndexError(column_number)
+
+        return chr(self.grid.cells[self.start + column_number])
+
+    def __setitem__(self, column_number, tile):
+
+        if not 0 <= column_number < self.grid.width:
+            raise IndexError(column_number)
+
+        self.grid.cells[self.start + column_number] = ord(tile)
+
+    def __iter__(self):
+
+        for tile in self.grid.row(self.start // self.grid.width):
+            yield chr(tile)
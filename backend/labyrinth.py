@@ -2,7 +2,7 @@
 """ Labyrinth
 
 This module transform a string who represent labyrinth into
-a list of lists for manipulations.
+a Grid (see backend.grid) for manipulations.
 
 ### REQUIREMENTS
 > random of Python 3.6
@@ -12,13 +12,32 @@ a list of lists for manipulations.
 Python Random : https://docs.python.org/3.6/library/random.html
 
 ### MODIFICATIONS
-Last modification date : 02/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
 
 # LIBRARY IMPORTS
-from random import randrange
+import os
+import zlib
+from mmap import ACCESS_COPY
+from random import Random
+
+# PROGRAM IMPORTS
+from backend.autotiler import autotile
+from backend.generator import generate
+from backend.grid import Grid
+from backend.grid import PATH
+from backend.grid import ARRIVAL
+from backend.grid import LEVEL_ITEMS
+from backend.level_format import open_level
+from backend.solver import Solver
+from settings import LEVEL_CACHE_REVALIDATE
+
+# Directory of the level files
+LABYRINTHS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'labyrinths'
+)
 
 
 class Labyrinth():
@@ -28,11 +47,7 @@ class Labyrinth():
 
     """
 
-    items = {
-        'armor': 'a',
-        'key': 'k',
-        'sword': 's'
-    }
+    items = LEVEL_ITEMS
 
     levels = [
         {
@@ -48,20 +63,62 @@ class Labyrinth():
                 'key': 'k',
                 'sword': 's'
             }
+        },
+        {
+            'items':{
+                'armor': 'a',
+                'key': 'k',
+                'sword': 's'
+            },
+            # Wilson (pure Python) : the same maze with or without NumPy,
+            # fast enough at this size (see backend.generator)
+            'generator': {
+                'width': 31,
+                'height': 31,
+                'algorithm': 'wilson',
+                'seed': 3
+            }
         }
     ]
 
-    def __init__(self, level):
+    # Parsed levels by path of the level file (see get_level)
+    level_cache = {}
+
+    # Path of the file of each level (see get_labyrinth_path)
+    level_paths = {}
+
+    def __init__(self, level, seed=None):
         """ Labyrinth initialization
 
         Args:
             level(int): Labyrinth level.
+            seed(int): Seed of the placement of the items, a new placement
+            for each labyrinth if None.
+
+        Attributes:
+            level(int): Labyrinth level.
+            random(Random): Random generator of the placement of the items.
+            grid(Grid): Labyrinth with items.
+            labyrinth(GridLines): List of lists view of the grid.
+            points(dict): Grid index of the start, of each item and of the
+            arrival.
+            solver(Solver): Solver of the grid, built on demand.
+            distance_table(dict): Distances between the points, built on
+            demand (see get_distance_table).
 
         """
 
-        self.labyrinth = self.get_labyrinth(
+        self.level = level
+        self.random = Random(seed)
+        self.grid = self.get_labyrinth(
             level=level
         )
+        self.labyrinth = self.grid.lines
+        self.points = self.get_points(
+            level=level
+        )
+        self.solver = None
+        self.distance_table = None
 
     def get_labyrinth(self, level):
         """ Level construct
@@ -71,18 +128,232 @@ class Labyrinth():
         Args:
             level(int): Labyrinth level.
 
+        Return:
+            Grid instance.
+
         """
 
-        labyrinth = self.get_labyrinth_list(
+        grid = self.get_labyrinth_grid(
             level=level
         )
 
-        new_labyrinth = self.add_items(
+        new_grid = self.add_items(
             level=level,
-            labyrinth=labyrinth
+            grid=grid
         )
 
-        return new_labyrinth
+        return new_grid
+
+    @classmethod
+    def add_level(cls, path=None, generator=None):
+        """ Add a level
+
+        A level of a level file (txt or binary) or of a generator, with the
+        default items (tools, simulations). The playable levels are the
+        first LEVELS levels.
+
+        Args:
+            path(str): Path of the level file.
+            generator(dict): Arguments of generate (see backend.generator).
+
+        Return:
+            int: The new level.
+
+        """
+
+        new_level = {
+            'items': dict(LEVEL_ITEMS)
+        }
+
+        if generator is not None:
+            new_level['generator'] = generator
+
+        cls.levels.append(new_level)
+        level = len(cls.levels)
+
+        if path is not None:
+            cls.level_paths[level] = path
+
+        return level
+
+    @classmethod
+    def get_labyrinth_path(cls, level):
+        """ Return the path of the file of a level
+
+        The binary level file (.lab, see backend.level_format) is used if
+        there is one, the txt level file otherwise.
+
+        """
+
+        labyrinth_path = cls.level_paths.get(level)
+
+        if labyrinth_path is None:
+
+            labyrinth_path = os.path.join(
+                LABYRINTHS_DIRECTORY, "level-{}.lab".format(level)
+            )
+
+            if not os.path.exists(labyrinth_path):
+                labyrinth_path = os.path.join(
+                    LABYRINTHS_DIRECTORY, "level-{}.txt".format(level)
+                )
+
+            cls.level_paths[level] = labyrinth_path
+
+        return labyrinth_path
+
+    @classmethod
+    def get_level(cls, level):
+        """ Get a parsed level
+
+        A txt level file is read, parsed and autotiled (the 'x' walls get
+        the glyph of their neighbours) once per process, the new games copy
+        its grid. A binary level file is opened once with a read-only memory
+        map, the new games get a copy-on-write memory map of the file. With
+        LEVEL_CACHE_REVALIDATE, a level file modified since it was opened
+        is opened again. The levels with a 'generator' are generated once
+        per process instead (see backend.generator).
+
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            dict: 'mtime' of the file, immutable 'grid' (Grid of bytes or
+            of a read-only memory map), 'items' (name to tile),
+            'level_file' (opened binary level file or None),
+            'free_cells' (see get_free_cells), 'checksum' (see
+            get_level_checksum) and 'trees' (see get_level_trees), None
+            until needed.
+
+        """
+
+        level_generator = cls.levels[int(level - 1)].get('generator')
+
+        if level_generator is not None:
+            return cls.get_generated_level(
+                level=level,
+                level_generator=level_generator
+            )
+
+        labyrinth_path = cls.get_labyrinth_path(
+            level=level
+        )
+
+        cached_level = cls.level_cache.get(labyrinth_path)
+
+        if cached_level is not None and not LEVEL_CACHE_REVALIDATE:
+            return cached_level
+
+        mtime = os.stat(labyrinth_path).st_mtime_ns
+
+        if cached_level is not None and cached_level['mtime'] == mtime:
+            return cached_level
+
+        if labyrinth_path.endswith('.lab'):
+
+            # The file stays open for the copy-on-write maps of the games
+            laby_file = open(labyrinth_path, "rb")
+            grid, items = open_level(laby_file)
+
+        else:
+
+            with open(labyrinth_path, "r") as text_file:
+                labyrinth_txt = text_file.read()
+
+            grid = Grid.from_text(labyrinth_txt)
+            autotile(grid)
+
+            grid = Grid(
+                width=grid.width,
+                height=grid.height,
+                cells=bytes(grid.cells)
+            )
+            items = cls.levels[int(level - 1)]['items']
+            laby_file = None
+
+        if cached_level is not None and cached_level['level_file']:
+            cached_level['level_file'].close()
+
+        cached_level = {
+            'mtime': mtime,
+            'grid': grid,
+            'items': items,
+            'level_file': laby_file,
+            'free_cells': None,
+            'checksum': None,
+            'trees': None
+        }
+
+        cls.level_cache[labyrinth_path] = cached_level
+
+        return cached_level
+
+    @classmethod
+    def get_generated_level(cls, level, level_generator):
+        """ Get a generated level
+
+        Args:
+            level(int): Labyrinth level.
+            level_generator(dict): Arguments of generate.
+
+        Return:
+            dict: Parsed level (see get_level), without 'mtime'.
+
+        """
+
+        level_key = "generator-{}".format(level)
+        cached_level = cls.level_cache.get(level_key)
+
+        if cached_level is None:
+
+            grid = generate(**level_generator)
+
+            cached_level = {
+                'mtime': None,
+                'grid': Grid(
+                    width=grid.width,
+                    height=grid.height,
+                    cells=bytes(grid.cells)
+                ),
+                'items': cls.levels[int(level - 1)]['items'],
+                'level_file': None,
+                'free_cells': None,
+                'checksum': None,
+                'trees': None
+            }
+
+            cls.level_cache[level_key] = cached_level
+
+        return cached_level
+
+    @classmethod
+    def get_labyrinth_grid(cls, level):
+        """ Get labyrinth grid
+
+        Copy of the parsed level (see get_level).
+
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            Grid instance.
+
+        """
+
+        cached_level = cls.get_level(
+            level=level
+        )
+
+        if cached_level['level_file'] is not None:
+
+            grid, _ = open_level(
+                cached_level['level_file'],
+                access=ACCESS_COPY
+            )
+
+            return grid
+
+        return cached_level['grid'].copy()
 
     @classmethod
     def get_labyrinth_list(cls, level):
@@ -98,49 +369,316 @@ class Labyrinth():
 
         """
 
-        new_labyrinth = []
+        grid = cls.get_labyrinth_grid(
+            level=level
+        )
+
+        return [list(line) for line in grid.lines]
+
+    @classmethod
+    def get_free_cells(cls, level):
+        """ Get free cells
+
+        Free path tiles in the component of the start (connected-component
+        labelling), computed once per parsed level.
+
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            list: Grid indexes of the free path tiles reachable from the
+            start.
+
+        """
+
+        cached_level = cls.get_level(
+            level=level
+        )
+
+        if cached_level['free_cells'] is None:
+
+            grid = cached_level['grid']
+            labels = Solver(grid).components()
+            start_label = labels[0]
+
+            cached_level['free_cells'] = [
+                index for index in grid.find_all(bytes((PATH,)))
+                if start_label and labels[index] == start_label
+            ]
+
+        return cached_level['free_cells']
+
+    @classmethod
+    def get_level_checksum(cls, level):
+        """ Get level checksum
+
+        CRC-32 of the size and of the tiles of the parsed level (without
+        items), computed once per parsed level.
+
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            int: Checksum of the level, on 32 bits.
+
+        """
+
+        cached_level = cls.get_level(
+            level=level
+        )
+
+        if cached_level['checksum'] is None:
+
+            grid = cached_level['grid']
+
+            cached_level['checksum'] = zlib.crc32(
+                grid.cells,
+                zlib.crc32(
+                    "{}x{}".format(grid.width, grid.height).encode('ascii')
+                )
+            )
+
+        return cached_level['checksum']
+
+    @classmethod
+    def get_level_trees(cls, level):
+        """ Get level search trees
+
+        Complete search trees from the start and from the arrivals (see
+        Solver.search_tree), computed once per parsed level : the items do
+        not change the kinds of tiles seen by the solver, the solvers of
+        all the games of the level share them.
+
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            dict: Padded index to search tree.
+
+        """
 
-        labyrinth_path = "backend/labyrinths/level-{}.txt".format(
-            level
+        cached_level = cls.get_level(
+            level=level
         )
 
-        with open(labyrinth_path, "r") as laby_file:
-            labyrinth_txt = laby_file.read()
+        if cached_level['trees'] is None:
+
+            solver = Solver(cached_level['grid'])
 
-        for loop_1 in labyrinth_txt.split('\n'):
-            line = []
-            for tile in loop_1:
-                line.append(tile)
-            new_labyrinth.append(line)
+            for point in [solver.to_padded(solver.start)] + solver.arrivals:
+                solver.search_tree(point)
 
-        return new_labyrinth
+            cached_level['trees'] = solver.complete_trees
 
-    def add_items(self, level, labyrinth):
+        return cached_level['trees']
+
+    def add_items(self, level, grid):
         """ Add items
 
+        The items are placed on distinct free cells reachable from the
+        start, so every labyrinth can be won.
+
         Args:
             level(int): Labyrinth level.
-            labyrinth(list): list of lists.
+            grid(Grid): Labyrinth without items.
 
         Return:
-            labyrinth(list): labyrinth with items.
+            grid(Grid): labyrinth with items.
 
         """
 
-        level = level - 1
+        level_items = self.get_level(
+            level=level
+        )['items']
 
-        level_items = self.levels[int(level)]
+        free_cells = self.get_free_cells(
+            level=level
+        )
 
-        for level_item in level_items['items']:
+        if len(free_cells) < len(level_items):
+            raise ValueError(
+                "Level {} has {} free cells for {} items".format(
+                    level, len(free_cells), len(level_items)
+                )
+            )
 
-            line_number = randrange(len(labyrinth))
-            col_number = randrange(len(labyrinth))
+        indexes = self.random.sample(free_cells, len(level_items))
 
-            while labyrinth[line_number][col_number] != 'c':
+        for level_item, index in zip(level_items, indexes):
+            grid.cells[index] = ord(level_items[level_item])
 
-                line_number = randrange(len(labyrinth))
-                col_number = randrange(len(labyrinth))
+        return grid
 
-            labyrinth[line_number][col_number] = self.items[level_item]
+    def get_points(self, level):
+        """ Get points of interest
 
-        return labyrinth
+        Args:
+            level(int): Labyrinth level.
+
+        Return:
+            dict: Grid index of 'start', of each item and of 'arrival'
+            (None if the labyrinth has no arrival).
+
+        """
+
+        points = {'start': 0}
+
+        level_items = self.get_level(
+            level=level
+        )['items']
+
+        for item_name, item_tile in level_items.items():
+
+            item_indexes = self.grid.find_all(
+                item_tile.encode('ascii')
+            )
+
+            points[item_name] = item_indexes[0] if item_indexes else None
+
+        arrivals = self.grid.find_all(bytes((ARRIVAL,)))
+        points['arrival'] = arrivals[0] if arrivals else None
+
+        return points
+
+    def get_solver(self):
+        """ Return the Solver of the grid
+
+        Picking up or moving items does not change the kinds of tiles seen
+        by the solver, it is built once, with the search trees of the level
+        (see get_level_trees).
+
+        """
+
+        if self.solver is None:
+
+            self.solver = Solver(
+                self.grid,
+                trees=self.get_level_trees(level=self.level)
+            )
+
+        return self.solver
+
+    def get_distance_table(self):
+        """ Get the distance table
+
+        Distances between the points of interest, computed once (see
+        Solver.points_distances) then kept up to date by move_item.
+
+        Return:
+            dict: table[name][other_name] is the number of moves between
+            two points, None if unreachable.
+
+        """
+
+        if self.distance_table is None:
+
+            solver = self.get_solver()
+            names = [name for name, index in self.points.items()
+                     if index is not None]
+
+            distances = solver.points_distances(
+                [solver.to_padded(self.points[name]) for name in names]
+            )
+
+            self.distance_table = {
+                name: dict(zip(names, distances[number]))
+                for number, name in enumerate(names)
+            }
+
+        return self.distance_table
+
+    def move_item(self, item_name, line_number, column_number):
+        """ Move an item on a free path tile
+
+        Only the distances of the moved item are computed again.
+
+        Args:
+            item_name(str): 'armor', 'key' or 'sword'.
+            line_number(int): Destination line.
+            column_number(int): Destination column.
+
+        """
+
+        grid = self.grid
+        old_index = self.points[item_name]
+        new_index = line_number * grid.width + column_number
+
+        if grid.cells[new_index] != PATH:
+            raise ValueError(
+                "{} can not move on the tile {}".format(
+                    item_name, chr(grid.cells[new_index])
+                )
+            )
+
+        grid.cells[new_index] = grid.cells[old_index]
+        grid.cells[old_index] = PATH
+        self.points[item_name] = new_index
+
+        # The solver picks up the item on its new tile
+        if self.solver is not None:
+            self.solver.items = [
+                self.solver.to_padded(new_index) if item == (
+                    self.solver.to_padded(old_index)
+                ) else item
+                for item in self.solver.items
+            ]
+
+        if self.distance_table is None:
+            return
+
+        solver = self.get_solver()
+        table = self.distance_table
+
+        # The search tree of the old tile is not used again
+        solver.trees.pop(solver.to_padded(old_index), None)
+
+        others = {
+            solver.to_padded(self.points[name]): name for name in table
+            if name != item_name
+        }
+
+        found = solver.target_distances(
+            solver.to_padded(new_index), list(others)
+        )
+
+        table[item_name][item_name] = 0
+
+        for padded_index, name in others.items():
+            distance = found.get(padded_index)
+            table[item_name][name] = distance
+            table[name][item_name] = distance
+
+    def solve(self):
+        """ Solve
+
+        Shortest route which picks up the items then reaches the arrival,
+        from the distance table (see Solver.solve).
+
+        Return:
+            tuple: (cost, movement names), None if the player can not win.
+
+        """
+
+        solver = self.get_solver()
+        table = self.get_distance_table()
+
+        names = {
+            solver.to_padded(index): name
+            for name, index in self.points.items() if index is not None
+        }
+        points = [solver.to_padded(solver.start)] + (
+            solver.items + solver.arrivals
+        )
+
+        # Several tiles of an item or several arrivals : not in the table
+        if not all(point in names for point in points):
+            return solver.solve()
+
+        points_names = [names[point] for point in points]
+
+        return solver.solve(
+            distances=[
+                [table[name][other_name] for other_name in points_names]
+                for name in points_names
+            ]
+        )
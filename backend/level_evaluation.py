@@ -0,0 +1,483 @@
+# -*- coding: utf-8 -*-
+""" Level evaluation
+
+This module evaluates levels with many random placements of the items
+(Labyrinth.add_items), on all the cores of the computer. A level is a
+level of the game, a level file (txt or binary) or generator arguments.
+For each placement :
+- the solver gives the par : the number of moves of the shortest winning
+route, without walking on fire. The placement is solvable if the route
+exists.
+- random players play games with the engine : wins, defeats on fire,
+defeats on the arrival and unfinished games.
+
+Each placement is a line of the output file (CSV or JSON lines, by the
+extension of the file), written as soon as its batch is evaluated. The
+statistics of each level are printed at the end. Only the headless game
+logic is used, Pygame is not imported. Launch from the root of the
+project :
+
+    python -m backend.level_evaluation 1 2 3 --output evaluation.csv
+    python -m backend.level_evaluation level.txt --output evaluation.csv
+    python -m backend.level_evaluation --generate 101 101 \
+        --algorithm kruskal --generator-seed 7 --output evaluation.csv
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python concurrent.futures :
+https://docs.python.org/3.6/library/concurrent.futures.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from random import Random
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import MOVEMENTS
+from backend.engine import FIRE_DEFEAT_EVENTS
+from backend.engine import WIN
+from backend.generator import ALGORITHMS
+from backend.labyrinth import Labyrinth
+
+FIELDS = (
+    'level',
+    'seed',
+    'solvable',
+    'par_moves',
+    'agent_games',
+    'agent_wins',
+    'fire_deaths',
+    'arrival_defeats',
+    'unfinished'
+)
+
+# Placements evaluated by a task of a worker
+BATCH_SIZE = 16
+
+# Level of each source added in this process (see source_level)
+source_levels = {}
+
+
+def source_level(source):
+    """ Level of a source
+
+    The level files and the generator arguments are added to the levels
+    of Labyrinth once per process.
+
+    Args:
+        source(tuple): (name, kind, value) : ('level', level number),
+        ('path', path of the level file) or ('generator', arguments of
+        generate).
+
+    Return:
+        int: Level of the labyrinth.
+
+    """
+
+    name, kind, value = source
+
+    if kind == 'level':
+        return value
+
+    level = source_levels.get(name)
+
+    if level is None:
+
+        if kind == 'path':
+            level = Labyrinth.add_level(path=value)
+        else:
+            level = Labyrinth.add_level(generator=value)
+
+        source_levels[name] = level
+
+    return level
+
+
+def play_random_games(grid, seed, games, max_moves):
+    """ Play games with a random player
+
+    Args:
+        grid(Grid): Labyrinth with items, each game plays on a copy.
+        seed(int): Seed of the moves.
+        games(int): Number of games.
+        max_moves(int): Moves of a game at most.
+
+    Return:
+        dict: Number of wins, fire deaths, arrival defeats and unfinished
+        games.
+
+    """
+
+    random = Random(seed)
+    movement_names = tuple(MOVEMENTS)
+    counts = {
+        'agent_wins': 0,
+        'fire_deaths': 0,
+        'arrival_defeats': 0,
+        'unfinished': 0
+    }
+
+    for _ in range(games):
+
+        engine = Engine(grid=grid.copy())
+
+        for _ in range(max_moves):
+
+            events = engine.apply_move(random.choice(movement_names))
+
+            if engine.result is not None:
+                break
+
+        if engine.result is None:
+            counts['unfinished'] += 1
+        elif engine.result == WIN:
+            counts['agent_wins'] += 1
+        elif events == FIRE_DEFEAT_EVENTS:
+            counts['fire_deaths'] += 1
+        else:
+            counts['arrival_defeats'] += 1
+
+    return counts
+
+
+def evaluate_placement(source, seed, agent_games, max_moves):
+    """ Evaluate a placement of the items
+
+    Args:
+        source(tuple): Level of the labyrinth (see source_level).
+        seed(int): Seed of the placement (see Labyrinth).
+        agent_games(int): Number of games of the random player.
+        max_moves(int): Moves of a game of the random player at most.
+
+    Return:
+        dict: Line of the output (see FIELDS).
+
+    """
+
+    labyrinth = Labyrinth(level=source_level(source), seed=seed)
+    solution = labyrinth.solve()
+
+    placement = {
+        'level': source[0],
+        'seed': seed,
+        'solvable': solution is not None,
+        'par_moves': solution[0] if solution is not None else None,
+        'agent_games': agent_games
+    }
+    placement.update(
+        play_random_games(labyrinth.grid, seed, agent_games, max_moves)
+    )
+
+    return placement
+
+
+def evaluate_placements(source, seeds, agent_games, max_moves):
+    """ Evaluate placements of the items, in a worker
+
+    Args:
+        source(tuple): Level of the labyrinth (see source_level).
+        seeds(range): Seeds of the placements.
+        agent_games(int): Number of games of the random player.
+        max_moves(int): Moves of a game of the random player at most.
+
+    Return:
+        list: Lines of the output.
+
+    """
+
+    return [
+        evaluate_placement(source, seed, agent_games, max_moves)
+        for seed in seeds
+    ]
+
+
+class EvaluationWriter():
+    """ Evaluation writer
+
+    Write the lines of the output file, as CSV or JSON lines.
+
+    """
+
+    def __init__(self, output_file, output_format):
+        """ Evaluation writer initialization
+
+        Args:
+            output_file(file): Output file opened in text mode.
+            output_format(str): 'csv' or 'jsonl'.
+
+        Attributes:
+            csv_writer(instance): Instance of csv.DictWriter, None for
+            JSON lines.
+
+        """
+
+        self.output_file = output_file
+        self.csv_writer = None
+
+        if output_format == 'csv':
+            self.csv_writer = csv.DictWriter(output_file, fieldnames=FIELDS)
+            self.csv_writer.writeheader()
+
+    def write(self, placements):
+        """ Write placements
+
+        Args:
+            placements(list): Lines of the output.
+
+        """
+
+        if self.csv_writer is not None:
+            self.csv_writer.writerows(placements)
+        else:
+            for placement in placements:
+                self.output_file.write(json.dumps(placement) + '\n')
+
+        self.output_file.flush()
+
+
+class LevelStats():
+    """ Level stats
+
+    Statistics of the placements of a level.
+
+    """
+
+    def __init__(self, level):
+        """ Level stats initialization
+
+        Args:
+            level(str): Name of the level (see source_level).
+
+        Attributes:
+            placements(int): Number of evaluated placements.
+            solvable(int): Number of solvable placements.
+            par_moves(list): Par of the solvable placements.
+            agent_games(int): Number of games of the random player.
+            agent_wins(int): Games won by the random player.
+            fire_deaths(int): Games lost on fire by the random player.
+
+        """
+
+        self.level = level
+        self.placements = 0
+        self.solvable = 0
+        self.par_moves = []
+        self.agent_games = 0
+        self.agent_wins = 0
+        self.fire_deaths = 0
+
+    def add(self, placement):
+        """ Add an evaluated placement
+
+        Args:
+            placement(dict): Line of the output.
+
+        """
+
+        self.placements += 1
+        self.agent_games += placement['agent_games']
+        self.agent_wins += placement['agent_wins']
+        self.fire_deaths += placement['fire_deaths']
+
+        if placement['solvable']:
+            self.solvable += 1
+            self.par_moves.append(placement['par_moves'])
+
+    def report(self):
+        """ Report
+
+        Return:
+            str: Statistics of the level.
+
+        """
+
+        lines = [
+            "Level {} : {} placements".format(self.level, self.placements),
+            "  solvable : {:.1%}".format(
+                self.solvable / self.placements
+            )
+        ]
+
+        if self.par_moves:
+
+            par_moves = sorted(self.par_moves)
+            last = len(par_moves) - 1
+
+            lines.append(
+                "  par moves : min {} / 10% {} / median {} / 90% {} / "
+                "max {} / mean {:.1f}".format(
+                    par_moves[0],
+                    par_moves[last // 10],
+                    par_moves[last // 2],
+                    par_moves[last * 9 // 10],
+                    par_moves[last],
+                    sum(par_moves) / len(par_moves)
+                )
+            )
+
+        if self.agent_games:
+
+            lines.append(
+                "  random player : {:.1%} wins, {:.1%} fire deaths".format(
+                    self.agent_wins / self.agent_games,
+                    self.fire_deaths / self.agent_games
+                )
+            )
+
+        return '\n'.join(lines)
+
+
+def evaluate_levels(sources, placements, seed, agent_games, max_moves,
+                    workers, writer):
+    """ Evaluate levels on a pool of processes
+
+    Args:
+        sources(list): Levels of the labyrinth (see source_level).
+        placements(int): Number of placements of each level.
+        seed(int): Seed of the first placement.
+        agent_games(int): Number of games of the random player by
+        placement.
+        max_moves(int): Moves of a game of the random player at most.
+        workers(int): Number of processes.
+        writer(instance): Instance of EvaluationWriter.
+
+    Return:
+        dict: Name of the level to LevelStats.
+
+    """
+
+    levels_stats = {source[0]: LevelStats(source[0]) for source in sources}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        futures = [
+            executor.submit(
+                evaluate_placements,
+                source,
+                range(batch_seed, min(batch_seed + BATCH_SIZE,
+                                      seed + placements)),
+                agent_games,
+                max_moves
+            )
+            for source in sources
+            for batch_seed in range(seed, seed + placements, BATCH_SIZE)
+        ]
+
+        for future in as_completed(futures):
+
+            batch = future.result()
+            writer.write(batch)
+
+            for placement in batch:
+                levels_stats[placement['level']].add(placement)
+
+    return levels_stats
+
+
+def main():
+    """ Evaluate levels """
+
+    parser = argparse.ArgumentParser(
+        description="Evaluate levels with random placements of the items"
+    )
+    parser.add_argument(
+        "levels",
+        nargs='*',
+        help="level numbers of the game or level files (txt or binary)"
+    )
+    parser.add_argument(
+        "--generate",
+        nargs=2,
+        type=int,
+        metavar=("WIDTH", "HEIGHT"),
+        help="evaluate a generated labyrinth too"
+    )
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default='kruskal')
+    parser.add_argument(
+        "--generator-seed",
+        type=int,
+        default=0,
+        help="seed of the generated labyrinth"
+    )
+    parser.add_argument("--placements", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--agent-games", type=int, default=10)
+    parser.add_argument("--max-moves", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument(
+        "--output",
+        default="evaluation.csv",
+        help="CSV file, or JSON lines file if it ends with .jsonl"
+    )
+
+    args = parser.parse_args()
+
+    sources = []
+
+    for level in args.levels:
+
+        if level.isdigit():
+
+            if not 1 <= int(level) <= len(Labyrinth.levels):
+                parser.error("level {} does not exist".format(level))
+
+            sources.append((level, 'level', int(level)))
+
+        elif os.path.isfile(level):
+            sources.append((level, 'path', os.path.abspath(level)))
+
+        else:
+            parser.error("{} is not a level or a level file".format(level))
+
+    if args.generate is not None:
+
+        width, height = args.generate
+
+        sources.append((
+            "{}-{}x{}-{}".format(
+                args.algorithm, width, height, args.generator_seed
+            ),
+            'generator',
+            {
+                'width': width,
+                'height': height,
+                'algorithm': args.algorithm,
+                'seed': args.generator_seed
+            }
+        ))
+
+    if not sources:
+        parser.error("give levels, level files or --generate")
+
+    output_format = 'jsonl' if args.output.endswith('.jsonl') else 'csv'
+
+    with open(args.output, 'w', newline='') as output_file:
+
+        levels_stats = evaluate_levels(
+            sources=sources,
+            placements=args.placements,
+            seed=args.seed,
+            agent_games=args.agent_games,
+            max_moves=args.max_moves,
+            workers=args.workers,
+            writer=EvaluationWriter(output_file, output_format)
+        )
+
+    for source in sources:
+        print(levels_stats[source[0]].report())
+
+
+if __name__ == "__main__":
+
+    main()
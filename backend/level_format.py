@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+""" Level format
+
+This module reads and writes the binary level files (.lab) :
+- a header : magic b'LABY', version, width, height, offset of the cells
+and number of items (little-endian, see HEADER).
+- the item table : for each item, the tile of the item, the length of its
+name and its name (UTF-8).
+- zeros up to the offset of the cells.
+- the cells : one tile per byte, in the alphabet of the txt level files,
+line by line.
+
+The cells start on a page (CELLS_ALIGNMENT) : they are opened with a
+memory map, a level is used without reading it in Python objects. Each
+copy-on-write map of the file is a grid for one game.
+
+Convert a level from the root of the project (a level-N.lab file in
+backend/labyrinths is used instead of level-N.txt) :
+
+    python -m backend.level_format to-binary level-1.txt level-1.lab
+    python -m backend.level_format to-text level-1.lab level-1.txt
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python mmap : https://docs.python.org/3.6/library/mmap.html
+Python struct : https://docs.python.org/3.6/library/struct.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import argparse
+import mmap
+import struct
+
+# PROGRAM IMPORTS
+from backend.autotiler import autotile
+from backend.grid import Grid
+from backend.grid import LEVEL_ITEMS
+
+MAGIC = b'LABY'
+VERSION = 1
+
+# magic, version, width, height, offset of the cells, number of items
+HEADER = struct.Struct('<4sHIIIH')
+ITEM = struct.Struct('<cB')
+
+CELLS_ALIGNMENT = 4096
+
+
+def write_level(path, grid, items):
+    """ Write a binary level file
+
+    Args:
+        path(str): Path of the level file.
+        grid(Grid): Labyrinth without items.
+        items(dict): Name to tile of the items of the level.
+
+    """
+
+    item_table = b''.join(
+        ITEM.pack(tile.encode('ascii'), len(name.encode('utf-8')))
+        + name.encode('utf-8')
+        for name, tile in items.items()
+    )
+
+    header_size = HEADER.size + len(item_table)
+    cells_offset = -(-header_size // CELLS_ALIGNMENT) * CELLS_ALIGNMENT
+
+    with open(path, 'wb') as level_file:
+
+        level_file.write(HEADER.pack(
+            MAGIC, VERSION, grid.width, grid.height, cells_offset, len(items)
+        ))
+        level_file.write(item_table)
+        level_file.write(bytes(cells_offset - header_size))
+        level_file.write(grid.cells)
+
+
+def read_header(level_file):
+    """ Read the header and the item table of a binary level file
+
+    Args:
+        level_file(file): Level file opened in binary mode.
+
+    Return:
+        tuple: (width, height, offset of the cells, items dict).
+
+    """
+
+    data = level_file.read(HEADER.size)
+
+    if len(data) < HEADER.size:
+        raise ValueError("{} is not a level file".format(level_file.name))
+
+    magic, version, width, height, cells_offset, items_number = (
+        HEADER.unpack(data)
+    )
+
+    if magic != MAGIC:
+        raise ValueError("{} is not a level file".format(level_file.name))
+
+    if version > VERSION:
+        raise ValueError(
+            "{} has the version {}, this program reads the version {}".format(
+                level_file.name, version, VERSION
+            )
+        )
+
+    items = {}
+
+    for _ in range(items_number):
+        tile, name_length = ITEM.unpack(level_file.read(ITEM.size))
+        name = level_file.read(name_length).decode('utf-8')
+        items[name] = tile.decode('ascii')
+
+    return width, height, cells_offset, items
+
+
+def open_level(level_file, access=mmap.ACCESS_READ):
+    """ Open the grid of a binary level file
+
+    Args:
+        level_file(file): Level file opened in binary mode, the memory map
+        stays valid when the file is closed.
+        access(int): mmap.ACCESS_READ for a read-only grid,
+        mmap.ACCESS_COPY for a grid whose changes stay in memory.
+
+    Return:
+        tuple: (Grid whose cells are a memory map, items dict).
+
+    """
+
+    level_file.seek(0)
+    width, height, cells_offset, items = read_header(level_file)
+
+    # The offset of a memory map must be a multiple of the allocation
+    # granularity of the system (4096 on Linux, 65536 on Windows)
+    if cells_offset % mmap.ALLOCATIONGRANULARITY:
+
+        level_file.seek(cells_offset)
+        cells = level_file.read(width * height)
+
+        if access == mmap.ACCESS_COPY:
+            cells = bytearray(cells)
+
+    else:
+
+        cells = mmap.mmap(
+            level_file.fileno(),
+            width * height,
+            access=access,
+            offset=cells_offset
+        )
+
+    return Grid(width=width, height=height, cells=cells), items
+
+
+def text_to_binary(text_path, binary_path, items=None):
+    """ Convert a txt level file to a binary level file
+
+    Args:
+        text_path(str): Path of the txt level file.
+        binary_path(str): Path of the binary level file.
+        items(dict): Name to tile of the items, LEVEL_ITEMS if None.
+
+    """
+
+    with open(text_path, 'r') as level_file:
+        grid = Grid.from_text(level_file.read())
+
+    autotile(grid)
+
+    write_level(
+        path=binary_path,
+        grid=grid,
+        items=LEVEL_ITEMS if items is None else items
+    )
+
+
+def binary_to_text(binary_path, text_path):
+    """ Convert a binary level file to a txt level file
+
+    Args:
+        binary_path(str): Path of the binary level file.
+        text_path(str): Path of the txt level file.
+
+    """
+
+    with open(binary_path, 'rb') as level_file:
+        grid, _ = open_level(level_file)
+
+    with open(text_path, 'w') as level_file:
+        level_file.write(grid.to_text() + '\n')
+
+
+def main():
+    """ Convert level files """
+
+    parser = argparse.ArgumentParser(
+        description="Convert level files between txt and binary"
+    )
+    parser.add_argument("conversion", choices=('to-binary', 'to-text'))
+    parser.add_argument("source")
+    parser.add_argument("destination")
+
+    args = parser.parse_args()
+
+    if args.conversion == 'to-binary':
+        text_to_binary(args.source, args.destination)
+    else:
+        binary_to_text(args.source, args.destination)
+
+
+if __name__ == "__main__":
+
+    main()
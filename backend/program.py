@@ -7,10 +7,12 @@
 #### DOCUMENTATIONS
 ! For more informations about this app, consult : README.md
 Pygame : https://www.pygame.org/docs/
+Pygame display : https://www.pygame.org/docs/ref/display.html
 Pygame event : https://www.pygame.org/docs/ref/event.html
+Pygame time : https://www.pygame.org/docs/ref/time.html
 
 ### MODIFICATIONS
-Last modification date : 02/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
@@ -18,104 +20,467 @@ By : Guillaume SADLER - https://github.com/GRELDAS
 # pylint: disable=too-many-instance-attributes
 
 # LIBRARY IMPORTS
+import os
+from importlib import import_module
+from time import perf_counter
+from time import strftime
+
+import pygame.display
 import pygame.event
+import pygame.time
 
 # PROGRAM IMPORTS
-from backend.game import Game
+# Only the modules of the home interface are imported at start, the other
+# ones are imported when they are needed (see get_interface)
 from frontend.home_interface import HomeInterface
-from frontend.labyrinth_interface import LabyrinthInterface
-from frontend.defeat_interface import DefeatInterface
-from frontend.win_interface import WinInterface
 from frontend.image_manager import ImageManager
+from settings import PACING_MODE
+from settings import WINDOW_WIDTH
+from settings import WINDOW_HEIGHT
+from settings import FPS
+from settings import RECORDINGS_DIRECTORY
+from settings import REPLAY_MOVES_PER_SECOND
+
+# Event of the timer of the replays, each one plays a move
+REPLAY_MOVE = pygame.USEREVENT + 1
 
 class Program():
-    """ Program """
+    """ Program
+
+    The first home frame is displayed before the other interfaces are
+    built : the labyrinth images are preloaded and the sound is
+    initialized after it (see preload_assets), the win and defeat
+    interfaces are built on their first activation (see get_interface).
+
+    """
+
+    # Interface attribute to (module, class) of the interface
+    interfaces_classes = {
+        'win_interface': ('frontend.win_interface', 'WinInterface'),
+        'defeat_interface': ('frontend.defeat_interface', 'DefeatInterface')
+    }
 
     def __init__(self):
         """ Program initialization
 
         Attributes:
             program_quit(bool): Define the status of program.
+            window_surface(surface): Pygame window, shared by interfaces.
             img_manager(instance): Instance of ImageManager.
+            preloader(instance): Instance of AssetPreloader.
+            sound_manager(instance): Instance of SoundManager.
             home_interface(instance): Instance of HomeInterface.
             labyrinth_interface(instance): Instance of LabyrinthInterface.
             win_interface(instance): Instance of WinInterface.
             defeat_interface(instance): Instance of DefeatInterface.
             active_interface(instance): Instance of interface to display.
             game(instance): Instance of Game.
+            pacing_mode(str): 'event' or 'fps' (see settings).
+            fps(int): Maximum frames per second in 'fps' pacing mode.
+            clock(instance): Instance of Pygame Clock.
+            frame_stats(dict): Frames number and display times (ms).
+            print_frame_stats(bool): Print the frame stats when the
+            program quits (see frame_stats_report).
+            startup_stats(dict): Step name to duration of the step of the
+            program initialization (ms).
+            recordings_directory(str): Directory of the recordings of the
+            games, no recording if None.
+            replay_movements(iterator): Movement names of the replayed
+            game still to play, None if no game is replayed.
 
         """
 
         # Attributes
         self.program_quit = False
+        self.window_surface = None
         self.img_manager = None
+        self.preloader = None
+        self.sound_manager = None
         self.home_interface = None
         self.labyrinth_interface = None
         self.win_interface = None
         self.defeat_interface = None
         self.active_interface = None
         self.game = None
+        self.pacing_mode = PACING_MODE
+        self.fps = FPS
+        self.clock = pygame.time.Clock()
+        self.frame_stats = {
+            'frames': 0,
+            'frame_time': 0.0,
+            'average_frame_time': 0.0,
+            'max_frame_time': 0.0,
+            'fps': 0.0
+        }
+        self.print_frame_stats = False
+        self.startup_stats = {}
+        self.recordings_directory = RECORDINGS_DIRECTORY
+        self.replay_movements = None
 
         self.program_initialization()
 
     def program_initialization(self):
         """ Program initialization """
 
-        self.img_manager = ImageManager()
+        step_start = perf_counter()
 
-        self.defeat_interface = DefeatInterface(
-            program=self
-        )
+        # The window is created once for all interfaces
+        pygame.display.init()
 
-        self.win_interface = WinInterface(
-            program=self
+        self.window_surface = pygame.display.set_mode(
+            (WINDOW_WIDTH, WINDOW_HEIGHT)
         )
 
+        step_start = self.startup_step('display', step_start)
+
+        self.img_manager = ImageManager()
+
         self.home_interface = HomeInterface(
             program=self
         )
 
         # Display home interface
-        self.active_interface = self.home_interface
+        self.activate_interface(
+            interface=self.home_interface
+        )
+
+        self.startup_step('home interface', step_start)
+
+        # Mouse moves never change the display
+        if self.pacing_mode == "event":
+            pygame.event.set_blocked(pygame.MOUSEMOTION)
+
+    def startup_step(self, step_name, step_start):
+        """ Startup step
+
+        Args:
+            step_name(str): Name of the step of the initialization.
+            step_start(float): perf_counter() at the start of the step.
+
+        Return:
+            float: perf_counter() at the end of the step.
+
+        """
+
+        step_end = perf_counter()
+        self.startup_stats[step_name] = (step_end - step_start) * 1000
+
+        return step_end
+
+    def preload_assets(self):
+        """ Preload assets
+
+        Initialize the sound and start decoding the labyrinth images and
+        reading the music (see AssetPreloader). Called once, after the
+        first home frame.
+
+        """
+
+        step_start = perf_counter()
+
+        # Imported here, they are not needed by the first home frame
+        from frontend.asset_preloader import AssetPreloader
+        from frontend.labyrinth_interface import LabyrinthInterface
+        from frontend.sound_manager import SoundManager
+
+        step_start = self.startup_step('deferred imports', step_start)
+
+        # The mixer is initialized and the sound effects decoded once
+        self.sound_manager = SoundManager()
+        self.sound_manager.sound_initialization()
+
+        step_start = self.startup_step('sound', step_start)
+
+        # Decode the labyrinth images while the home interface is displayed
+        self.preloader = AssetPreloader(
+            img_manager=self.img_manager,
+            sound_manager=self.sound_manager
+        )
+
+        self.preloader.preload(
+            img_lists=(
+                LabyrinthInterface.img_tiles,
+                LabyrinthInterface.img_items,
+                LabyrinthInterface.img_characters,
+                LabyrinthInterface.menu_elements
+            ),
+            music_paths=(LabyrinthInterface.labyrinth_sound,)
+        )
+
+        self.startup_step('preloading start', step_start)
+
+    def get_interface(self, interface_name):
+        """ Get interface
+
+        Build the interface on its first use, its module is imported then.
+
+        Args:
+            interface_name(str): Interface attribute, 'win_interface' or
+            'defeat_interface'.
+
+        Return:
+            Instance of the interface.
+
+        """
+
+        interface = getattr(self, interface_name)
+
+        if interface is None:
+
+            module_name, class_name = self.interfaces_classes[interface_name]
+            interface_class = getattr(import_module(module_name), class_name)
+
+            interface = interface_class(
+                program=self
+            )
+
+            setattr(self, interface_name, interface)
+
+        return interface
 
     def program_loop(self):
-        """ Program loop """
+        """ Program loop
+
+        In 'event' pacing mode, the program sleeps until an event comes.
+        In 'fps' pacing mode, the program displays fps frames per second
+        at most.
+
+        """
 
         while not self.program_quit:
 
-            self.event_loop()
+            frame_start = perf_counter()
             self.active_interface.display()
+            self.update_frame_stats(
+                frame_time=(perf_counter() - frame_start) * 1000
+            )
+
+            if self.preloader is None:
+                self.preload_assets()
+
+            if self.pacing_mode == "event":
+                events = [pygame.event.wait()] + pygame.event.get()
+                self.clock.tick()
+            else:
+                self.clock.tick(self.fps)
+                events = pygame.event.get()
+
+            self.event_loop(
+                events=events
+            )
+
+    def update_frame_stats(self, frame_time):
+        """ Update frame stats
+
+        Args:
+            frame_time(float): Display time of the last frame (ms).
+
+        """
+
+        frame_stats = self.frame_stats
+
+        frame_stats['frames'] += 1
+        frame_stats['frame_time'] = frame_time
+        frame_stats['average_frame_time'] += (
+            frame_time - frame_stats['average_frame_time']
+        ) / frame_stats['frames']
+        frame_stats['max_frame_time'] = max(
+            frame_stats['max_frame_time'],
+            frame_time
+        )
+        frame_stats['fps'] = self.clock.get_fps()
+
+    def frame_stats_report(self):
+        """ Frame stats report
 
-    def event_loop(self):
-        """ Event loop """
+        Return:
+            str: Frames number, display times and frames per second.
 
-        for event in pygame.event.get():
+        """
+
+        return (
+            "{frames} frames : last {frame_time:.2f} ms / average "
+            "{average_frame_time:.2f} ms / max {max_frame_time:.2f} ms, "
+            "{fps:.1f} fps".format(**self.frame_stats)
+        )
+
+    def event_loop(self, events):
+        """ Event loop
+
+        Args:
+            events(list): Pygame events to handle.
+
+        """
+
+        for event in events:
 
             # EVENT 1 : QUIT
             if event.type == pygame.QUIT:
+
+                if self.print_frame_stats:
+                    print(self.frame_stats_report())
+
                 quit()
 
+            # EVENT 2 : PRELOADED IMAGES DECODED
+            if self.preloader is not None and (
+                    event.type == self.preloader.ready_event
+            ):
+                self.preloader.collect()
+                continue
+
+            # EVENT 3 : MOVE OF THE REPLAYED GAME
+            if event.type == REPLAY_MOVE:
+                self.replay_move()
+                continue
+
+            # The keys do not move the player of the replayed game
+            if self.replay_movements is not None and (
+                    event.type == pygame.KEYDOWN
+            ):
+                continue
+
             self.active_interface.event_loop(
                 event=event
             )
 
-    def new_game(self, level=1):
+    def activate_interface(self, interface):
+        """ Activate interface
+
+        Args:
+            interface(instance): Instance of interface to display.
+
+        """
+
+        self.active_interface = interface
+        self.active_interface.activate()
+
+    def new_game(self, level=1, seed=None):
         """ new game
 
-        Construct new labyrinth game.
+        Construct new labyrinth game. The labyrinth interface is built on
+        the first game, with the preloaded images, then reset.
 
         Args:
             level(int): Game level to construct.
+            seed(int): Seed of the placement of the items (see Game).
 
         """
 
+        # Imported here, they are not needed by the home interface
+        from backend.game import Game
+        from frontend.labyrinth_interface import LabyrinthInterface
+
+        if self.preloader is None:
+            self.preload_assets()
+
+        # The unfinished game is recorded before it is replaced
+        if self.game is not None and self.game.engine.result is None:
+            self.save_recording()
+
+        self.replay_stop()
+
         self.game = Game(
             program=self,
-            level=level
+            level=level,
+            seed=seed
         )
 
-        self.labyrinth_interface = LabyrinthInterface(
-            program=self
+        self.game.engine.subscribe(self.sound_manager.engine_event)
+
+        if self.labyrinth_interface is None:
+
+            self.preloader.collect()
+
+            self.labyrinth_interface = LabyrinthInterface(
+                program=self
+            )
+
+        else:
+            self.labyrinth_interface.labyrinth_reset()
+
+        self.activate_interface(
+            interface=self.labyrinth_interface
         )
 
-        self.active_interface = self.labyrinth_interface
+    def save_recording(self):
+        """ Save recording
+
+        Write the recording of the game in the recordings directory. The
+        replayed games and the games without move are not written.
+
+        """
+
+        if self.recordings_directory is None or (
+                self.replay_movements is not None
+        ):
+            return
+
+        recording = self.game.recording
+
+        if not recording.movements:
+            return
+
+        recording.finish(self.game.engine)
+
+        os.makedirs(self.recordings_directory, exist_ok=True)
+
+        recording.write(
+            os.path.join(
+                self.recordings_directory,
+                "{}-level-{}-{}.rec".format(
+                    strftime("%Y%m%d-%H%M%S"),
+                    recording.level,
+                    recording.seed
+                )
+            )
+        )
+
+    def replay(self, recording):
+        """ Replay
+
+        Start the game of a recording, then play its moves at
+        REPLAY_MOVES_PER_SECOND (see replay_move).
+
+        Args:
+            recording(Recording): Recording to replay.
+
+        """
+
+        self.new_game(
+            level=recording.level,
+            seed=recording.seed
+        )
+
+        self.replay_movements = recording.movement_names()
+
+        pygame.time.set_timer(
+            REPLAY_MOVE,
+            1000 // REPLAY_MOVES_PER_SECOND
+        )
+
+    def replay_move(self):
+        """ Replay move
+
+        Play the next move of the replayed game.
+
+        """
+
+        if self.replay_movements is None:
+            return
+
+        movement_name = next(self.replay_movements, None)
+
+        if movement_name is None or self.game.engine.result is not None:
+            self.replay_stop()
+            return
+
+        self.game.movement_collusion(movement_name)
+
+    def replay_stop(self):
+        """ Replay stop """
+
+        if self.replay_movements is not None:
+
+            pygame.time.set_timer(REPLAY_MOVE, 0)
+            self.replay_movements = None
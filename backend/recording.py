@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+""" Recording
+
+This module records games and replays them. A recording holds what makes
+a game reproducible : the level, the seed of the placement of the items
+(see Labyrinth) and the moves of the player, with the final state of the
+game to verify the replays.
+
+The recording files (.rec) are :
+- a header : magic b'LREC', version, level, checksum of the level (see
+Labyrinth.get_level_checksum), seed (signed, 64 bits), number of moves
+and final state (result, line, column, remaining life, items),
+little-endian (see HEADER).
+- the moves : 2 bits per move (index in MOVEMENT_NAMES), 4 moves per
+byte from the lowest bits.
+
+A replay plays the moves with the engine, without Pygame. Verify
+recordings from the root of the project (the exit status is 1 if a
+replay does not end in the recorded state, 2 if a level changed since
+its recordings or if a file is not a recording) :
+
+    python -m backend.recording verify recordings/*.rec
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python struct : https://docs.python.org/3.6/library/struct.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import argparse
+import struct
+import sys
+from time import perf_counter
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import MOVEMENTS
+from backend.engine import WIN
+from backend.engine import DEFEAT
+from backend.labyrinth import Labyrinth
+
+MAGIC = b'LREC'
+VERSION = 2
+
+# magic, version, level, level checksum, seed, number of moves, result,
+# line, column, remaining life, items
+HEADER = struct.Struct('<4sBHIqIBIIBB')
+
+# Seeds of the recordings, signed 64 bits
+MIN_SEED = -2 ** 63
+MAX_SEED = 2 ** 63 - 1
+
+# Results of the engine, by result code of the files
+RESULTS = (None, WIN, DEFEAT)
+
+MOVEMENT_NAMES = tuple(MOVEMENTS)
+MOVEMENT_IDS = {
+    movement_name: movement_id
+    for movement_id, movement_name in enumerate(MOVEMENT_NAMES)
+}
+
+# Movement ids of the 4 moves of each byte
+UNPACKED_BYTES = tuple(
+    bytes(byte >> shift & 3 for shift in (0, 2, 4, 6))
+    for byte in range(256)
+)
+
+
+def engine_state(engine):
+    """ Final state of a game
+
+    Args:
+        engine(instance): Instance of Engine.
+
+    Return:
+        tuple: (result, line, column, remaining life, items).
+
+    """
+
+    return (
+        engine.result,
+        engine.line_number,
+        engine.column_number,
+        engine.remaining_life,
+        engine.items
+    )
+
+
+class Recording():
+    """ Recording
+
+    Level, seed and moves of a game.
+
+    """
+
+    def __init__(self, level, seed, movements=None, final_state=None,
+                 level_checksum=None):
+        """ Recording initialization
+
+        Args:
+            level(int): Game level.
+            seed(int): Seed of the placement of the items, from MIN_SEED
+            to MAX_SEED.
+            movements(bytearray): Movement id of each move.
+            final_state(tuple): State of the game at the end of the
+            recording (see engine_state), None if not finished.
+            level_checksum(int): Checksum of the level, the checksum of
+            the current level if None.
+
+        """
+
+        if not MIN_SEED <= seed <= MAX_SEED:
+            raise ValueError(
+                "The seed of a recording is a signed 64 bits integer, "
+                "not {}".format(seed)
+            )
+
+        if level_checksum is None:
+            level_checksum = Labyrinth.get_level_checksum(level)
+
+        self.level = level
+        self.level_checksum = level_checksum
+        self.seed = seed
+        self.movements = bytearray() if movements is None else movements
+        self.final_state = final_state
+
+    def add(self, movement_name):
+        """ Record a move
+
+        Args:
+            movement_name(str): 'right', 'left', 'down' or 'up'.
+
+        """
+
+        self.movements.append(MOVEMENT_IDS[movement_name])
+
+    def finish(self, engine):
+        """ Record the final state of the game
+
+        Args:
+            engine(instance): Instance of Engine of the game.
+
+        """
+
+        self.final_state = engine_state(engine)
+
+    def movement_names(self):
+        """ Return an iterator of the movement names of the moves """
+
+        return map(MOVEMENT_NAMES.__getitem__, self.movements)
+
+    def write(self, path):
+        """ Write the recording file
+
+        Args:
+            path(str): Path of the recording file.
+
+        """
+
+        movements = self.movements + bytes(-len(self.movements) % 4)
+        packed = bytes(
+            first | second << 2 | third << 4 | fourth << 6
+            for first, second, third, fourth in zip(
+                *(iter(movements),) * 4
+            )
+        )
+
+        result, line, column, remaining_life, items = self.final_state
+
+        with open(path, 'wb') as recording_file:
+
+            recording_file.write(HEADER.pack(
+                MAGIC,
+                VERSION,
+                self.level,
+                self.level_checksum,
+                self.seed,
+                len(self.movements),
+                RESULTS.index(result),
+                line,
+                column,
+                remaining_life,
+                items
+            ))
+            recording_file.write(packed)
+
+    @classmethod
+    def read(cls, path):
+        """ Read a recording file
+
+        Args:
+            path(str): Path of the recording file.
+
+        Return:
+            Recording.
+
+        """
+
+        with open(path, 'rb') as recording_file:
+            data = recording_file.read()
+
+        if len(data) <= len(MAGIC) or data[:4] != MAGIC:
+            raise ValueError("{} is not a recording file".format(path))
+
+        if data[4] != VERSION:
+            raise ValueError(
+                "{} has the version {}, this program reads the version {}"
+                .format(path, data[4], VERSION)
+            )
+
+        if len(data) < HEADER.size:
+            raise ValueError("{} is truncated".format(path))
+
+        (_, _, level, level_checksum, seed, moves, result, line, column,
+         remaining_life, items) = HEADER.unpack_from(data)
+
+        movements = bytearray(
+            b''.join(map(UNPACKED_BYTES.__getitem__, data[HEADER.size:]))
+        )
+        del movements[moves:]
+
+        return cls(
+            level=level,
+            level_checksum=level_checksum,
+            seed=seed,
+            movements=movements,
+            final_state=(
+                RESULTS[result], line, column, remaining_life, items
+            )
+        )
+
+
+def replay(recording):
+    """ Replay a recording at maximum speed
+
+    Args:
+        recording(Recording): Recording to replay.
+
+    Return:
+        Engine: Engine at the end of the replay.
+
+    """
+
+    engine = Engine(
+        grid=Labyrinth(level=recording.level, seed=recording.seed).grid
+    )
+    apply_move = engine.apply_move
+
+    for movement_name in recording.movement_names():
+        apply_move(movement_name)
+
+    return engine
+
+
+def verify(recording):
+    """ Verify a recording
+
+    Args:
+        recording(Recording): Recording to verify.
+
+    Return:
+        bool: The replay ends in the recorded final state.
+
+    Raises:
+        ValueError: The level changed since the recording.
+
+    """
+
+    level_checksum = Labyrinth.get_level_checksum(recording.level)
+
+    if level_checksum != recording.level_checksum:
+        raise ValueError(
+            "the level {} changed since the recording (checksum {:08x}, "
+            "recorded {:08x})".format(
+                recording.level, level_checksum, recording.level_checksum
+            )
+        )
+
+    return engine_state(replay(recording)) == recording.final_state
+
+
+def main():
+    """ Verify recordings """
+
+    parser = argparse.ArgumentParser(description="Verify recordings")
+    parser.add_argument("command", choices=('verify',))
+    parser.add_argument("paths", nargs='+')
+
+    args = parser.parse_args()
+
+    moves = 0
+    failures = []
+    errors = []
+    start = perf_counter()
+
+    for path in args.paths:
+
+        try:
+            recording = Recording.read(path)
+            verified = verify(recording)
+        except ValueError as error:
+            errors.append((path, error))
+            continue
+
+        moves += len(recording.movements)
+
+        if not verified:
+            failures.append(path)
+
+    duration = perf_counter() - start
+
+    for path in failures:
+        print("{} : the replay does not match".format(path))
+
+    for path, error in errors:
+        print("{} : not verified, {}".format(path, error))
+
+    print(
+        "{} recordings, {} moves, {} failures, {} not verified : "
+        "{:.2f} us per move".format(
+            len(args.paths),
+            moves,
+            len(failures),
+            len(errors),
+            duration / max(moves, 1) * 1000000
+        )
+    )
+
+    if failures:
+        sys.exit(1)
+
+    sys.exit(2 if errors else 0)
+
+
+if __name__ == "__main__":
+
+    main()
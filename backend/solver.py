@@ -0,0 +1,994 @@
+# -*- coding: utf-8 -*-
+""" Solver
+
+This module answers questions about a labyrinth Grid : distances between
+tiles, shortest paths, and the shortest route which picks up the items
+then reaches the arrival.
+
+The rules are the rules of the Engine :
+- paths, items and the character tile can be walked on.
+- the arrival ends the game, it is never walked through.
+- fire sends the player back to the start tile and costs a life. By
+default the solver avoids fire, with a fire_cost it may use fire as a
+shortcut to the start tile while the player has lives to lose.
+- life items are walked on like paths, the solver does not count on them.
+
+The labyrinth is stored with a border of walls (one tile around the grid)
+in flat bytearrays, so the 4 neighbours of a tile are always index + 1,
+index - 1, index + padded width and index - padded width.
+Positions given to and returned by the solver are Grid indexes
+(line * width + column).
+
+The breadth-first searches keep their search tree (the direction which
+reached each visited tile) : the shortest paths between the points of
+interest are walked back in the trees, without a new search.
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Python heapq : https://docs.python.org/3.6/library/heapq.html
+Python array : https://docs.python.org/3.6/library/array.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# pylint: disable=too-many-instance-attributes
+# pylint: disable=too-many-locals
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-statements
+
+# LIBRARY IMPORTS
+from array import array
+from itertools import permutations
+from heapq import heappop
+from heapq import heappush
+
+# PROGRAM IMPORTS
+from backend.engine import MAX_LIFE
+from backend.grid import PATH
+from backend.grid import FIRE
+from backend.grid import PLAYER
+from backend.grid import ARRIVAL
+from backend.grid import ITEMS
+
+# KINDS OF TILES
+WALL_KIND = 0
+WALK_KIND = 1
+FIRE_KIND = 2
+ARRIVAL_KIND = 3
+
+# Items the player needs to win
+GOAL_ITEMS = b'aks'
+
+# MOVEMENTS, in the order of the directions
+MOVEMENT_NAMES = ('right', 'left', 'down', 'up')
+
+# Kind of tile to initial distance (signed bytes : -1, -2, -2, -3)
+DISTANCES_TABLE = b'\xfe\xff\xfe\xfd' + bytes(252)
+
+# Marks of the target search, VISITED + direction for the visited tiles
+FREE = 0
+TARGET = 1
+ARRIVAL_MARK = 2
+SEEN = 3
+VISITED = 4
+
+# Kind of tile to mark
+SEEN_TABLE = bytes((SEEN, FREE, SEEN, SEEN)) + bytes(252)
+
+# Parent codes of the state-space search
+NO_PARENT = 255
+ORIGIN = 254
+WARP = 4
+COLLECTED = 8
+
+
+class Solver():
+    """ Solver
+
+    This class can be instanciated for any Grid, without Pygame.
+
+    """
+
+    def __init__(self, grid, start=0, trees=None):
+        """ Solver initialization
+
+        Args:
+            grid(Grid): Labyrinth.
+            start(int): Grid index of the start tile.
+            trees(dict): Complete search trees of the tiles of the grid
+            (see search_tree), for the solvers of grids with the same
+            kinds of tiles.
+
+        Attributes:
+            width(int): Width of the grid.
+            height(int): Height of the grid.
+            padded_width(int): Width of the grid with its border.
+            kinds(bytearray): Kind of each padded tile (WALL_KIND...).
+            offsets(tuple): Index offset of each movement.
+            arrivals(list): Padded indexes of the arrival tiles.
+            items(list): Padded indexes of the items to pick up.
+            trees(dict): Padded index to the search tree of a search
+            from it (see target_distances).
+            complete_trees(dict): Padded index to the complete search
+            tree of a search from it.
+
+        """
+
+        # Args
+        self.grid = grid
+        self.start = start
+
+        # Attributes
+        self.width = grid.width
+        self.height = grid.height
+        self.padded_width = grid.width + 2
+        self.offsets = (1, -1, self.padded_width, -self.padded_width)
+
+        kinds_table = bytearray(256)
+
+        for tile in ITEMS + bytes((PATH, PLAYER)):
+            kinds_table[tile] = WALK_KIND
+
+        kinds_table[FIRE] = FIRE_KIND
+        kinds_table[ARRIVAL] = ARRIVAL_KIND
+
+        # One line of walls above and below, one wall on each side
+        kinds = bytearray(self.padded_width)
+
+        for line_number in range(self.height):
+            kinds += b'\x00'
+            kinds += bytes(grid.row(line_number)).translate(kinds_table)
+            kinds += b'\x00'
+
+        kinds += bytearray(self.padded_width)
+
+        self.kinds = kinds
+
+        self.arrivals = [
+            self.to_padded(index) for index in grid.find_all(bytes((ARRIVAL,)))
+        ]
+
+        self.items = [
+            self.to_padded(index) for index in grid.find_all(GOAL_ITEMS)
+        ]
+
+        self.trees = {}
+        self.complete_trees = {} if trees is None else trees
+
+    def to_padded(self, index):
+        """ Return the padded index of a Grid index """
+
+        line_number, column_number = divmod(index, self.width)
+
+        return (line_number + 1) * self.padded_width + column_number + 1
+
+    def from_padded(self, padded_index):
+        """ Return the Grid index of a padded index """
+
+        line_number, column_number = divmod(padded_index, self.padded_width)
+
+        return (line_number - 1) * self.width + column_number - 1
+
+    def padded_distances(self, start):
+        """ Breadth-first search from a padded index
+
+        The arrival tiles get a distance but are not walked through.
+
+        Args:
+            start(int): Padded index of the start tile.
+
+        Return:
+            array: Distance of each padded tile, negative if unreachable.
+
+        """
+
+        padded_width = self.padded_width
+
+        # Walkable tiles are -1, arrivals -3 and other tiles -2 until they
+        # get a distance
+        distances = array(
+            'i', array('b', self.kinds.translate(DISTANCES_TABLE))
+        )
+        distances[start] = 0
+
+        frontier = [start]
+        distance = 0
+
+        while frontier:
+
+            distance += 1
+            next_frontier = []
+            append = next_frontier.append
+
+            # The 4 neighbours are unrolled, this loop is the hot spot of
+            # the solver
+            for index in frontier:
+
+                neighbour = index + 1
+                mark = distances[neighbour]
+                if mark == -1:
+                    distances[neighbour] = distance
+                    append(neighbour)
+                elif mark == -3:
+                    distances[neighbour] = distance
+
+                neighbour = index - 1
+                mark = distances[neighbour]
+                if mark == -1:
+                    distances[neighbour] = distance
+                    append(neighbour)
+                elif mark == -3:
+                    distances[neighbour] = distance
+
+                neighbour = index + padded_width
+                mark = distances[neighbour]
+                if mark == -1:
+                    distances[neighbour] = distance
+                    append(neighbour)
+                elif mark == -3:
+                    distances[neighbour] = distance
+
+                neighbour = index - padded_width
+                mark = distances[neighbour]
+                if mark == -1:
+                    distances[neighbour] = distance
+                    append(neighbour)
+                elif mark == -3:
+                    distances[neighbour] = distance
+
+            frontier = next_frontier
+
+        return distances
+
+    def target_distances(self, start, targets):
+        """ Breadth-first search which stops when the targets are reached
+
+        The search tree is kept in trees.
+
+        Args:
+            start(int): Padded index of the start tile.
+            targets(list): Padded indexes of the tiles to reach, None to
+            search the whole component of the start and the arrivals
+            next to it.
+
+        Return:
+            dict: Padded index to distance of the reached targets.
+
+        """
+
+        padded_width = self.padded_width
+
+        # SEEN tiles are blocked, TARGET tiles are walked through,
+        # ARRIVAL_MARK tiles (target arrivals) are not. The visited tiles
+        # are marked with the direction which reached them
+        seen = self.kinds.translate(SEEN_TABLE)
+        kinds = self.kinds
+        targets_number = 0
+        complete = targets is None
+        right, left, down, up = VISITED, VISITED + 1, VISITED + 2, VISITED + 3
+
+        if complete:
+            targets = self.arrivals
+
+        for target in set(targets):
+
+            if seen[target] == FREE:
+                seen[target] = TARGET
+                targets_number += 1
+            elif kinds[target] == ARRIVAL_KIND:
+                seen[target] = ARRIVAL_MARK
+                targets_number += 1
+
+        if complete:
+            targets_number = -1
+
+        found = {}
+
+        if seen[start] in (TARGET, ARRIVAL_MARK):
+            found[start] = 0
+
+        seen[start] = SEEN
+
+        frontier = [start]
+        distance = 0
+
+        while frontier and len(found) != targets_number:
+
+            distance += 1
+            next_frontier = []
+            append = next_frontier.append
+
+            for index in frontier:
+
+                neighbour = index + 1
+                mark = seen[neighbour]
+                if mark == FREE:
+                    seen[neighbour] = right
+                    append(neighbour)
+                elif mark < SEEN:
+                    seen[neighbour] = right
+                    found[neighbour] = distance
+                    if mark == TARGET:
+                        append(neighbour)
+
+                neighbour = index - 1
+                mark = seen[neighbour]
+                if mark == FREE:
+                    seen[neighbour] = left
+                    append(neighbour)
+                elif mark < SEEN:
+                    seen[neighbour] = left
+                    found[neighbour] = distance
+                    if mark == TARGET:
+                        append(neighbour)
+
+                neighbour = index + padded_width
+                mark = seen[neighbour]
+                if mark == FREE:
+                    seen[neighbour] = down
+                    append(neighbour)
+                elif mark < SEEN:
+                    seen[neighbour] = down
+                    found[neighbour] = distance
+                    if mark == TARGET:
+                        append(neighbour)
+
+                neighbour = index - padded_width
+                mark = seen[neighbour]
+                if mark == FREE:
+                    seen[neighbour] = up
+                    append(neighbour)
+                elif mark < SEEN:
+                    seen[neighbour] = up
+                    found[neighbour] = distance
+                    if mark == TARGET:
+                        append(neighbour)
+
+            frontier = next_frontier
+
+        self.trees[start] = seen
+
+        return found
+
+    def search_tree(self, start):
+        """ Complete search tree
+
+        Args:
+            start(int): Padded index of the start tile.
+
+        Return:
+            bytearray: Search tree of the whole component of the start
+            (see target_distances).
+
+        """
+
+        tree = self.complete_trees.get(start)
+
+        if tree is None:
+            self.target_distances(start, None)
+            tree = self.complete_trees[start] = self.trees[start]
+
+        return tree
+
+    def tree_directions(self, root, goal):
+        """ Directions from the root of a search tree to a tile
+
+        Args:
+            root(int): Padded index of the start of a search.
+            goal(int): Padded index of the tile.
+
+        Return:
+            list: Directions (indexes of offsets), None if the search from
+            root did not reach goal.
+
+        """
+
+        tree = self.complete_trees.get(root)
+
+        if tree is None or tree[goal] < VISITED:
+            tree = self.trees.get(root)
+
+        if goal == root:
+            return []
+
+        if tree is None or tree[goal] < VISITED:
+            return None
+
+        offsets = self.offsets
+        directions = []
+        index = goal
+
+        while index != root:
+            direction = tree[index] - VISITED
+            directions.append(direction)
+            index -= offsets[direction]
+
+        directions.reverse()
+
+        return directions
+
+    def tree_path(self, start, goal):
+        """ Shortest path between two tiles of a search tree
+
+        The path is walked back in the tree of the start, or in the tree of
+        the goal then reversed. A* search if no tree has it.
+
+        Args:
+            start(int): Padded index of the start tile.
+            goal(int): Padded index of the goal tile.
+
+        Return:
+            list: Movement names from start to goal, None if the goal
+            can not be reached.
+
+        """
+
+        directions = self.tree_directions(root=start, goal=goal)
+
+        if directions is not None:
+            return [MOVEMENT_NAMES[direction] for direction in directions]
+
+        directions = self.tree_directions(root=goal, goal=start)
+
+        if directions is not None:
+            # Opposite directions : right and left, down and up
+            return [
+                MOVEMENT_NAMES[direction ^ 1]
+                for direction in reversed(directions)
+            ]
+
+        return self.shortest_path(
+            goal=self.from_padded(goal),
+            start=self.from_padded(start)
+        )
+
+    def points_distances(self, points):
+        """ Distances between points
+
+        The points with a complete search tree (see search_tree) get their
+        distances from their tree. One breadth-first search from each other
+        walkable point, which stops when the points after it and the
+        arrivals have a distance : distances are symmetric.
+
+        Args:
+            points(list): Padded indexes, the arrivals are reached but not
+            walked through.
+
+        Return:
+            list: distances[i][j] between points i and j, None if
+            unreachable.
+
+        """
+
+        points_number = len(points)
+        distances = [[None] * points_number for _ in range(points_number)]
+
+        with_tree = [point in self.complete_trees for point in points]
+        walkable = [
+            self.kinds[point] == WALK_KIND and not with_tree[number]
+            for number, point in enumerate(points)
+        ]
+
+        for number, point in enumerate(points):
+
+            if not with_tree[number]:
+                continue
+
+            for other_number, other_point in enumerate(points):
+
+                directions = self.tree_directions(root=point, goal=other_point)
+                distance = None if directions is None else len(directions)
+
+                distances[number][other_number] = distance
+                distances[other_number][number] = distance
+
+        for number, point in enumerate(points):
+
+            if not walkable[number]:
+                continue
+
+            # The next points, and the arrivals which are never searched from
+            targets = [
+                other_number for other_number in range(points_number)
+                if not with_tree[other_number] and (
+                    other_number >= number or not walkable[other_number]
+                )
+            ]
+
+            found = self.target_distances(
+                point, [points[other_number] for other_number in targets]
+            )
+
+            for other_number in targets:
+                distance = found.get(points[other_number])
+                distances[number][other_number] = distance
+                distances[other_number][number] = distance
+
+        return distances
+
+    def components(self):
+        """ Connected-component labelling of the walkable tiles
+
+        Return:
+            array: Label of each Grid tile, 0 for the tiles which are not
+            walked on (walls, fire, arrival), 1, 2... for the components.
+
+        """
+
+        kinds = self.kinds
+
+        labels = array('i', [0]) * len(kinds)
+        label = 0
+
+        index = kinds.find(WALK_KIND)
+
+        while index != -1:
+
+            if not labels[index]:
+                label += 1
+                self.label_component(labels, index, label)
+
+            index = kinds.find(WALK_KIND, index + 1)
+
+        grid_labels = array('i')
+
+        for line_number in range(1, self.height + 1):
+            line_start = line_number * self.padded_width + 1
+            grid_labels.extend(labels[line_start:line_start + self.width])
+
+        return grid_labels
+
+    def label_component(self, labels, start, label):
+        """ Label the walkable tiles of the component of a tile
+
+        Args:
+            labels(array): Label of each padded tile, 0 if not labelled.
+            start(int): Padded index of a walkable tile.
+            label(int): Label of the component.
+
+        """
+
+        kinds = self.kinds
+        offsets = self.offsets
+
+        labels[start] = label
+        frontier = [start]
+
+        while frontier:
+
+            next_frontier = []
+
+            for tile in frontier:
+                for offset in offsets:
+
+                    neighbour = tile + offset
+
+                    if kinds[neighbour] == WALK_KIND and not labels[neighbour]:
+                        labels[neighbour] = label
+                        next_frontier.append(neighbour)
+
+            frontier = next_frontier
+
+    def distances(self, start=None):
+        """ Distances from a tile
+
+        Args:
+            start(int): Grid index, the start tile of the solver if None.
+
+        Return:
+            array: Distance of each Grid tile, negative if unreachable.
+
+        """
+
+        if start is None:
+            start = self.start
+
+        padded_distances = self.padded_distances(self.to_padded(start))
+        padded_width = self.padded_width
+
+        distances = array('i')
+
+        for line_number in range(1, self.height + 1):
+            line_start = line_number * padded_width + 1
+            distances.extend(
+                padded_distances[line_start:line_start + self.width]
+            )
+
+        return distances
+
+    def reachable(self, goal, start=None):
+        """ Return True if the goal tile can be reached from the start
+
+        Args:
+            goal(int): Grid index of the goal tile.
+            start(int): Grid index, the start tile of the solver if None.
+
+        """
+
+        return self.shortest_path(goal=goal, start=start) is not None
+
+    def can_reach_arrival(self, start=None):
+        """ Return True if an arrival tile can be reached from the start
+
+        Args:
+            start(int): Grid index, the start tile of the solver if None.
+
+        """
+
+        if start is None:
+            start = self.start
+
+        return bool(
+            self.target_distances(self.to_padded(start), self.arrivals)
+        )
+
+    def shortest_path(self, goal, start=None):
+        """ A* search between two tiles
+
+        Args:
+            goal(int): Grid index of the goal tile.
+            start(int): Grid index, the start tile of the solver if None.
+
+        Return:
+            list: Movement names from start to goal, None if the goal
+            can not be reached.
+
+        """
+
+        if start is None:
+            start = self.start
+
+        kinds = self.kinds
+        offsets = self.offsets
+        padded_width = self.padded_width
+
+        start = self.to_padded(start)
+        goal = self.to_padded(goal)
+        goal_line, goal_column = divmod(goal, padded_width)
+
+        size = len(kinds)
+        costs = array('i', [-1]) * size
+        parents = bytearray(b'\xff') * size
+
+        costs[start] = 0
+        parents[start] = ORIGIN
+
+        # Heap keys are integers : estimated total cost * size + index
+        heap = [start]
+
+        while heap:
+
+            index = heappop(heap) % size
+
+            if index == goal:
+                return self.path_from_parents(parents, goal)
+
+            # The arrival ends the game
+            if kinds[index] == ARRIVAL_KIND:
+                continue
+
+            cost = costs[index] + 1
+
+            for direction, offset in enumerate(offsets):
+
+                neighbour = index + offset
+
+                if kinds[neighbour] not in (WALK_KIND, ARRIVAL_KIND):
+                    continue
+
+                if costs[neighbour] != -1 and costs[neighbour] <= cost:
+                    continue
+
+                costs[neighbour] = cost
+                parents[neighbour] = direction
+
+                line_number, column_number = divmod(neighbour, padded_width)
+                estimate = cost + abs(goal_line - line_number) + abs(
+                    goal_column - column_number
+                )
+
+                heappush(heap, estimate * size + neighbour)
+
+        return None
+
+    def path_from_parents(self, parents, goal):
+        """ Movement names to a tile of a search without items
+
+        Args:
+            parents(bytearray): Direction used to reach each padded tile.
+            goal(int): Padded index of the goal tile.
+
+        Return:
+            list: Movement names.
+
+        """
+
+        movements = []
+        index = goal
+
+        while parents[index] != ORIGIN:
+            direction = parents[index]
+            movements.append(MOVEMENT_NAMES[direction])
+            index -= self.offsets[direction]
+
+        movements.reverse()
+
+        return movements
+
+    def solve(self, start=None, fire_cost=None, remaining_life=MAX_LIFE,
+              distances=None):
+        """ Shortest route which picks up the items then reaches the arrival
+
+        Without fire, the route is the best order of the items : one
+        breadth-first search from the start and from each item gives the
+        distances between them (or the given distances), the path is then
+        walked back in the search trees segment by segment. With fire, see
+        solve_states.
+
+        Args:
+            start(int): Grid index, the start tile of the solver if None.
+            fire_cost(int): Cost of a move on fire (1 counts it as a
+            simple move), fire is avoided if None.
+            remaining_life(int): Player remaining life.
+            distances(list): Distances between the start, the items and
+            the arrivals, in this order (see points_distances), computed
+            if None.
+
+        Return:
+            tuple: (cost, movement names), None if the player can not win.
+
+        """
+
+        if fire_cost is not None:
+            return self.solve_states(
+                start=start,
+                fire_cost=fire_cost,
+                remaining_life=remaining_life
+            )
+
+        if start is None:
+            start = self.start
+
+        points = [self.to_padded(start)] + self.items + self.arrivals
+
+        if distances is None:
+            distances = self.points_distances(points)
+
+        cost, route = self.best_route(distances, len(self.items))
+
+        if route is None:
+            return None
+
+        movements = []
+
+        for previous, number in zip(route, route[1:]):
+            movements += self.tree_path(
+                start=points[previous],
+                goal=points[number]
+            )
+
+        return cost, movements
+
+    @staticmethod
+    def best_route(distances, items_number):
+        """ Best order of the items
+
+        Args:
+            distances(list): Distances between the start, the items and
+            the arrivals, in this order.
+            items_number(int): Number of items.
+
+        Return:
+            tuple: (cost, numbers of the points of the route), (inf, None)
+            if no route reaches an arrival.
+
+        """
+
+        arrivals = range(items_number + 1, len(distances))
+        best = (float('inf'), None)
+
+        for order in permutations(range(1, items_number + 1)):
+
+            route = (0,) + order
+            cost = 0
+
+            for previous, number in zip(route, route[1:]):
+
+                distance = distances[previous][number]
+
+                if distance is None:
+                    break
+
+                cost += distance
+
+            else:
+
+                for arrival in arrivals:
+
+                    distance = distances[route[-1]][arrival]
+
+                    if distance is not None and cost + distance < best[0]:
+                        best = (cost + distance, route + (arrival,))
+
+        return best
+
+    def solve_states(self, start=None, fire_cost=None,
+                     remaining_life=MAX_LIFE):
+        """ Shortest route which picks up the items then reaches the arrival
+
+        State-space search over (lives lost, items picked up, tile) :
+        breadth-first without fire, Dijkstra with fire.
+
+        Args:
+            start(int): Grid index, the start tile of the solver if None.
+            fire_cost(int): Cost of a move on fire (1 counts it as a
+            simple move), fire is avoided if None.
+            remaining_life(int): Player remaining life.
+
+        Return:
+            tuple: (cost, movement names), None if the player can not win.
+
+        """
+
+        if start is None:
+            start = self.start
+
+        kinds = self.kinds
+        offsets = self.offsets
+        size = len(kinds)
+        origin = self.to_padded(self.start)
+
+        items_number = len(self.items)
+        masks_number = 1 << items_number
+        full_mask = masks_number - 1
+
+        item_bits = bytearray(size)
+
+        for bit, item in enumerate(self.items):
+            item_bits[item] = 1 << bit
+
+        if fire_cost is None:
+            max_lost = 0
+        else:
+            max_lost = max(remaining_life - 1, 0)
+
+        states_number = (max_lost + 1) * masks_number * size
+        layer = masks_number * size
+
+        parents = bytearray(b'\xff') * states_number
+        warp_parents = {}
+
+        start_state = self.to_padded(start)
+        parents[start_state] = ORIGIN
+
+        weighted = fire_cost is not None
+
+        if weighted:
+            costs = array('i', [-1]) * states_number
+            costs[start_state] = 0
+            heap = [start_state]
+        else:
+            frontier = [start_state]
+
+        cost = 0
+        goal = None
+
+        while goal is None:
+
+            if weighted:
+
+                if not heap:
+                    return None
+
+                key = heappop(heap)
+                state = key % states_number
+
+                if key // states_number > costs[state]:
+                    continue
+
+                cost = costs[state]
+                states = (state,)
+
+            else:
+
+                if not frontier:
+                    return None
+
+                states = frontier
+                frontier = []
+
+            step_cost = cost + 1
+
+            for state in states:
+
+                lost, rest = divmod(state, layer)
+                mask, index = divmod(rest, size)
+
+                for direction, offset in enumerate(offsets):
+
+                    neighbour = index + offset
+                    kind = kinds[neighbour]
+
+                    if kind == WALK_KIND:
+
+                        new_mask = mask | item_bits[neighbour]
+                        new_state = lost * layer + new_mask * size + neighbour
+                        new_cost = step_cost
+
+                        parent = direction
+                        if new_mask != mask:
+                            parent |= COLLECTED
+
+                    elif kind == ARRIVAL_KIND:
+
+                        if mask == full_mask:
+                            goal = (state, direction)
+                            total_cost = step_cost
+                            break
+
+                        continue
+
+                    elif kind == FIRE_KIND and lost < max_lost:
+
+                        new_state = (lost + 1) * layer + mask * size + origin
+                        new_cost = cost + fire_cost
+
+                        parent = WARP
+
+                    else:
+                        continue
+
+                    if weighted:
+
+                        if costs[new_state] != -1 and costs[new_state] <= new_cost:
+                            continue
+
+                        costs[new_state] = new_cost
+                        heappush(heap, new_cost * states_number + new_state)
+
+                    elif parents[new_state] != NO_PARENT:
+                        continue
+
+                    else:
+                        frontier.append(new_state)
+
+                    parents[new_state] = parent
+
+                    if parent == WARP:
+                        warp_parents[new_state] = (state, direction)
+
+                if goal is not None:
+                    break
+
+            cost = step_cost
+
+        # Route from the start to the arrival
+        state, direction = goal
+        movements = [MOVEMENT_NAMES[direction]]
+
+        while parents[state] != ORIGIN:
+
+            parent = parents[state]
+
+            if parent == WARP:
+                state, direction = warp_parents[state]
+                movements.append(MOVEMENT_NAMES[direction])
+                continue
+
+            direction = parent & 3
+            movements.append(MOVEMENT_NAMES[direction])
+
+            lost, rest = divmod(state, layer)
+            mask, index = divmod(rest, size)
+
+            if parent & COLLECTED:
+                mask ^= item_bits[index]
+
+            state = lost * layer + mask * size + index - offsets[direction]
+
+        movements.reverse()
+
+        return total_cost, movements
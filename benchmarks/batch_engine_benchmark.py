@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+""" Batch engine benchmark
+
+Measure the number of moves per second of the batch engine with random
+players, the finished games start again. Requires NumPy. Launch from the
+root of the project :
+
+    python -m benchmarks.batch_engine_benchmark
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from time import perf_counter
+
+# PROGRAM IMPORTS
+from backend.batch_engine import BatchEngine
+from backend.batch_engine import RUNNING
+from backend.batch_engine import random_policy
+from backend.labyrinth import Labyrinth
+
+STEPS = 200
+
+
+def main():
+    """ Print the number of random moves per second by number of games """
+
+    grid = Labyrinth(level=1, seed=0).grid
+
+    print("games   | moves per second | finished games")
+
+    for games in (1000, 10000, 100000):
+
+        batch_engine = BatchEngine(grid=grid, games=games)
+        policy = random_policy(seed=0)
+        finished = 0
+
+        start = perf_counter()
+
+        for _ in range(STEPS):
+
+            batch_engine.step(policy(batch_engine))
+
+            ended = batch_engine.result != RUNNING
+            finished += int(ended.sum())
+            batch_engine.reset(ended)
+
+        duration = perf_counter() - start
+
+        print("{:>7} | {:>16.0f} | {}".format(
+            games,
+            games * STEPS / duration,
+            finished
+        ))
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+""" Engine benchmark
+
+Measure the number of moves per second of the headless engine, without
+Pygame. Launch from the root of the project :
+
+    python -m benchmarks.engine_benchmark
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from random import Random
+from time import perf_counter
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.labyrinth import Labyrinth
+
+MOVES = 1000000
+
+
+def main():
+    """ Print the number of random moves per second """
+
+    random = Random(0)
+    movements = [
+        random.choice(('right', 'left', 'down', 'up'))
+        for _ in range(MOVES)
+    ]
+
+    engine = Engine(grid=Labyrinth(level=1).grid)
+    games = 1
+
+    start = perf_counter()
+
+    for movement_name in movements:
+
+        engine.apply_move(movement_name)
+
+        if engine.result is not None:
+            engine = Engine(grid=Labyrinth(level=1).grid)
+            games += 1
+
+    duration = perf_counter() - start
+
+    print("{} moves, {} games : {:.0f} moves per second".format(
+        MOVES,
+        games,
+        MOVES / duration
+    ))
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+""" Grid benchmark
+
+Compare the memory and the lookup time of a labyrinth stored as a list of
+lists of strings and as a Grid. A (line, column) lookup of a Grid
+computes the index : it is slower than the lists on small labyrinths
+(15x15, 100x100) and faster on large ones (1000x1000). A lookup of an
+index known in advance, like the index of the player kept by the engine,
+is faster on all sizes. Launch from the root of the project :
+
+    python -m benchmarks.grid_benchmark
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import sys
+from random import Random
+from timeit import timeit
+
+# PROGRAM IMPORTS
+from backend.grid import Grid
+
+LOOKUPS = 200000
+
+
+def lists_size(labyrinth):
+    """ Memory of a list of lists of strings (bytes) """
+
+    size = sys.getsizeof(labyrinth)
+
+    for line in labyrinth:
+        size += sys.getsizeof(line)
+
+    # One character strings are shared by the interpreter, only the
+    # pointers of the lists are counted
+    return size
+
+
+def main():
+    """ Print memory and lookup time for several sizes of labyrinth """
+
+    random = Random(0)
+
+    print("size      | lists (KB) | grid (KB) | lists (ns) | grid (ns) | "
+          "index (ns)")
+
+    for size in (15, 100, 1000):
+
+        labyrinth_txt = '\n'.join(
+            ''.join(random.choice('xcf') for _ in range(size))
+            for _ in range(size)
+        )
+
+        grid = Grid.from_text(labyrinth_txt)
+        labyrinth = [list(line) for line in labyrinth_txt.split('\n')]
+
+        positions = [
+            (random.randrange(size), random.randrange(size))
+            for _ in range(LOOKUPS)
+        ]
+        indexes = [
+            line_number * size + column_number
+            for line_number, column_number in positions
+        ]
+
+        def lists_lookups():
+            for line_number, column_number in positions:
+                labyrinth[line_number][column_number] == 'c'
+
+        def grid_lookups():
+            cells = grid.cells
+            width = grid.width
+            for line_number, column_number in positions:
+                cells[line_number * width + column_number] == 99
+
+        def index_lookups():
+            cells = grid.cells
+            for index in indexes:
+                cells[index] == 99
+
+        lists_time = timeit(lists_lookups, number=1)
+        grid_time = timeit(grid_lookups, number=1)
+        index_time = timeit(index_lookups, number=1)
+
+        print(
+            "{:>9} | {:>10.1f} | {:>9.1f} | {:>10.0f} | {:>9.0f} | "
+            "{:>10.0f}".format(
+                "{}x{}".format(size, size),
+                lists_size(labyrinth) / 1024,
+                sys.getsizeof(grid.cells) / 1024,
+                lists_time / LOOKUPS * 1e9,
+                grid_time / LOOKUPS * 1e9,
+                index_time / LOOKUPS * 1e9
+            )
+        )
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+""" Image manager benchmark
+
+Measure the cost of ImageManager lookups while the number of loaded
+images grows. Launch from the root of the project :
+
+    python -m benchmarks.image_manager_benchmark
+
+### REQUIREMENTS
+> Pygame 1.9.6
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from timeit import timeit
+
+import pygame
+
+# PROGRAM IMPORTS
+from frontend.image_manager import ImageManager
+
+LOOKUPS = 100000
+
+
+def fill_manager(images_number):
+    """ Build an ImageManager with images_number images.
+
+    Args:
+        images_number(int): Number of images to register.
+
+    Return:
+        ImageManager instance.
+
+    """
+
+    img_manager = ImageManager()
+    pygame_image = pygame.Surface((1, 1))
+
+    for number in range(images_number):
+
+        img_manager.images_register(
+            image={
+                'name': 'image_{}'.format(number),
+                'rect': False
+            },
+            pygame_image=pygame_image
+        )
+
+    return img_manager
+
+
+def main():
+    """ Print the lookup cost for several sizes of ImageManager """
+
+    surface = pygame.Surface((1, 1))
+
+    print("images | get_image (ns) | blit by name (ns) | blit by handle (ns)")
+
+    for images_number in (10, 100, 1000, 10000):
+
+        img_manager = fill_manager(images_number)
+
+        # The last registered image was the worst case of the linear scan
+        img_name = 'image_{}'.format(images_number - 1)
+        pygame_image = img_manager.get_surface(image_name=img_name)
+
+        get_time = timeit(
+            lambda: img_manager.get_image(image_name=img_name),
+            number=LOOKUPS
+        )
+        blit_name_time = timeit(
+            lambda: img_manager.images_blit(img_name, surface, 0, 0),
+            number=LOOKUPS
+        )
+        blit_handle_time = timeit(
+            lambda: img_manager.images_blit(
+                None, surface, 0, 0, pygame_image=pygame_image
+            ),
+            number=LOOKUPS
+        )
+
+        print("{:>6} | {:>14.0f} | {:>17.0f} | {:>19.0f}".format(
+            images_number,
+            get_time / LOOKUPS * 1e9,
+            blit_name_time / LOOKUPS * 1e9,
+            blit_handle_time / LOOKUPS * 1e9
+        ))
+
+
+if __name__ == "__main__":
+
+    main()
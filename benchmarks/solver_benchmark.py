@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+""" Solver benchmark
+
+Time the solver on random open labyrinths of several sizes. The game
+solve is the solve of a new game of a level, with the search trees of the
+level (see Labyrinth.get_level_trees). Launch from the root of the
+project :
+
+    python -m benchmarks.solver_benchmark
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from random import Random
+from timeit import timeit
+
+# PROGRAM IMPORTS
+from backend.grid import Grid
+from backend.solver import Solver
+
+
+def random_grid(random, size):
+    """ Return a Grid with 1 wall out of 8, the items and the arrival """
+
+    cells = bytearray(random.choice(b'cccccccx') for _ in range(size * size))
+    cells[0] = ord('P')
+    cells[-1] = ord('A')
+
+    for item in b'aks':
+        cells[random.randrange(1, size * size - 1)] = item
+
+    return Grid(width=size, height=size, cells=cells)
+
+
+def main():
+    """ Print the time of the solver for several sizes of labyrinth """
+
+    random = Random(0)
+
+    print(
+        "size      | distances (s) | arrival (s) | solve (s) "
+        "| game solve (s) | cost"
+    )
+
+    for size in (15, 100, 1000):
+
+        solver = Solver(random_grid(random, size))
+        result = []
+
+        distances_time = timeit(solver.distances, number=1)
+        arrival_time = timeit(solver.can_reach_arrival, number=1)
+        solve_time = timeit(lambda: result.append(solver.solve()), number=1)
+
+        for point in [solver.to_padded(solver.start)] + solver.arrivals:
+            solver.search_tree(point)
+
+        game_solver = Solver(solver.grid, trees=solver.complete_trees)
+        game_solve_time = timeit(game_solver.solve, number=1)
+
+        print(
+            "{:>9} | {:>13.3f} | {:>11.3f} | {:>9.3f} | {:>14.3f} | {}".format(
+                "{}x{}".format(size, size),
+                distances_time,
+                arrival_time,
+                solve_time,
+                game_solve_time,
+                result[0] and result[0][0]
+            )
+        )
+
+
+if __name__ == "__main__":
+
+    main()
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+""" Asset preloader
+
+This module reads and decodes the images of the program, and reads the
+music files, on a pool of threads while the home interface is displayed.
+The images are converted to the format of the display on the main
+thread, by ImageManager, and the music is loaded by SoundManager.
+
+### REQUIREMENTS
+> Pygame 1.9.6
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Pygame event : https://www.pygame.org/docs/ref/event.html
+Pygame image : https://www.pygame.org/docs/ref/image.html
+Python concurrent.futures :
+https://docs.python.org/3.6/library/concurrent.futures.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import Lock
+
+import pygame
+import pygame.event
+import pygame.image
+
+# PROGRAM IMPORTS
+from frontend.texture_atlas import load_atlas
+from settings import PRELOAD_WORKERS
+
+# Event posted when the preloaded images are decoded and the music read
+ASSETS_READY = pygame.USEREVENT
+
+
+class AssetPreloader():
+    """ Asset preloader
+
+    preload() starts reading and decoding images and reading music files
+    in the background, ready is a Future whose result is the number of
+    preloaded assets, progress() tells how many are done. collect() gives
+    the images to ImageManager and the music to SoundManager, on the main
+    thread : the first game starts without reading any file.
+
+    Pygame loads and decodes an image without holding the Python GIL :
+    the program keeps displaying and handling events meanwhile.
+
+    """
+
+    ready_event = ASSETS_READY
+
+    def __init__(self, img_manager, sound_manager=None,
+                 workers=PRELOAD_WORKERS):
+        """ Asset preloader initialization
+
+        Args:
+            img_manager(instance): Instance of ImageManager.
+            sound_manager(instance): Instance of SoundManager, None
+            without sound.
+            workers(int): Number of threads.
+
+        Attributes:
+            img_manager(instance): Instance of ImageManager.
+            sound_manager(instance): Instance of SoundManager.
+            executor(instance): Instance of ThreadPoolExecutor.
+            ready(Future): Done when all images are decoded.
+            images(list): Images (dict) to preload.
+            atlas(tuple): Sheet and index given by load_atlas, None if
+            ImageManager loaded the atlas.
+            decoded(dict): Image name to decoded Pygame image, None if it
+            is in the atlas or if it could not be decoded.
+            music_paths(tuple): Music files to read.
+            music(dict): Music path to its bytes, None if it could not
+            be read.
+            lock(Lock): Protects decoded and music from the threads.
+            collected(bool): The images are given to ImageManager.
+
+        """
+
+        self.img_manager = img_manager
+        self.sound_manager = sound_manager
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.ready = Future()
+        self.images = []
+        self.atlas = None
+        self.decoded = {}
+        self.music_paths = ()
+        self.music = {}
+        self.lock = Lock()
+        self.collected = False
+
+    def preload(self, img_lists, music_paths=()):
+        """ Preload
+
+        Start reading the music files, and the texture atlas if
+        ImageManager did not load it, then decoding the images which are
+        not in it.
+
+        Args:
+            img_lists(list): Lists of images (see ImageManager).
+            music_paths(tuple): Music files to read.
+
+        Return:
+            Future: ready.
+
+        """
+
+        self.images = [
+            image
+            for img_list in img_lists
+            for image in img_list
+            if self.img_manager.get_image(image_name=image['name']) is None
+        ]
+
+        self.music_paths = tuple(music_paths)
+
+        self.ready.set_running_or_notify_cancel()
+
+        for music_path in self.music_paths:
+            self.executor.submit(self.read_music, music_path=music_path)
+
+        if self.img_manager.atlas_rects is None:
+
+            atlas_future = self.executor.submit(
+                load_atlas,
+                sheet_path=self.img_manager.atlas_sheet,
+                index_path=self.img_manager.atlas_index
+            )
+            atlas_future.add_done_callback(self.decode_images)
+
+        else:
+            self.decode_images(atlas_future=None)
+
+        return self.ready
+
+    def decode_images(self, atlas_future):
+        """ Decode images
+
+        Called on a thread when the atlas is read, or by preload.
+
+        Args:
+            atlas_future(Future): Future of load_atlas, None if the atlas
+            is loaded by ImageManager.
+
+        """
+
+        if atlas_future is None:
+            rects = self.img_manager.atlas_rects
+        else:
+            try:
+                self.atlas = atlas_future.result()
+            except (OSError, KeyError, ValueError, pygame.error):
+                self.atlas = None, {}
+            rects = self.atlas[1]
+
+        to_decode = []
+
+        for image in self.images:
+
+            path_built = (
+                image['address'] + image['name'] + "." + image['format']
+            )
+
+            if path_built in rects:
+                self.decoded[image['name']] = None
+            else:
+                to_decode.append((image['name'], path_built))
+
+        if not to_decode:
+            self.asset_done()
+
+        for name, path_built in to_decode:
+            self.executor.submit(
+                self.decode_image,
+                name=name,
+                path_built=path_built
+            )
+
+    def decode_image(self, name, path_built):
+        """ Decode image
+
+        Called on a thread.
+
+        Args:
+            name(str): Image name.
+            path_built(str): Path of the image.
+
+        """
+
+        try:
+            pygame_image = pygame.image.load(path_built)
+        except (OSError, pygame.error):
+            # ImageManager loads it again, and reports the error
+            pygame_image = None
+
+        with self.lock:
+            self.decoded[name] = pygame_image
+
+        self.asset_done()
+
+    def read_music(self, music_path):
+        """ Read music
+
+        Called on a thread. The music is decoded while it plays, by the
+        mixer : only the file is read here.
+
+        Args:
+            music_path(str): Path of the music.
+
+        """
+
+        try:
+            with open(music_path, 'rb') as music_file:
+                music_bytes = music_file.read()
+        except OSError:
+            # SoundManager plays without this music
+            music_bytes = None
+
+        with self.lock:
+            self.music[music_path] = music_bytes
+
+        self.asset_done()
+
+    def asset_done(self):
+        """ Asset done
+
+        Called when an asset is preloaded. When they all are, set the
+        result of ready and wake the program loop up.
+
+        """
+
+        with self.lock:
+            done_number, assets_number = self.progress()
+            if done_number < assets_number or self.ready.done():
+                return
+            self.ready.set_result(assets_number)
+
+        pygame.event.post(
+            pygame.event.Event(ASSETS_READY)
+        )
+
+    def progress(self):
+        """ Progress
+
+        Return:
+            tuple: (number of preloaded assets, number of assets).
+
+        """
+
+        return (
+            len(self.decoded) + len(self.music),
+            len(self.images) + len(self.music_paths)
+        )
+
+    def collect(self):
+        """ Collect
+
+        Give the decoded images to ImageManager, which converts them to
+        the format of the display, and the music to SoundManager. Waits
+        for the assets which are not preloaded yet. Called on the main
+        thread.
+
+        """
+
+        if self.collected or not (self.ready.running() or self.ready.done()):
+            return
+
+        self.ready.result()
+        self.collected = True
+
+        if self.img_manager.atlas_rects is None and self.atlas is not None:
+            self.img_manager.atlas_load(atlas=self.atlas)
+
+        for image in self.images:
+
+            self.img_manager.images_upload(
+                image=image,
+                decoded=self.decoded[image['name']]
+            )
+
+        if self.sound_manager is not None:
+            for music_path in self.music_paths:
+                music_bytes = self.music[music_path]
+                self.sound_manager.music_load(
+                    music_path=music_path,
+                    music_file=(
+                        None if music_bytes is None else BytesIO(music_bytes)
+                    )
+                )
+
+        self.decoded.clear()
+        self.music.clear()
+        self.executor.shutdown(wait=False)
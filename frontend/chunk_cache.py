@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+""" Chunk cache
+
+The static layer of the labyrinth is cut in square chunks of tiles. A
+chunk is drawn the first time it is visible and kept in a cache, the least
+recently used chunks are forgotten when the cache exceeds its budget.
+
+### REQUIREMENTS
+> Pygame 1.9.6
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Pygame surface : https://www.pygame.org/docs/ref/surface.html
+Python OrderedDict : https://docs.python.org/3.6/library/collections.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from collections import OrderedDict
+
+
+class ChunkCache():
+    """ Chunk cache
+
+    This class is instanciated by an instance of LabyrinthInterface.
+
+    """
+
+    def __init__(self, render_chunk, chunk_size, budget):
+        """ Chunk cache initialization
+
+        Args:
+            render_chunk(function): Called with (chunk_line, chunk_column),
+            return the Pygame Surface of the chunk.
+            chunk_size(int): Number of tiles per side of a chunk.
+            budget(int): Maximum memory of the chunks (bytes).
+
+        Attributes:
+            chunks(OrderedDict): (chunk_line, chunk_column) to Surface,
+            from the least to the most recently used.
+            size(int): Memory of the chunks (bytes).
+            hits(int): Number of chunks found in the cache.
+            misses(int): Number of chunks drawn.
+
+        """
+
+        # Args
+        self.render_chunk = render_chunk
+        self.chunk_size = chunk_size
+        self.budget = budget
+
+        # Attributes
+        self.chunks = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def surface_size(cls, surface):
+        """ Return the memory of a Pygame Surface (bytes) """
+
+        return surface.get_height() * surface.get_pitch()
+
+    def get(self, chunk_line, chunk_column):
+        """ Get a chunk
+
+        Args:
+            chunk_line(int): Line of the chunk.
+            chunk_column(int): Column of the chunk.
+
+        Return:
+            Pygame Surface of the chunk.
+
+        """
+
+        key = (chunk_line, chunk_column)
+        surface = self.chunks.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            self.chunks.move_to_end(key)
+            return surface
+
+        self.misses += 1
+
+        surface = self.render_chunk(chunk_line, chunk_column)
+
+        self.chunks[key] = surface
+        self.size += self.surface_size(surface)
+
+        # Forget the least recently used chunks, never the new one
+        while self.size > self.budget and len(self.chunks) > 1:
+            _, old_surface = self.chunks.popitem(last=False)
+            self.size -= self.surface_size(old_surface)
+
+        return surface
+
+    def invalidate_tile(self, line_number, column_number):
+        """ Forget the chunk of a modified tile
+
+        Args:
+            line_number(int): Line of the tile.
+            column_number(int): Column of the tile.
+
+        """
+
+        surface = self.chunks.pop(
+            (line_number // self.chunk_size, column_number // self.chunk_size),
+            None
+        )
+
+        if surface is not None:
+            self.size -= self.surface_size(surface)
+
+    def clear(self):
+        """ Forget all chunks """
+
+        self.chunks.clear()
+        self.size = 0
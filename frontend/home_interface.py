@@ -11,7 +11,7 @@ Pygame display : https://www.pygame.org/docs/ref/display.html
 Pygame mouse : https://www.pygame.org/docs/ref/mouse.html
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
@@ -36,7 +36,10 @@ class HomeInterface(ProgramInterface):
     This class can use this ProgramInterface methods :
 
     > create_surface(interface_name)
-    Create pygame Surface of interface.
+    Get pygame Surface of interface.
+
+    > activate()
+    Set the window caption.
 
     > upload_images(img_manager, img_list)
     Pygame upload images.
@@ -8,9 +8,10 @@
 ! For more informations about this app, consult : README.md
 Pygame : https://www.pygame.org/docs/
 Pygame image : https://www.pygame.org/docs/ref/image.html
+Pygame surface : https://www.pygame.org/docs/ref/surface.html
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
@@ -18,6 +19,11 @@ By : Guillaume SADLER - https://github.com/GRELDAS
 # LIBRARY IMPORTS
 import pygame.image
 
+# PROGRAM IMPORTS
+from frontend.texture_atlas import load_atlas
+from settings import ATLAS_SHEET
+from settings import ATLAS_INDEX
+
 
 class ImageManager():
     """ Image manager
@@ -30,23 +36,48 @@ class ImageManager():
 
     The goal of this class is to load images once for more program performance.
 
+    Images are indexed by name : get_image() does not depend on the number
+    of loaded images. The render loops can also keep the Pygame image of
+    get_surface() and give it to images_blit() to skip the lookup.
+
+    When the texture atlas is built (see frontend.texture_atlas), its
+    sheet is loaded once and the images are subsurfaces of the sheet.
+
     """
 
-    def __init__(self):
+    def __init__(self, atlas_sheet=ATLAS_SHEET, atlas_index=ATLAS_INDEX):
         """ Image manager initialization
 
+        Args:
+            atlas_sheet(str): Path of the sheet of the texture atlas.
+            atlas_index(str): Path of the index of the texture atlas.
+
         Attributes:
+            atlas_sheet(str) : Path of the sheet of the texture atlas.
+            atlas_index(str) : Path of the index of the texture atlas.
             images_list(list) : Contains all images objects loaded by Pygame.
+            images_index(dict) : Images objects by image name.
+            atlas(Surface) : Sheet of the texture atlas, None before the
+            first upload or without atlas.
+            atlas_rects(dict) : Image path to rectangle in the sheet, empty
+            without atlas.
 
         """
 
+        self.atlas_sheet = atlas_sheet
+        self.atlas_index = atlas_index
         self.images_list = []
+        self.images_index = {}
+        self.atlas = None
+        self.atlas_rects = None
 
-    def images_upload(self, image):
+    def images_upload(self, image, decoded=None):
         """ Images upload.
 
         Args:
             image(dict): Image to load if does not exist.
+            decoded(Surface): Image already decoded by Pygame (see
+            AssetPreloader), not converted yet.
 
         Example of image dict :
 
@@ -61,43 +92,82 @@ class ImageManager():
 
         """
 
-        exist_image = self.get_image(
-            image_name=image['name']
+        if image['name'] in self.images_index:
+            return
+
+        # 1 : Construct absolute path to the image to load
+        path_built = image['address'] + image['name'] + "." + image['format']
+
+        if self.atlas_rects is None:
+            self.atlas_load()
+
+        # 2 : Loading the image by pygame, from the sheet if it is packed
+        if path_built in self.atlas_rects:
+            pygame_image = self.atlas.subsurface(self.atlas_rects[path_built])
+        elif decoded is not None:
+            pygame_image = decoded.convert_alpha()
+        else:
+            pygame_image = pygame.image.load(path_built).convert_alpha()
+
+        self.images_register(
+            image=image,
+            pygame_image=pygame_image
         )
 
-        if exist_image is None:
+    def atlas_load(self, atlas=None):
+        """ Atlas load
 
-            load_image = {
-                'name': '',
-                'pygame_image': None,
-                'rect': None,
-            }
+        Load the sheet of the texture atlas, the images are loaded from
+        their own file if the atlas is not built.
 
-            # 1 : Construct absolute path to the image to load
-            path_built = image['address'] + image['name'] + "." + image['format']
+        Args:
+            atlas(tuple): Sheet and index already read by load_atlas (see
+            AssetPreloader), read here if None.
 
-            # 2 : Loading the image by pygame
-            pygame_image = pygame.image.load(path_built).convert_alpha()
+        """
 
-            # 3.1 : Name image storage
-            load_image['name'] = image['name']
+        if atlas is None:
+            atlas = load_atlas(
+                sheet_path=self.atlas_sheet,
+                index_path=self.atlas_index
+            )
 
-            # 3.2 : Object Image Pygame storage
-            load_image['pygame_image'] = pygame_image
+        sheet, self.atlas_rects = atlas
 
-            # OPTIONAL PHASE
-            if image['rect']:
+        if sheet is not None:
+            self.atlas = sheet.convert_alpha()
 
-                # 4.1 : Creating a Rect object
-                img_rect = pygame_image.get_rect()
-                img_rect.move_ip(image['pos_x'], image['pos_y'])
+    def images_register(self, image, pygame_image):
+        """ Images register.
 
-                # 4.2 : Rect object storage
-                load_image['rect'] = img_rect
+        Store an image already loaded by Pygame.
 
-            self.images_list.append(load_image)
+        Args:
+            image(dict): Image description (see images_upload).
+            pygame_image(Surface): Image loaded by Pygame.
+
+        """
+
+        load_image = {
+            'name': image['name'],
+            'pygame_image': pygame_image,
+            'rect': None,
+        }
+
+        # OPTIONAL PHASE
+        if image['rect']:
+
+            # Creating a Rect object
+            img_rect = pygame_image.get_rect()
+            img_rect.move_ip(image['pos_x'], image['pos_y'])
+
+            # Rect object storage
+            load_image['rect'] = img_rect
 
-    def images_blit(self, img_name, surface, pos_x, pos_y):
+        self.images_list.append(load_image)
+        self.images_index[image['name']] = load_image
+
+    def images_blit(self, img_name, surface, pos_x, pos_y, pygame_image=None):
         """ Images blit
 
         Copy the image passed as parameter on the display surface.
@@ -107,13 +177,14 @@ class ImageManager():
             surface(instance) : Instance of Pygame Surface.
             pos_x(int) : Number of pixels to the right
             pos_y(int) : Number of pixels to the down
+            pygame_image(Surface) : Image given by get_surface, img_name
+            is not looked up when it is given.
 
         """
 
         # 1 : Recovery of the pygame image object
-        pygame_image = self.get_image(
-            image_name=img_name
-        )['pygame_image']
+        if pygame_image is None:
+            pygame_image = self.images_index[img_name]['pygame_image']
 
         # 2 : Copy the image to the surface received as parameter
         surface.blit(pygame_image, (pos_x, pos_y))
@@ -124,14 +195,22 @@ class ImageManager():
         Args:
             image_name(str): Image name.
 
+        Return:
+            Image dict or None if the image is not loaded.
+
         """
 
-        image = None
+        return self.images_index.get(image_name)
+
+    def get_surface(self, image_name):
+        """ Get the Pygame image of an image.
 
-        for image_dict in self.images_list:
+        Args:
+            image_name(str): Image name.
 
-            if image_dict['name'] == image_name:
+        Return:
+            Pygame Surface to give to images_blit.
 
-                image = image_dict
+        """
 
-        return image
+        return self.images_index[image_name]['pygame_image']
@@ -11,7 +11,7 @@ Pygame display : https://www.pygame.org/docs/ref/display.html
 Pygame mouse : https://www.pygame.org/docs/ref/mouse.html
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
@@ -27,9 +27,17 @@ import pygame.mouse
 from pygame.locals import *
 
 # PROGRAM IMPORTS
+from backend.grid import PATH
+from frontend.chunk_cache import ChunkCache
 from frontend.program_interface import ProgramInterface
 from settings import TILE_WIDTH
 from settings import TILE_HEIGHT
+from settings import VIEWPORT_WIDTH
+from settings import VIEWPORT_HEIGHT
+from settings import SCROLL_MARGIN
+from settings import CHUNK_SIZE
+from settings import CHUNK_CACHE_BUDGET
+from settings import DIRTY_RENDERING
 
 
 class LabyrinthInterface(ProgramInterface):
@@ -38,7 +46,10 @@ class LabyrinthInterface(ProgramInterface):
     This class can use this ProgramInterface methods :
 
     > create_surface(interface_name)
-    Create pygame Surface of interface.
+    Get pygame Surface of interface.
+
+    > activate()
+    Set the window caption.
 
     > upload_images(img_manager, img_list)
     Pygame upload images.
@@ -51,6 +62,272 @@ class LabyrinthInterface(ProgramInterface):
 
     """
 
+    menu_slots = {
+        'life': (5, 620),
+        'armor': (80, 620),
+        'key': (155, 620),
+        'sword': (220, 620)
+    }
+
+    tiles_images = {
+        'x': 'wall',
+        '0': 'wall0',
+        '1': 'wall1',
+        '2': 'wall2',
+        '3': 'wall3',
+        '4': 'wall4',
+        '5': 'wall5',
+        '6': 'wall6',
+        '7': 'wall7',
+        '8': 'wall8',
+        '9': 'wall9',
+        'c': 'path',
+        'f': 'fire',
+        'l': 'life',
+        'a': 'armor',
+        'k': 'key',
+        's': 'sword',
+        'P': 'character',
+        'A': 'guardian'
+    }
+
+    underlay_images = (
+        'life',
+        'armor',
+        'key',
+        'sword',
+        'character',
+        'guardian'
+    )
+
+    dynamic_images = (
+        'life',
+        'armor',
+        'key',
+        'sword',
+        'character'
+    )
+
+    # Labyrinth tiles, items, characters and menu images, known before the
+    # first game : Program preloads them (see AssetPreloader)
+    img_tiles = [
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'fire',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'path',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall0',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall1',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall2',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall3',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall4',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall5',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall6',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall7',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall8',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/tiles/',
+            'name': 'wall9',
+            'format': 'png',
+            'rect': False
+        }
+    ]
+
+    img_items = [
+        {
+            'address': 'static/images/labyrinth/items/',
+            'name': 'armor',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/items/',
+            'name': 'key',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/items/',
+            'name': 'sword',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/items/',
+            'name': 'life',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/items/',
+            'name': 'treasure',
+            'format': 'png',
+            'rect': False
+        }
+    ]
+
+    img_characters = [
+        {
+            'address': 'static/images/labyrinth/characters/',
+            'name': 'character',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/characters/',
+            'name': 'guardian',
+            'format': 'png',
+            'rect': False
+        }
+    ]
+
+    menu_elements = [
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'armor_off',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'armor_on',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'key_off',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'key_on',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'sword_off',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'sword_on',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'life_1',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'life_2',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'life_3',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'life_4',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'life_5',
+            'format': 'png',
+            'rect': False
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'game_retry_button',
+            'format': 'png',
+            'rect': True,
+            'pos_x': 280,
+            'pos_y': 620
+        },
+        {
+            'address': 'static/images/labyrinth/menu/',
+            'name': 'game_quit_button',
+            'format': 'png',
+            'rect': True,
+            'pos_x': 280,
+            'pos_y': 650
+        }
+    ]
+
+    # Music of the labyrinth, read by AssetPreloader and loaded once by
+    # SoundManager
+    labyrinth_sound = 'static/sounds/piste_audio.mp3'
+
     def __init__(self, program):
         """ Labyrinth interface initialization
 
@@ -62,14 +339,21 @@ class LabyrinthInterface(ProgramInterface):
             labyrinth_buttons(list): List of Pygame rect.
             labyrinth_surface(surface): Pygame surface.
             background_color(tuple): RGB color.
-            labyrinth_sound(str): Path to defeat sound.
-            img_tiles(list): Labyrinth tiles images.
-            img_items(list): Labyrinth items images.
-            img_characters(list): Labyrinth characters images.
-            menu_elements(list): Labyrinth menu images.
             tile_width(int): Labyrinth tiles width.
             tile_height(int): Labyrinth tiles height.
             game(instance): Instance of Game.
+            full_redraw(bool): Repaint the whole window on next display.
+            background_surface(surface): Static layer of the window.
+            view_surface(surface): Static layer of the visible labyrinth.
+            viewport(Rect): Area of the window showing the labyrinth.
+            camera_line(int): First labyrinth line in the viewport.
+            camera_column(int): First labyrinth column in the viewport.
+            dynamic_tiles(set): Visible tiles (line, column) drawn over
+            the static layer (items and character).
+            tiles_table(dict): Grid tile to (image, underlay, dynamic).
+            dynamic_codes(tuple): Grid tiles (bytes of one tile) drawn over
+            the static layer.
+            chunk_cache(instance): Instance of ChunkCache.
 
         """
 
@@ -81,225 +365,23 @@ class LabyrinthInterface(ProgramInterface):
         self.labyrinth_buttons = None
         self.labyrinth_surface = None
         self.background_color = 52, 52, 52
-        self.labyrinth_sound = 'static/sounds/piste_audio.mp3'
-
-        self.img_tiles = [
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'fire',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'path',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall0',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall1',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall2',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall3',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall4',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall5',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall6',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall7',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall8',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/tiles/',
-                'name': 'wall9',
-                'format': 'png',
-                'rect': False
-            }
-        ]
-
-        self.img_items = [
-            {
-                'address': 'static/images/labyrinth/items/',
-                'name': 'armor',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/items/',
-                'name': 'key',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/items/',
-                'name': 'sword',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/items/',
-                'name': 'life',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/items/',
-                'name': 'treasure',
-                'format': 'png',
-                'rect': False
-            }
-        ]
-
-        self.img_characters = [
-            {
-                'address': 'static/images/labyrinth/characters/',
-                'name':'character',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/characters/',
-                'name':'guardian',
-                'format': 'png',
-                'rect': False
-            }
-        ]
-
-        self.menu_elements = [
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'armor_off',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'armor_on',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'key_off',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'key_on',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'sword_off',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'sword_on',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'life_1',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'life_2',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'life_3',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'life_4',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'life_5',
-                'format': 'png',
-                'rect': False
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'game_retry_button',
-                'format': 'png',
-                'rect': True,
-                'pos_x': 280,
-                'pos_y': 620
-            },
-            {
-                'address': 'static/images/labyrinth/menu/',
-                'name': 'game_quit_button',
-                'format': 'png',
-                'rect': True,
-                'pos_x': 280,
-                'pos_y': 650
-            }
-        ]
-
         self.tile_width = TILE_WIDTH
         self.tile_height = TILE_HEIGHT
         self.game = self.program.game
+        self.full_redraw = True
+        self.background_surface = None
+        self.view_surface = None
+        self.viewport = pygame.Rect(0, 0, VIEWPORT_WIDTH, VIEWPORT_HEIGHT)
+        self.camera_line = 0
+        self.camera_column = 0
+        self.dynamic_tiles = set()
+        self.tiles_table = None
+        self.dynamic_codes = None
+        self.chunk_cache = ChunkCache(
+            render_chunk=self.render_chunk,
+            chunk_size=CHUNK_SIZE,
+            budget=CHUNK_CACHE_BUDGET
+        )
 
         self.labyrinth_initialization()
 
@@ -307,9 +389,7 @@ class LabyrinthInterface(ProgramInterface):
         """ Labyrinth initialization """
 
         self.labyrinth_surface = self.create_surface(
-            interface_name='Pygame Labyrinth - niveau {}'.format(
-                1
-            )
+            interface_name='Pygame Labyrinth'
         )
 
         # Upload labyrinth tiles
@@ -342,253 +422,580 @@ class LabyrinthInterface(ProgramInterface):
             img_list=self.menu_elements
         )
 
+        self.tiles_table = self.get_tiles_table()
+        self.dynamic_codes = tuple(
+            bytes((tile,))
+            for tile, (_, _, dynamic) in self.tiles_table.items()
+            if dynamic
+        )
+
+        self.labyrinth_reset()
+
+    def labyrinth_reset(self):
+        """ Labyrinth reset
+
+        Prepare the interface for the game of Program, without loading
+        the images again. Called by Program on each new game.
+
+        """
+
+        self.game = self.program.game
+
+        self.interface_name = 'Pygame Labyrinth - niveau {}'.format(
+            self.game.level
+        )
+
+        # Bake the static layer of the level
+        self.bake_background()
+
+        self.full_redraw = True
+
         # Get sound
         self.start_sound(
             sound_path=self.labyrinth_sound
         )
 
-    def display_menu(self):
-        """ Display the game menu """
+    def activate(self):
+        """ Activate
 
-        # Display the remaining life
-        life_img = "life_{}".format(
-            self.game.remaining_life
-        )
+        Set the window caption and repaint the whole window on the next
+        display.
 
-        self.img_manager.images_blit(
-            img_name=life_img,
-            surface=self.labyrinth_surface,
-            pos_x=5,
-            pos_y=620
-        )
+        """
 
-        # Display the recovery status of armor
-        if self.game.armor == 0:
-            armor_img = "armor_off"
-        else:
-            armor_img = "armor_on"
+        self.full_redraw = True
 
-        self.img_manager.images_blit(
-            img_name=armor_img,
-            surface=self.labyrinth_surface,
-            pos_x=80,
-            pos_y=620
-        )
+        super().activate()
 
-        # Display the recovery status of key
-        if self.game.key == 0:
-            key_img = "key_off"
-        else:
-            key_img = "key_on"
+    def get_tiles_table(self):
+        """ Get tiles table
 
-        self.img_manager.images_blit(
-            img_name=key_img,
-            surface=self.labyrinth_surface,
-            pos_x=155,
-            pos_y=620
-        )
+        Resolve once the image of each labyrinth tile.
 
+        Return:
+            dict: Grid tile (byte) to tuple
+            (Pygame image, path underlay, dynamic).
 
-        # Display the recovery status of sword
-        if self.game.sword == 0:
-            sword_img = "sword_off"
-        else:
-            sword_img = "sword_on"
+        """
 
-        self.img_manager.images_blit(
-            img_name=sword_img,
-            surface=self.labyrinth_surface,
-            pos_x=220,
-            pos_y=620
+        tiles_table = {}
+
+        for tile, name_image in self.tiles_images.items():
+
+            tiles_table[ord(tile)] = (
+                self.img_manager.get_surface(image_name=name_image),
+                name_image in self.underlay_images,
+                name_image in self.dynamic_images
+            )
+
+        return tiles_table
+
+    def bake_background(self):
+        """ Bake background
+
+        Draw once the parts of the window which never change while a
+        level is running (background and menu buttons), then the static
+        layer of the visible labyrinth (see bake_view).
+
+        """
+
+        # 1 : Window background
+        self.background_surface = pygame.Surface(
+            self.labyrinth_surface.get_size()
+        ).convert()
+
+        self.background_surface.fill(
+            self.background_color
         )
 
-        # Display the game menu buttons
         self.img_manager.images_blit(
             img_name="game_retry_button",
-            surface=self.labyrinth_surface,
+            surface=self.background_surface,
             pos_x=300,
             pos_y=620
         )
 
         self.img_manager.images_blit(
             img_name="game_quit_button",
-            surface=self.labyrinth_surface,
+            surface=self.background_surface,
             pos_x=300,
             pos_y=650
         )
 
+        # 2 : Visible labyrinth static layer
+        self.view_surface = pygame.Surface(
+            self.viewport.size
+        ).convert()
+
+        self.camera_line = 0
+        self.camera_column = 0
+        self.update_camera()
+
+        # The chunks of the previous level are obsolete
+        self.chunk_cache.clear()
+
+        self.bake_view()
+
+    def visible_range(self):
+        """ Visible range
+
+        Return:
+            tuple: (first line, end line, first column, end column) of
+            the labyrinth tiles in the viewport, end excluded.
+
+        """
+
+        grid = self.game.grid
+
+        view_lines = -(-self.viewport.height // self.tile_height)
+        view_columns = -(-self.viewport.width // self.tile_width)
+
+        return (
+            self.camera_line,
+            min(grid.height, self.camera_line + view_lines),
+            self.camera_column,
+            min(grid.width, self.camera_column + view_columns)
+        )
+
+    def render_chunk(self, chunk_line, chunk_column):
+        """ Render chunk
+
+        Draw the static layer of a chunk of tiles : walls, paths, fire
+        and arrival. Items and character tiles get a path.
+        Called by the chunk cache.
+
+        Args:
+            chunk_line(int): Line of the chunk.
+            chunk_column(int): Column of the chunk.
+
+        Return:
+            Pygame Surface of the chunk.
+
+        """
+
+        grid = self.game.grid
+        cells = grid.cells
+        tiles_table = self.tiles_table
+        chunk_size = self.chunk_cache.chunk_size
+
+        chunk_surface = pygame.Surface(
+            (chunk_size * self.tile_width, chunk_size * self.tile_height)
+        ).convert()
+
+        chunk_surface.fill(
+            self.background_color
+        )
+
+        path_image = self.img_manager.get_surface(image_name="path")
+
+        first_line = chunk_line * chunk_size
+        first_column = chunk_column * chunk_size
+
+        for line_number in range(
+                first_line, min(grid.height, first_line + chunk_size)):
+
+            pos_y = (line_number - first_line) * self.tile_height
+            line_start = line_number * grid.width
+
+            for column_number in range(
+                    first_column, min(grid.width, first_column + chunk_size)):
+
+                pos_x = (column_number - first_column) * self.tile_width
+
+                pygame_image, underlay, dynamic = tiles_table[
+                    cells[line_start + column_number]
+                ]
+
+                if underlay:
+                    chunk_surface.blit(path_image, (pos_x, pos_y))
+
+                if not dynamic:
+                    chunk_surface.blit(pygame_image, (pos_x, pos_y))
+
+        return chunk_surface
+
+    def bake_view(self):
+        """ Bake view
+
+        Copy the visible chunks of the static layer in the view, and list
+        the visible items and character tiles in dynamic_tiles to be
+        drawn over this layer.
+        Only the tiles of the viewport are used, whatever the size of the
+        labyrinth.
+
+        """
+
+        grid = self.game.grid
+        cells = grid.cells
+        chunk_size = self.chunk_cache.chunk_size
+
+        first_line, end_line, first_column, end_column = self.visible_range()
+
+        self.view_surface.fill(
+            self.background_color
+        )
+
+        # 1 : Static layer
+        for chunk_line in range(
+                first_line // chunk_size, (end_line - 1) // chunk_size + 1):
+
+            for chunk_column in range(
+                    first_column // chunk_size,
+                    (end_column - 1) // chunk_size + 1):
+
+                self.view_surface.blit(
+                    self.chunk_cache.get(chunk_line, chunk_column),
+                    (
+                        (chunk_column * chunk_size - first_column)
+                        * self.tile_width,
+                        (chunk_line * chunk_size - first_line)
+                        * self.tile_height
+                    )
+                )
+
+        # 2 : Visible items and character
+        self.dynamic_tiles = set()
+
+        for line_number in range(first_line, end_line):
+
+            line_start = line_number * grid.width
+
+            for tile in self.dynamic_codes:
+
+                index = cells.find(
+                    tile,
+                    line_start + first_column,
+                    line_start + end_column
+                )
+
+                while index != -1:
+
+                    self.dynamic_tiles.add(
+                        (line_number, index - line_start)
+                    )
+
+                    index = cells.find(
+                        tile,
+                        index + 1,
+                        line_start + end_column
+                    )
+
     @classmethod
-    def transform_type(cls, tile):
-        """ Return the image name of a type
+    def scroll(cls, camera, player, view_tiles, max_camera):
+        """ Scroll one axis of the viewport
+
+        Args:
+            camera(int): First visible tile.
+            player(int): Tile of the character.
+            view_tiles(int): Number of visible tiles.
+            max_camera(int): Last possible first visible tile.
+
+        Return:
+            int: New first visible tile.
+
+        """
+
+        margin = min(SCROLL_MARGIN, (view_tiles - 1) // 2)
+
+        # The character is too close from a border : center the viewport
+        if (player - margin < camera
+                or player + margin >= camera + view_tiles):
+            camera = player - view_tiles // 2
+
+        return min(max(camera, 0), max(max_camera, 0))
+
+    def update_camera(self):
+        """ Update camera
+
+        Scroll the viewport to follow the character.
+
+        Return:
+            bool: True if the viewport moved.
+
+        """
+
+        grid = self.game.grid
+        engine = self.game.engine
+
+        view_columns = self.viewport.width // self.tile_width
+        view_lines = self.viewport.height // self.tile_height
+
+        camera_column = self.scroll(
+            camera=self.camera_column,
+            player=engine.column_number,
+            view_tiles=view_columns,
+            max_camera=grid.width - view_columns
+        )
+
+        camera_line = self.scroll(
+            camera=self.camera_line,
+            player=engine.line_number,
+            view_tiles=view_lines,
+            max_camera=grid.height - view_lines
+        )
+
+        moved = (camera_column, camera_line) != (
+            self.camera_column, self.camera_line
+        )
+
+        self.camera_column = camera_column
+        self.camera_line = camera_line
+
+        return moved
+
+    def tile_rect(self, line_number, column_number):
+        """ Tile rect
 
         Args:
-            tile(str): Tile content.
+            line_number(int): Line of the tile.
+            column_number(int): Column of the tile.
 
         Return:
-            image name.
+            Pygame rect of the tile in the window.
+
+        """
+
+        return pygame.Rect(
+            self.viewport.x
+            + (column_number - self.camera_column) * self.tile_width,
+            self.viewport.y
+            + (line_number - self.camera_line) * self.tile_height,
+            self.tile_width,
+            self.tile_height
+        )
+
+    def restore_background(self, area):
+        """ Restore background
+
+        Args:
+            area(Rect): Area of the window to clean.
+
+        """
+
+        self.labyrinth_surface.blit(
+            self.background_surface,
+            area,
+            area
+        )
+
+    def restore_tile(self, area):
+        """ Restore the static layer of a tile
+
+        Args:
+            area(Rect): Area of the tile in the window.
 
         """
 
-        images = [
-            {
-                'name': 'wall',
-                'tile': 'x'
-            },
-            {
-                'name': 'wall0',
-                'tile': '0'
-            },
-            {
-                'name': 'wall1',
-                'tile': '1'
-            },
-            {
-                'name': 'wall2',
-                'tile': '2'
-            },
-            {
-                'name': 'wall3',
-                'tile': '3'
-            },
-            {
-                'name': 'wall4',
-                'tile': '4'
-            },
-            {
-                'name': 'wall5',
-                'tile': '5'
-            },
-            {
-                'name': 'wall6',
-                'tile': '6'
-            },
-            {
-                'name': 'wall7',
-                'tile': '7'
-            },
-            {
-                'name': 'wall8',
-                'tile': '8'
-            },
-            {
-                'name': 'wall9',
-                'tile': '9'
-            },
-            {
-                'name': 'path',
-                'tile': 'c'
-            },
-            {
-                'name': 'fire',
-                'tile': 'f'
-            },
-            {
-                'name': 'life',
-                'tile': 'l'
-            },
-            {
-                'name': 'armor',
-                'tile': 'a'
-            },
-            {
-                'name': 'key',
-                'tile': 'k'
-            },
-            {
-                'name': 'sword',
-                'tile': 's'
-            },
-            {
-                'name': 'character',
-                'tile': 'P'
-            },
-            {
-                'name': 'guardian',
-                'tile': 'A'
-            },
+        self.labyrinth_surface.blit(
+            self.view_surface,
+            area,
+            area.move(
+                -self.viewport.x,
+                -self.viewport.y
+            )
+        )
+
+    def display_menu_slot(self, slot, restore=False):
+        """ Display one slot of the game menu
+
+        Args:
+            slot(str): 'life', 'armor', 'key' or 'sword'.
+            restore(bool): Clean the slot with the background before.
+
+        Return:
+            Pygame rect of the slot.
+
+        """
+
+        # Display the remaining life
+        if slot == "life":
+            slot_img = "life_{}".format(
+                self.game.engine.remaining_life
+            )
+        # Display the recovery status of armor, key or sword
+        elif getattr(self.game.engine, slot) == 0:
+            slot_img = "{}_off".format(slot)
+        else:
+            slot_img = "{}_on".format(slot)
+
+        pos_x, pos_y = self.menu_slots[slot]
+
+        slot_rect = self.img_manager.get_image(
+            image_name=slot_img
+        )['pygame_image'].get_rect(
+            topleft=(pos_x, pos_y)
+        )
+
+        if restore:
+            self.restore_background(area=slot_rect)
+
+        self.img_manager.images_blit(
+            img_name=slot_img,
+            surface=self.labyrinth_surface,
+            pos_x=pos_x,
+            pos_y=pos_y
+        )
+
+        return slot_rect
+
+    def display_menu(self):
+        """ Display the game menu """
+
+        for slot in self.menu_slots:
+            self.display_menu_slot(slot=slot)
+
+    def display_tile(self, line_number, column_number, restore=False):
+        """ Display one tile of the labyrinth
+
+        Only items and character are drawn, the rest of the tile comes
+        from the static layer.
+
+        Args:
+            line_number(int): Line of the tile.
+            column_number(int): Column of the tile.
+            restore(bool): Clean the tile with the static layer before.
+
+        Return:
+            Pygame rect of the tile, None if the tile is not visible.
+
+        """
+
+        pygame_image, _, dynamic = self.tiles_table[
+            self.game.grid.get(line_number, column_number)
         ]
 
-        for image in images:
+        tile_rect = self.tile_rect(
+            line_number=line_number,
+            column_number=column_number
+        ).clip(self.viewport)
 
-            if image['tile'] == tile:
-                name_image = image['name']
+        if not tile_rect:
+            self.dynamic_tiles.discard((line_number, column_number))
+            return None
 
-        return name_image
+        if dynamic:
+            self.dynamic_tiles.add((line_number, column_number))
+        else:
+            self.dynamic_tiles.discard((line_number, column_number))
+
+        if restore:
+            self.restore_tile(area=tile_rect)
+
+        if dynamic:
+
+            self.labyrinth_surface.set_clip(self.viewport)
+
+            self.img_manager.images_blit(
+                img_name=None,
+                surface=self.labyrinth_surface,
+                pos_x=self.viewport.x
+                + (column_number - self.camera_column) * self.tile_width,
+                pos_y=self.viewport.y
+                + (line_number - self.camera_line) * self.tile_height,
+                pygame_image=pygame_image
+            )
+
+            self.labyrinth_surface.set_clip(None)
+
+        return tile_rect
 
     def display_labyrinth(self):
-        """ Display the labyrinth """
+        """ Display the labyrinth in the viewport """
 
-        line_number = 0 # X
-        column_number = 0 # Y
+        self.labyrinth_surface.blit(
+            self.view_surface,
+            self.viewport
+        )
 
-        tile = ""
-        blit_path = 0
+        for line_number, column_number in list(self.dynamic_tiles):
 
-        for labyrinth_line in self.program.game.labyrinth:
+            self.display_tile(
+                line_number=line_number,
+                column_number=column_number
+            )
 
-            for labyrinth_tile in labyrinth_line:
+    def display_changes(self):
+        """ Display the tiles and menu slots modified by the game
 
-                tile = labyrinth_tile
+        Only the modified areas of the window are updated.
 
-                if column_number == len(self.program.game.labyrinth):
-                    column_number = 0
+        """
 
-                name_image = self.transform_type(tile=tile)
+        dirty_tiles, dirty_menu = self.game.pop_changes()
+        dirty_rects = []
 
-                if name_image == "life":
-                    blit_path += 1
-                elif name_image == "armor":
-                    blit_path += 1
-                elif name_image == "key":
-                    blit_path += 1
-                elif name_image == "sword":
-                    blit_path += 1
-                elif name_image == "character":
-                    blit_path += 1
-                elif name_image == "guardian":
-                    blit_path += 1
+        # A modified wall, fire or arrival is in the static layer
+        static_changed = False
 
-                if blit_path == 1:
+        for line_number, column_number in dirty_tiles:
 
-                    self.img_manager.images_blit(
-                        img_name="path",
-                        surface=self.labyrinth_surface,
-                        pos_x=column_number * self.tile_width,
-                        pos_y=line_number * self.tile_height
-                    )
+            tile = self.game.grid.get(line_number, column_number)
 
-                    self.img_manager.images_blit(
-                        img_name=name_image,
-                        surface=self.labyrinth_surface,
-                        pos_x=column_number * self.tile_width,
-                        pos_y=line_number * self.tile_height
-                    )
+            if tile != PATH and not self.tiles_table[tile][2]:
 
-                    blit_path = 0
+                self.chunk_cache.invalidate_tile(
+                    line_number=line_number,
+                    column_number=column_number
+                )
+                static_changed = True
 
-                else:
+        # The whole viewport changes when the labyrinth scrolls
+        if self.update_camera() or static_changed:
 
-                    self.img_manager.images_blit(
-                        img_name=name_image,
-                        surface=self.labyrinth_surface,
-                        pos_x=column_number * self.tile_width,
-                        pos_y=line_number * self.tile_height
-                    )
+            self.bake_view()
+            self.display_labyrinth()
 
-                column_number += 1
+            dirty_rects.append(self.viewport)
 
-            line_number += 1
+        else:
+
+            for line_number, column_number in dirty_tiles:
+
+                tile_rect = self.display_tile(
+                    line_number=line_number,
+                    column_number=column_number,
+                    restore=True
+                )
+
+                if tile_rect:
+                    dirty_rects.append(tile_rect)
+
+        for slot in dirty_menu:
+
+            dirty_rects.append(
+                self.display_menu_slot(
+                    slot=slot,
+                    restore=True
+                )
+            )
+
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
 
     def display(self):
         """ Display the labyrinth interface """
 
-        self.labyrinth_surface.fill(
-            self.background_color
+        if DIRTY_RENDERING and not self.full_redraw:
+            self.display_changes()
+            return
+
+        # Modified tiles may hold new items or the character
+        dirty_tiles, _ = self.game.pop_changes()
+        self.dynamic_tiles.update(dirty_tiles)
+
+        if self.update_camera():
+            self.bake_view()
+
+        self.labyrinth_surface.blit(
+            self.background_surface,
+            (0, 0)
         )
 
         self.display_labyrinth()
         self.display_menu()
 
+        self.full_redraw = False
+
         pygame.display.flip()
 
     def event_loop(self, event):
@@ -599,6 +1006,10 @@ class LabyrinthInterface(ProgramInterface):
 
         """
 
+        # The window content has been lost
+        if event.type == VIDEOEXPOSE:
+            self.full_redraw = True
+
         if event.type == MOUSEBUTTONDOWN:
 
             mouse_pos = pygame.mouse.get_pos()
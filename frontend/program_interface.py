@@ -8,10 +8,9 @@
 ! For more informations about this app, consult : README.md
 Pygame : https://www.pygame.org/docs/
 Pygame display : https://www.pygame.org/docs/ref/display.html
-Pygame mixer : https://www.pygame.org/docs/ref/mixer.html
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
@@ -23,11 +22,6 @@ By : Guillaume SADLER - https://github.com/GRELDAS
 
 # LIBRARY IMPORTS
 import pygame.display
-import pygame.mixer
-
-# PROGRAM IMPORTS
-from settings import WINDOW_WIDTH
-from settings import WINDOW_HEIGHT
 
 
 class ProgramInterface():
@@ -41,9 +35,15 @@ class ProgramInterface():
 
     """
 
-    @classmethod
-    def create_surface(cls, interface_name):
-        """ Create pygame Surface of interface.
+    # Set by the inheriting interfaces (see create_surface)
+    program = None
+    interface_name = None
+
+    def create_surface(self, interface_name):
+        """ Get pygame Surface of interface.
+
+        The window is created once by Program and shared by all interfaces,
+        only the caption changes (see activate).
 
         Args:
             interface_name(str): Interface name.
@@ -53,17 +53,20 @@ class ProgramInterface():
 
         """
 
-        pygame.display.init()
+        self.interface_name = interface_name
 
-        pygame.display.set_caption(
-            interface_name
-        )
+        return self.program.window_surface
 
-        window_surface = pygame.display.set_mode(
-            (WINDOW_WIDTH, WINDOW_HEIGHT)
-        )
+    def activate(self):
+        """ Activate
+
+        Called by Program when the interface becomes the displayed one.
+
+        """
 
-        return window_surface
+        pygame.display.set_caption(
+            self.interface_name
+        )
 
     @classmethod
     def upload_images(cls, img_manager, img_list):
@@ -108,24 +111,17 @@ class ProgramInterface():
 
         return buttons
 
-    @classmethod
-    def start_sound(cls, sound_path):
+    def start_sound(self, sound_path):
         """ Start Pygame mixer sound.
 
+        The music keeps playing if it is already started (see
+        SoundManager).
+
         Args:
             sound_path(str): Path of sound to load.
 
         """
 
-        pygame.mixer.init()
-
-        pygame.mixer.music.load(
-            sound_path
-        )
-
-        # Volume adjustment
-        pygame.mixer.music.set_volume(
-            0.1
+        self.program.sound_manager.music_play(
+            music_path=sound_path
         )
-
-        pygame.mixer.music.play()
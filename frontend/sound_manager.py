@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+""" Sound manager
+
+### REQUIREMENTS
+> Pygame 1.9.6
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Pygame : https://www.pygame.org/docs/
+Pygame mixer : https://www.pygame.org/docs/ref/mixer.html
+Pygame music : https://www.pygame.org/docs/ref/music.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import pygame
+import pygame.mixer
+
+# PROGRAM IMPORTS
+from backend.engine import ITEM
+from backend.engine import WIN
+from backend.engine import DEFEAT
+from settings import MUSIC_VOLUME
+
+
+class SoundManager():
+    """ Sound manager
+
+    The mixer is initialized once by Program. The sound effects are
+    decoded once, each one plays on its own channel when its engine event
+    comes : an effect never interrupts another one. The music is loaded
+    once, from the bytes read by AssetPreloader, then streamed in a loop :
+    it keeps playing from a game to the next one, and no file is read
+    during the games.
+
+    Without audio device or sound file, the program runs without sound.
+
+    """
+
+    sound_effects = {
+        ITEM: 'static/sounds/get_item.wav',
+        WIN: 'static/sounds/win.wav',
+        DEFEAT: 'static/sounds/defeat.wav'
+    }
+
+    def __init__(self):
+        """ Sound manager initialization
+
+        Attributes:
+            enabled(bool): The mixer is initialized.
+            sounds(dict): Engine event to (Pygame Sound, Pygame Channel).
+            music_path(str): Path of the loaded music, None if no music.
+            music_file(BytesIO): Loaded music, kept while it is streamed.
+
+        """
+
+        self.enabled = False
+        self.sounds = {}
+        self.music_path = None
+        self.music_file = None
+
+    def sound_initialization(self):
+        """ Sound initialization
+
+        Initialize the mixer, reserve a channel for each sound effect and
+        decode them. The music is loaded by music_load, when it is read.
+
+        """
+
+        # Small buffer : the effects play as soon as their event comes
+        pygame.mixer.pre_init(buffer=512)
+
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return
+
+        self.enabled = True
+
+        pygame.mixer.set_reserved(len(self.sound_effects))
+
+        for channel_id, (event, sound_path) in enumerate(
+                self.sound_effects.items()
+        ):
+
+            try:
+                sound = pygame.mixer.Sound(sound_path)
+            except (pygame.error, FileNotFoundError):
+                continue
+
+            self.sounds[event] = sound, pygame.mixer.Channel(channel_id)
+
+    def engine_event(self, event, engine):
+        """ Engine event
+
+        Play the sound effect of an engine event.
+
+        Args:
+            event(str): Event name (see backend.engine).
+            engine(instance): Engine instance.
+
+        """
+
+        sound = self.sounds.get(event)
+
+        if sound is not None:
+            sound[1].play(sound[0])
+
+    def music_load(self, music_path, music_file):
+        """ Music load
+
+        Load the music once, before the first game.
+
+        Args:
+            music_path(str): Path of the music.
+            music_file(BytesIO): Content of the music file, None if it
+            could not be read.
+
+        """
+
+        if not self.enabled or music_file is None:
+            return
+
+        try:
+            pygame.mixer.music.load(music_file)
+        except pygame.error:
+            return
+
+        pygame.mixer.music.set_volume(MUSIC_VOLUME)
+
+        self.music_path = music_path
+        self.music_file = music_file
+
+    def music_play(self, music_path):
+        """ Music play
+
+        Start the loaded music from its beginning if it is not playing.
+
+        Args:
+            music_path(str): Path of the music.
+
+        """
+
+        if not self.enabled or music_path != self.music_path:
+            return
+
+        if not pygame.mixer.music.get_busy():
+            pygame.mixer.music.play(-1)
+
+    def music_stop(self):
+        """ Music stop
+
+        The music stays loaded, music_play starts it again.
+
+        """
+
+        if self.enabled:
+            pygame.mixer.music.stop()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+""" Texture atlas
+
+This module packs the images of the program into one sheet and writes
+its index (JSON) : the size of the sheet and, for each image, its
+rectangle in the sheet. ImageManager loads the sheet once and serves the
+images as subsurfaces of the sheet, the images which are not in the index
+are loaded from their own file.
+
+The sheet is stored as raw RGBA pixels, not as PNG : it is read without
+decoding (decoding the PNG images takes most of their loading time).
+
+The sheet and its index are build artifacts (not versioned), build them
+from the root of the project after each change of an image :
+
+    python -m frontend.texture_atlas
+
+An atlas older than one of its images is not used (with a warning), the
+images are loaded from their own file until it is built again.
+
+### REQUIREMENTS
+> Pygame 1.9.6
+
+#### DOCUMENTATIONS
+! For more informations about this app, consult : README.md
+Pygame image : https://www.pygame.org/docs/ref/image.html
+Pygame surface : https://www.pygame.org/docs/ref/surface.html
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import argparse
+import json
+import os
+import warnings
+
+import pygame
+import pygame.image
+
+# PROGRAM IMPORTS
+from settings import ATLAS_SHEET
+from settings import ATLAS_INDEX
+
+# Directories of the images displayed by the program
+ATLAS_DIRECTORIES = (
+    'static/images/home/',
+    'static/images/labyrinth/characters/',
+    'static/images/labyrinth/items/',
+    'static/images/labyrinth/menu/',
+    'static/images/labyrinth/tiles/',
+    'static/images/win/',
+    'static/images/defeat/'
+)
+
+ATLAS_WIDTH = 1024
+
+
+def pack(sizes, max_width=ATLAS_WIDTH):
+    """ Pack rectangles in shelves
+
+    The rectangles are placed from the highest to the lowest, from left
+    to right, a new shelf starts under the previous one when a rectangle
+    does not fit in the width.
+
+    Args:
+        sizes(dict): Key to (width, height) of the rectangles.
+        max_width(int): Width of the sheet.
+
+    Return:
+        tuple: (key to (x, y, width, height), width, height of the sheet).
+
+    """
+
+    rects = {}
+    shelf_x = shelf_y = shelf_height = sheet_width = 0
+
+    for key, (width, height) in sorted(
+            sizes.items(), key=lambda item: (-item[1][1], -item[1][0])
+    ):
+
+        if shelf_x + width > max_width and shelf_x:
+            shelf_y += shelf_height
+            shelf_x = shelf_height = 0
+
+        rects[key] = (shelf_x, shelf_y, width, height)
+
+        shelf_x += width
+        shelf_height = max(shelf_height, height)
+        sheet_width = max(sheet_width, shelf_x)
+
+    return rects, sheet_width, shelf_y + shelf_height
+
+
+def build_atlas(directories=ATLAS_DIRECTORIES, sheet_path=ATLAS_SHEET,
+                index_path=ATLAS_INDEX):
+    """ Build the sheet and the index of the images
+
+    Args:
+        directories(tuple): Directories of the PNG images to pack.
+        sheet_path(str): Path of the sheet.
+        index_path(str): Path of the index.
+
+    Return:
+        int: Number of packed images.
+
+    """
+
+    images = {}
+
+    for directory in directories:
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.endswith('.png'):
+                # The key is the path built by ImageManager.images_upload
+                path = directory + file_name
+                images[path] = pygame.image.load(path)
+
+    rects, width, height = pack(
+        {path: image.get_size() for path, image in images.items()}
+    )
+
+    sheet = pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+    for path, image in images.items():
+        sheet.blit(image, rects[path][:2])
+
+    with open(sheet_path, 'wb') as sheet_file:
+        sheet_file.write(pygame.image.tostring(sheet, 'RGBA'))
+
+    with open(index_path, 'w') as index_file:
+        json.dump(
+            {'size': (width, height), 'images': rects},
+            index_file,
+            indent=1,
+            sort_keys=True
+        )
+
+    return len(images)
+
+
+def load_atlas(sheet_path=ATLAS_SHEET, index_path=ATLAS_INDEX):
+    """ Load the sheet and its index
+
+    The sheet is not converted to the format of the display (see
+    ImageManager.atlas_load).
+
+    Args:
+        sheet_path(str): Path of the sheet.
+        index_path(str): Path of the index.
+
+    Return:
+        tuple: (sheet, image path to (x, y, width, height) in the sheet),
+        (None, {}) if the atlas is not built or out of date.
+
+    """
+
+    try:
+        with open(index_path, 'r') as index_file:
+            index = json.load(index_file)
+            built = os.fstat(index_file.fileno()).st_mtime_ns
+
+        with open(sheet_path, 'rb') as sheet_file:
+            pixels = sheet_file.read()
+            built = min(built, os.fstat(sheet_file.fileno()).st_mtime_ns)
+
+    except FileNotFoundError:
+        return None, {}
+
+    width, height = index['size']
+
+    if len(pixels) != width * height * 4:
+        return None, {}
+
+    rects = {path: tuple(rect) for path, rect in index['images'].items()}
+
+    for path in rects:
+
+        try:
+            out_of_date = os.stat(path).st_mtime_ns > built
+        except FileNotFoundError:
+            out_of_date = True
+
+        if out_of_date:
+            warnings.warn(
+                "The texture atlas is older than {}, the images are loaded "
+                "from their own file. Build it again : python -m "
+                "frontend.texture_atlas".format(path)
+            )
+            return None, {}
+
+    sheet = pygame.image.frombuffer(pixels, (width, height), 'RGBA')
+
+    return sheet, rects
+
+
+def main():
+    """ Build the texture atlas """
+
+    parser = argparse.ArgumentParser(
+        description="Pack the images of the program into one sheet"
+    )
+    parser.add_argument("--sheet", default=ATLAS_SHEET)
+    parser.add_argument("--index", default=ATLAS_INDEX)
+
+    args = parser.parse_args()
+
+    images_number = build_atlas(
+        sheet_path=args.sheet,
+        index_path=args.index
+    )
+
+    print("{} images packed in {}".format(images_number, args.sheet))
+
+
+if __name__ == "__main__":
+
+    main()
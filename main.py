@@ -2,13 +2,52 @@
 #! /usr/bin/env python3
 """ Pygame labyrinth
 
+Start the game :
+
+    python main.py
+
+Start the game and print the durations of the imports and of the steps
+of the initialization, until the first home frame is displayed :
+
+    python main.py --profile-startup
+
+Start the game and print the display times of the frames when it quits :
+
+    python main.py --frame-stats
+
+Record each game in a directory, replay a recorded game :
+
+    python main.py --record recordings
+    python main.py --replay recordings/20261018-120000-level-1-42.rec
+
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
 
-from backend.program import Program
+import argparse
+from time import perf_counter
+
+
+def print_startup_profile(title, startup_stats):
+    """ Print startup profile
+
+    Args:
+        title(str): Title of the profile.
+        startup_stats(dict): Step name to duration of the step (ms).
+
+    """
+
+    print(title)
+
+    for step_name, duration in startup_stats.items():
+        print("  {:<20} {:8.1f} ms".format(step_name, duration))
+
+    print("  {:<20} {:8.1f} ms".format(
+        'total', sum(startup_stats.values())
+    ))
+
 
 def main():
     """ Main function
@@ -17,9 +56,84 @@ def main():
 
     """
 
+    parser = argparse.ArgumentParser(description="Pygame labyrinth")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print the startup durations until the first home frame"
+    )
+    parser.add_argument(
+        "--frame-stats",
+        action="store_true",
+        help="print the display times of the frames when the game quits"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIRECTORY",
+        help="record each game in DIRECTORY"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="RECORDING",
+        help="replay a recorded game"
+    )
+
+    args = parser.parse_args()
+
+    import_start = perf_counter()
+
+    # Imported here to measure the import of Pygame and of the program
+    import pygame
+    pygame_end = perf_counter()
+    from backend.program import Program
+    program_end = perf_counter()
+
     program = Program()
+
+    if args.profile_startup:
+
+        frame_start = perf_counter()
+        program.active_interface.display()
+        frame_end = perf_counter()
+
+        startup_stats = {
+            'pygame import': (pygame_end - import_start) * 1000,
+            'program imports': (program_end - pygame_end) * 1000
+        }
+        startup_stats.update(program.startup_stats)
+        startup_stats['first home frame'] = (frame_end - frame_start) * 1000
+
+        print_startup_profile(
+            "Until the first home frame (Pygame {}) :".format(
+                pygame.version.ver
+            ),
+            startup_stats
+        )
+
+        # Done by the program loop after the first frame
+        program.startup_stats.clear()
+        program.preload_assets()
+
+        print_startup_profile(
+            "After the first home frame :",
+            program.startup_stats
+        )
+
+    program.print_frame_stats = args.frame_stats
+
+    if args.record is not None:
+        program.recordings_directory = args.record
+
+    if args.replay is not None:
+
+        # Imported here, only needed by a replay
+        from backend.recording import Recording
+
+        program.replay(Recording.read(args.replay))
+
     program.program_loop()
 
+
 if __name__ == "__main__":
 
     main()
@@ -2,13 +2,14 @@
 """ Settings
 
 ### MODIFICATIONS
-Last modification date : 03/09/2019
+Last modification date : 18/10/2026
 By : Guillaume SADLER - https://github.com/GRELDAS
 
 """
 
 # AVAILABLE LEVELS
-LEVELS = 2
+# Levels 1 and 2 are level files, level 3 is generated (see Labyrinth)
+LEVELS = 3
 
 # SIZE OF THE WINDOW
 WINDOW_WIDTH = 495
@@ -17,3 +18,60 @@ WINDOW_HEIGHT = 685
 # LABYRINTH TILES SIZE
 TILE_WIDTH = 33
 TILE_HEIGHT = 41
+
+# AREA OF THE WINDOW WHERE THE LABYRINTH IS DISPLAYED
+VIEWPORT_WIDTH = 495
+VIEWPORT_HEIGHT = 615
+
+# Minimum number of tiles between the character and the viewport borders
+# before the labyrinth scrolls
+SCROLL_MARGIN = 3
+
+# The static layer of the labyrinth is drawn by chunks of CHUNK_SIZE x
+# CHUNK_SIZE tiles, kept in a cache of CHUNK_CACHE_BUDGET bytes at most
+CHUNK_SIZE = 16
+CHUNK_CACHE_BUDGET = 32 * 1024 * 1024
+
+# LEVEL FILES
+# The level files are parsed once per process. With LEVEL_CACHE_REVALIDATE,
+# each new game checks the modification time of its level file and parses
+# it again if it changed (level editing)
+LEVEL_CACHE_REVALIDATE = False
+
+# ITEMS
+# Seed of the placement of the items, the same placement for each game
+# (benchmarks, tests), a new placement for each game if None. A signed 64
+# bits integer, to be recorded (see backend.recording)
+ITEMS_SEED = None
+
+# RENDERING
+# Redraw only the tiles and menu slots modified since the last frame
+DIRTY_RENDERING = True
+
+# FRAME PACING
+# 'event' : sleep until an event comes, then display a new frame
+# 'fps' : display frames continuously, FPS frames per second at most
+PACING_MODE = 'event'
+FPS = 60
+
+# TEXTURE ATLAS
+# Sheet of the images and its index, built by python -m frontend.texture_atlas
+# (see README). The images are loaded from their own file without them
+ATLAS_SHEET = 'static/images/atlas.rgba'
+ATLAS_INDEX = 'static/images/atlas.json'
+
+# ASSET PRELOADING
+# Number of threads decoding the images of the labyrinth while the home
+# interface is displayed
+PRELOAD_WORKERS = 4
+
+# SOUNDS
+# Volume of the music, from 0 to 1
+MUSIC_VOLUME = 0.1
+
+# RECORDINGS
+# Directory where each game is recorded (level, seed of the items and
+# moves, see backend.recording), no recording if None. Replayed games move
+# REPLAY_MOVES_PER_SECOND times per second
+RECORDINGS_DIRECTORY = None
+REPLAY_MOVES_PER_SECOND = 8
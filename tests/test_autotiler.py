@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+""" Autotiler tests
+
+The shipped levels, with all their walls written 'x', are autotiled to
+their own glyphs. The digit walls keep their glyph.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import os
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend.autotiler import WALL_GLYPHS_8
+from backend.autotiler import autotile
+from backend.grid import Grid
+from backend.grid import WALLS
+from backend.labyrinth import LABYRINTHS_DIRECTORY
+
+# Tile to 'x' for the walls, the other tiles are kept
+WALLS_TO_X = bytes(
+    ord('x') if tile in WALLS else tile for tile in range(256)
+)
+
+# Walls (line, column) of the shipped levels whose glyph is not the glyph
+# of their neighbours : the author forced it
+FORCED_GLYPHS = [(7, 1), (8, 0), (8, 1), (11, 14)]
+
+
+def level_text(level):
+    """ Text of the txt level file of a level, without the last newline """
+
+    with open(
+            os.path.join(LABYRINTHS_DIRECTORY, "level-{}.txt".format(level)),
+            'r'
+    ) as level_file:
+        return level_file.read().rstrip('\n')
+
+
+def walls_to_x(labyrinth_txt, kept=()):
+    """ Grid of a labyrinth with its walls written 'x'
+
+    Args:
+        labyrinth_txt(str): Labyrinth.
+        kept(list): Walls (line, column) which keep their glyph.
+
+    """
+
+    grid = Grid.from_text(labyrinth_txt)
+    glyphs = [grid.get(*wall) for wall in kept]
+
+    grid.cells[:] = grid.cells.translate(WALLS_TO_X)
+
+    for wall, glyph in zip(kept, glyphs):
+        grid.set(*wall, glyph)
+
+    return grid
+
+
+@pytest.mark.parametrize("level", [1, 2])
+@pytest.mark.parametrize("glyphs", [None, WALL_GLYPHS_8])
+def test_shipped_levels_are_autotiled_unchanged(level, glyphs):
+
+    labyrinth_txt = level_text(level)
+    grid = walls_to_x(labyrinth_txt, kept=FORCED_GLYPHS)
+
+    assert len(grid.find_all(WALLS[1:])) == len(FORCED_GLYPHS)
+
+    if glyphs is None:
+        autotile(grid)
+    else:
+        autotile(grid, glyphs=glyphs)
+
+    assert grid.to_text() == labyrinth_txt
+
+
+@pytest.mark.parametrize("level", [1, 2])
+def test_only_the_forced_glyphs_differ(level):
+
+    labyrinth_txt = level_text(level)
+    level_grid = Grid.from_text(labyrinth_txt)
+    grid = walls_to_x(labyrinth_txt)
+
+    autotile(grid)
+
+    assert [
+        divmod(index, grid.width)
+        for index, (tile, level_tile) in enumerate(
+            zip(grid.cells, level_grid.cells)
+        )
+        if tile != level_tile
+    ] == FORCED_GLYPHS
+
+
+def test_digit_walls_keep_their_glyph():
+
+    grid = Grid.from_text("ccc\nx5x\nccc")
+    autotile(grid)
+
+    assert grid.to_text() == "ccc\n259\nccc"
+
+
+def test_wall_masks():
+
+    grid = Grid.from_text("xcx\nccx\nxxx")
+    autotile(grid)
+
+    assert grid.to_text() == "xc8\ncc4\n206"
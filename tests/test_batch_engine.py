@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+""" Batch engine tests
+
+Each game of a BatchEngine ends each step in the state of an Engine
+playing the same moves. Requires NumPy.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import pytest
+
+numpy = pytest.importorskip("numpy")
+
+# PROGRAM IMPORTS
+# pylint: disable=wrong-import-position
+from backend.batch_engine import BatchEngine
+from backend.batch_engine import MOVEMENT_NAMES
+from backend.batch_engine import RUNNING
+from backend.batch_engine import WIN
+from backend.batch_engine import DEFEAT
+from backend.batch_engine import random_policy
+from backend.engine import Engine
+from backend.engine import WIN as ENGINE_WIN
+from backend.engine import DEFEAT as ENGINE_DEFEAT
+from backend.grid import Grid
+from backend.labyrinth import Labyrinth
+
+RESULTS = {None: RUNNING, ENGINE_WIN: WIN, ENGINE_DEFEAT: DEFEAT}
+
+GAMES = 200
+STEPS = 300
+
+
+def assert_same_games(batch_engine, engines):
+    """ Compare the games of a batch engine with engines """
+
+    lines, columns = batch_engine.positions()
+
+    for game, engine in enumerate(engines):
+
+        assert (lines[game], columns[game]) == (
+            engine.line_number, engine.column_number
+        )
+        assert batch_engine.remaining_life[game] == engine.remaining_life
+        assert batch_engine.items[game] == engine.items
+        assert batch_engine.result[game] == RESULTS[engine.result]
+
+
+def play_both(grid, movements, remaining_life=5):
+    """ Play the same moves with a batch engine and with engines
+
+    Args:
+        grid(Grid): Labyrinth with items.
+        movements(ndarray): Movement ids, one line per step.
+        remaining_life(int): Player remaining life at the start.
+
+    """
+
+    games = movements.shape[1]
+    batch_engine = BatchEngine(
+        grid=grid, games=games, remaining_life=remaining_life
+    )
+    engines = [
+        Engine(grid=grid.copy(), remaining_life=remaining_life)
+        for _ in range(games)
+    ]
+
+    for step_movements in movements:
+
+        batch_engine.step(step_movements)
+
+        for engine, movement_id in zip(engines, step_movements):
+            engine.apply_move(MOVEMENT_NAMES[movement_id])
+
+        assert_same_games(batch_engine, engines)
+
+    return batch_engine
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_random_moves_on_the_levels(level):
+
+    generator = numpy.random.default_rng(level)
+    grid = Labyrinth(level=level, seed=level).grid
+
+    play_both(
+        grid,
+        generator.integers(0, 4, (STEPS, GAMES), dtype=numpy.int8),
+        remaining_life=2
+    )
+
+    # The batch engine does not modify the grid
+    assert grid.cells == Labyrinth(level=level, seed=level).grid.cells
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_winning_routes_on_the_levels(level):
+
+    labyrinth = Labyrinth(level=level, seed=level)
+    _, movement_names = labyrinth.get_solver().solve_states(fire_cost=1)
+    route = [MOVEMENT_NAMES.index(name) for name in movement_names]
+
+    # Game n follows the winning route for its n / GAMES first moves, then
+    # moves at random : the last game wins
+    generator = numpy.random.default_rng(level)
+    movements = generator.integers(
+        0, 4, (len(route) + 10, GAMES), dtype=numpy.int8
+    )
+
+    for game in range(GAMES):
+        followed = len(route) * (game + 1) // GAMES
+        movements[:followed, game] = route[:followed]
+
+    batch_engine = play_both(labyrinth.grid, movements)
+
+    assert batch_engine.result[-1] == WIN
+
+
+def test_items_fire_and_arrival():
+
+    grid = Grid.from_text("Plakf\nsxxxx\nAxxxx")
+    right, left, down = (
+        MOVEMENT_NAMES.index(name) for name in ('right', 'left', 'down')
+    )
+
+    # Games 0 and 2 win, game 1 burns twice and keeps playing, game 3
+    # reaches the arrival with 1 item
+    movements = numpy.array([
+        [right, right, right, down],
+        [right, right, right, right],
+        [right, right, right, left],
+        [left, right, right, left],
+        [left, right, right, left],
+        [left, left, left, left],
+        [left, left, left, right],
+        [down, right, left, left],
+        [down, right, down, down],
+        [down, down, down, down]
+    ], dtype=numpy.int8)
+
+    batch_engine = play_both(grid, movements, remaining_life=4)
+
+    assert list(batch_engine.result) == [WIN, RUNNING, WIN, DEFEAT]
+    assert batch_engine.results() == {'running': 1, 'win': 2, 'defeat': 1}
+
+
+def test_run_and_reset():
+
+    grid = Labyrinth(level=1, seed=0).grid
+    batch_engine = BatchEngine(grid=grid, games=GAMES, remaining_life=1)
+
+    steps = batch_engine.run(policy=random_policy(seed=0), max_steps=10000)
+
+    assert steps < 10000
+    assert batch_engine.results()['running'] == 0
+    assert (batch_engine.moves > 0).all()
+
+    batch_engine.reset()
+
+    assert batch_engine.results() == {
+        'running': GAMES, 'win': 0, 'defeat': 0
+    }
+    assert (batch_engine.remaining_life == 1).all()
+    assert (batch_engine.positions()[0] == 0).all()
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+""" Engine tests
+
+The rules of Engine.apply_move, and the rules of the baseline Game
+(movement_collusion before the engine) replayed on the shipped levels.
+
+Launch from the root of the project :
+
+    python -m pytest
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from random import Random
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import MOVEMENTS
+from backend.engine import MAX_LIFE
+from backend.engine import MOVED
+from backend.engine import WIN
+from backend.engine import DEFEAT
+from backend.engine import MOVED_EVENTS
+from backend.engine import BLOCKED_EVENTS
+from backend.engine import ITEM_EVENTS
+from backend.engine import FIRE_EVENTS
+from backend.engine import FIRE_DEFEAT_EVENTS
+from backend.engine import WIN_EVENTS
+from backend.engine import DEFEAT_EVENTS
+from backend.grid import Grid
+from backend.labyrinth import Labyrinth
+
+
+def engine_of(labyrinth_txt, remaining_life=MAX_LIFE):
+    """ Return an Engine of a labyrinth written as text """
+
+    return Engine(
+        grid=Grid.from_text(labyrinth_txt),
+        remaining_life=remaining_life
+    )
+
+
+def baseline_move(state, labyrinth, movement_name):
+    """ Baseline rules of a move
+
+    The rules of Game.movement_collusion before the engine, on a list of
+    lists : only 'x' walls existed, the other walls ('0'...'9') block the
+    move like them.
+
+    Args:
+        state(dict): 'line', 'column', 'life', 'items' and 'result'.
+        labyrinth(list): List of lists of tiles.
+        movement_name(str): 'right', 'left', 'down' or 'up'.
+
+    """
+
+    line_move, column_move = MOVEMENTS[movement_name]
+    line_number = state['line'] + line_move
+    column_number = state['column'] + column_move
+
+    if not (0 <= line_number < len(labyrinth)
+            and 0 <= column_number < len(labyrinth[0])):
+        return
+
+    tile = labyrinth[line_number][column_number]
+
+    def movement(line_number, column_number):
+        labyrinth[state['line']][state['column']] = 'c'
+        state['line'], state['column'] = line_number, column_number
+        labyrinth[line_number][column_number] = 'P'
+
+    if tile == 'c':
+        movement(line_number, column_number)
+
+    elif tile in 'laks':
+
+        if tile == 'l':
+            state['life'] = min(state['life'] + 1, 5)
+        else:
+            state['items'] += 1
+
+        movement(line_number, column_number)
+
+    elif tile == 'f':
+
+        if state['life'] == 1:
+            state['result'] = DEFEAT
+        else:
+            state['life'] -= 1
+            movement(0, 0)
+
+    elif tile == 'A':
+        state['result'] = WIN if state['items'] == 3 else DEFEAT
+
+
+def test_path_moves_the_player():
+
+    engine = engine_of("Pc\nxx")
+
+    assert engine.apply_move('right') == MOVED_EVENTS
+    assert (engine.line_number, engine.column_number) == (0, 1)
+    assert (engine.previous_line, engine.previous_column) == (0, 0)
+    assert engine.grid.to_text() == "cP\nxx"
+
+
+@pytest.mark.parametrize("labyrinth_txt, movement_name", [
+    ("Px\ncc", 'right'),
+    ("P0\ncc", 'right'),
+    ("Pc\ncc", 'left'),
+    ("Pc\ncc", 'up')
+])
+def test_walls_and_borders_block(labyrinth_txt, movement_name):
+
+    engine = engine_of(labyrinth_txt)
+
+    assert engine.apply_move(movement_name) == BLOCKED_EVENTS
+    assert (engine.line_number, engine.column_number) == (0, 0)
+    assert engine.grid.to_text() == labyrinth_txt
+
+
+def test_items_are_picked_up():
+
+    engine = engine_of("Paks")
+
+    for item_type in "aks":
+        assert engine.apply_move('right') == ITEM_EVENTS
+        assert engine.last_item == item_type
+
+    assert (engine.armor, engine.key, engine.sword) == (1, 1, 1)
+    assert engine.items == 3
+    assert engine.grid.to_text() == "cccP"
+
+
+def test_life_item_is_capped():
+
+    engine = engine_of("Pll", remaining_life=MAX_LIFE - 1)
+
+    engine.apply_move('right')
+    assert engine.remaining_life == MAX_LIFE
+
+    engine.apply_move('right')
+    assert engine.remaining_life == MAX_LIFE
+    assert engine.items == 0
+
+
+def test_fire_sends_back_to_the_start():
+
+    engine = engine_of("Pcf", remaining_life=2)
+
+    engine.apply_move('right')
+
+    assert engine.apply_move('right') == FIRE_EVENTS
+    assert engine.remaining_life == 1
+    assert (engine.line_number, engine.column_number) == (0, 0)
+    assert engine.grid.to_text() == "Pcf"
+    assert engine.result is None
+
+
+def test_fire_on_the_last_life_is_a_defeat():
+
+    engine = engine_of("Pf", remaining_life=1)
+
+    assert engine.apply_move('right') == FIRE_DEFEAT_EVENTS
+    assert engine.result == DEFEAT
+    assert engine.apply_move('left') == BLOCKED_EVENTS
+
+
+def test_arrival_with_the_items_is_a_win():
+
+    engine = engine_of("PaksA")
+
+    for _ in range(3):
+        engine.apply_move('right')
+
+    assert engine.apply_move('right') == WIN_EVENTS
+    assert engine.result == WIN
+    assert engine.apply_move('left') == BLOCKED_EVENTS
+
+
+def test_arrival_without_the_items_is_a_defeat():
+
+    engine = engine_of("PakA")
+
+    engine.apply_move('right')
+    engine.apply_move('right')
+
+    assert engine.apply_move('right') == DEFEAT_EVENTS
+    assert engine.result == DEFEAT
+
+
+def test_move_notifies_the_subscribers():
+
+    engine = engine_of("PaksA")
+    received = []
+
+    engine.subscribe(lambda event, engine: received.append(event))
+
+    for _ in range(4):
+        engine.move('right')
+
+    assert received == list(ITEM_EVENTS * 3 + WIN_EVENTS)
+    assert MOVED in received
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_baseline_rules_on_the_levels(level):
+
+    random = Random(level)
+
+    for seed in range(20):
+
+        grid = Labyrinth(level=level, seed=seed).grid
+        labyrinth = [list(line) for line in grid.lines]
+        engine = Engine(grid=grid)
+        state = {
+            'line': 0, 'column': 0, 'life': MAX_LIFE, 'items': 0,
+            'result': None
+        }
+
+        for _ in range(500):
+
+            movement_name = random.choice(tuple(MOVEMENTS))
+            baseline_move(state, labyrinth, movement_name)
+            engine.apply_move(movement_name)
+
+            assert (engine.line_number, engine.column_number) == (
+                state['line'], state['column']
+            )
+            assert engine.remaining_life == state['life']
+            assert engine.items == state['items']
+            assert engine.result == state['result']
+
+            if engine.result is not None:
+                break
+
+        assert [list(line) for line in grid.lines] == labyrinth
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+""" Generator tests
+
+The generated labyrinths reach their arrival, and a seed
+gives the same kruskal maze with or without NumPy.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from random import Random
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend import generator
+from backend.generator import ALGORITHMS
+from backend.generator import carve_kruskal
+from backend.generator import generate
+from backend.grid import ARRIVAL
+from backend.solver import Solver
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_generated_labyrinths_reach_the_arrival(algorithm):
+
+    for seed in range(5):
+
+        grid = generate(31, 21, algorithm=algorithm, seed=seed)
+
+        assert (grid.width, grid.height) == (31, 21)
+        assert grid.find_all(bytes((ARRIVAL,)))
+        assert Solver(grid).can_reach_arrival()
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_seed_gives_the_same_labyrinth(algorithm):
+
+    assert generate(41, 41, algorithm=algorithm, seed=5).cells == generate(
+        41, 41, algorithm=algorithm, seed=5
+    ).cells
+
+
+@pytest.mark.parametrize("size", [(2, 3), (5, 7), (31, 31), (64, 17)])
+def test_kruskal_without_numpy(size):
+
+    pytest.importorskip("numpy")
+
+    cells_width, cells_height = size
+
+    for seed in range(5):
+        assert carve_kruskal(
+            cells_width, cells_height, Random(seed)
+        ) == generator.carve_kruskal_numpy(
+            cells_width, cells_height, Random(seed)
+        )
+
+
+def test_generate_without_numpy(monkeypatch):
+
+    pytest.importorskip("numpy")
+
+    with_numpy = generate(61, 45, algorithm='kruskal', seed=11)
+    monkeypatch.setattr(generator, 'numpy', None)
+
+    assert generate(61, 45, algorithm='kruskal', seed=11).cells == (
+        with_numpy.cells
+    )
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+""" Grid tests
+
+A Grid and its list of lists views (GridLines, GridLine) read and write
+the same tiles.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import pytest
+
+# PROGRAM IMPORTS
+from backend.grid import Grid
+from backend.grid import PATH
+from backend.grid import FIRE
+from backend.grid import ITEMS
+
+LABYRINTH_TXT = "Pcxf\nxacA\nfckx"
+
+
+def test_text_round_trip():
+
+    grid = Grid.from_text(LABYRINTH_TXT + "\n")
+
+    assert (grid.width, grid.height) == (4, 3)
+    assert grid.to_text() == LABYRINTH_TXT
+    assert bytes(grid.row(1)) == b"xacA"
+
+
+def test_lines_match_the_text():
+
+    grid = Grid.from_text(LABYRINTH_TXT)
+
+    assert len(grid.lines) == 3
+    assert [list(line) for line in grid.lines] == [
+        list(line) for line in LABYRINTH_TXT.split("\n")
+    ]
+    assert [len(line) for line in grid.lines] == [4, 4, 4]
+
+
+def test_lines_and_cells_are_the_same_tiles():
+
+    grid = Grid.from_text(LABYRINTH_TXT)
+
+    grid.lines[1][2] = 'f'
+    assert grid.get(1, 2) == FIRE
+    assert grid.cells[1 * grid.width + 2] == FIRE
+
+    grid.set(2, 1, PATH)
+    assert grid.lines[2][1] == 'c'
+
+
+@pytest.mark.parametrize("line_number, column_number", [
+    (3, 0), (-1, 0), (0, 4), (0, -1)
+])
+def test_lines_check_the_bounds(line_number, column_number):
+
+    grid = Grid.from_text(LABYRINTH_TXT)
+
+    with pytest.raises(IndexError):
+        grid.lines[line_number][column_number] = 'c'
+
+
+def test_find_all():
+
+    grid = Grid.from_text(LABYRINTH_TXT)
+
+    assert grid.find_all(b'f') == [3, 8]
+    assert grid.find_all(ITEMS) == [5, 10]
+    assert grid.fire_cells() == [(0, 3), (2, 0)]
+    assert grid.path_cells() == [(0, 1), (1, 2), (2, 1)]
+
+
+def test_copy_is_independent():
+
+    grid = Grid.from_text(LABYRINTH_TXT)
+    copy = grid.copy()
+
+    copy.lines[0][1] = 'x'
+
+    assert grid.lines[0][1] == 'c'
+    assert copy.to_text() != grid.to_text()
+
+
+def test_walls_grid():
+
+    grid = Grid(width=3, height=2)
+
+    assert grid.to_text() == "xxx\nxxx"
+
+
+def test_invalid_sizes():
+
+    with pytest.raises(ValueError):
+        Grid(width=3, height=2, cells=bytearray(5))
+
+    with pytest.raises(ValueError):
+        Grid.from_text("Pc\nccc")
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+""" Labyrinth tests
+
+The items are placed on distinct free tiles reachable from the start, a
+seed gives the same placement, and every placement can be won. The
+distance table kept up to date by move_item is the table of the moved
+items. The levels are parsed once per process, the games get copies.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import builtins
+import os
+from random import Random
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend import labyrinth as labyrinth_module
+from backend.grid import PATH
+from backend.grid import WALLS
+from backend.labyrinth import Labyrinth
+from backend.solver import Solver
+
+LEVELS = [1, 2, 3]
+SEEDS = range(20)
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_items_on_distinct_reachable_tiles(level):
+
+    level_grid = Labyrinth.get_level(level)['grid']
+    distances = Solver(level_grid).distances()
+    items = Labyrinth.get_level(level)['items']
+
+    for seed in SEEDS:
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+        indexes = [labyrinth.points[name] for name in items]
+
+        assert len(set(indexes)) == len(items)
+
+        for name, index in zip(items, indexes):
+            assert labyrinth.grid.cells[index] == ord(items[name])
+            assert level_grid.cells[index] == PATH
+            assert distances[index] > 0
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_seed_gives_the_same_placement(level):
+
+    for seed in SEEDS:
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+
+        assert labyrinth.grid.cells == Labyrinth(
+            level=level, seed=seed
+        ).grid.cells
+        assert labyrinth.points == Labyrinth(level=level, seed=seed).points
+
+
+def test_seeds_give_different_placements():
+
+    placements = {
+        bytes(Labyrinth(level=1, seed=seed).grid.cells) for seed in SEEDS
+    }
+
+    assert len(placements) > 1
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_every_placement_is_solvable(level):
+
+    for seed in SEEDS:
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+
+        assert Solver(labyrinth.grid).solve() is not None
+        assert labyrinth.solve() is not None
+
+
+def fresh_distance_table(labyrinth):
+    """ Distance table of the labyrinth computed again, with a new solver """
+
+    table = labyrinth.distance_table
+    solver = labyrinth.solver
+    labyrinth.distance_table = labyrinth.solver = None
+
+    fresh_table = labyrinth.get_distance_table()
+
+    labyrinth.distance_table = table
+    labyrinth.solver = solver
+
+    return fresh_table
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_moved_items_distance_table(level):
+
+    random = Random(level)
+
+    for seed in range(10):
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+        items = list(Labyrinth.get_level(level)['items'])
+        labyrinth.get_distance_table()
+
+        for _ in range(6):
+
+            index = random.choice(
+                labyrinth.grid.find_all(bytes((PATH,)))
+            )
+            labyrinth.move_item(
+                random.choice(items), *divmod(index, labyrinth.grid.width)
+            )
+
+            assert labyrinth.distance_table == fresh_distance_table(
+                labyrinth
+            )
+
+        assert labyrinth.solve()[0] == Solver(labyrinth.grid).solve()[0]
+
+
+def test_move_item_on_a_tile_which_is_not_a_path():
+
+    labyrinth = Labyrinth(level=1, seed=0)
+    grid = labyrinth.grid
+    cells = bytes(grid.cells)
+
+    for index in (
+            labyrinth.points['start'],
+            labyrinth.points['key'],
+            labyrinth.points['arrival'],
+            grid.find_all(WALLS)[0]
+    ):
+        with pytest.raises(ValueError):
+            labyrinth.move_item('armor', *divmod(index, grid.width))
+
+    assert grid.cells == cells
+
+
+def test_level_file_is_read_once(monkeypatch):
+
+    Labyrinth(level=1, seed=0)
+    opened = []
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return builtins.open(*args, **kwargs)
+
+    monkeypatch.setattr(labyrinth_module, 'open', counting_open, raising=False)
+
+    Labyrinth(level=1, seed=1)
+    Labyrinth(level=1, seed=2)
+
+    assert opened == []
+
+
+@pytest.mark.parametrize("level", LEVELS)
+def test_games_get_copies_of_the_level(level):
+
+    level_cells = bytes(Labyrinth.get_level(level)['grid'].cells)
+    labyrinth = Labyrinth(level=level, seed=0)
+
+    labyrinth.grid.cells[labyrinth.points['armor']] = PATH
+    labyrinth.labyrinth[0][0] = 'x'
+
+    assert Labyrinth.get_level(level)['grid'].cells == level_cells
+
+    next_labyrinth = Labyrinth(level=level, seed=0)
+
+    assert next_labyrinth.labyrinth[0][0] == 'P'
+    assert next_labyrinth.grid.cells[next_labyrinth.points['armor']] == ord(
+        'a'
+    )
+
+
+def write_text_level(path, labyrinth_txt, mtime_ns):
+    """ Write a txt level file with a modification time """
+
+    with open(path, 'w') as level_file:
+        level_file.write(labyrinth_txt)
+
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.parametrize("revalidate", [False, True])
+def test_level_cache_revalidate(monkeypatch, tmp_path, revalidate):
+
+    monkeypatch.setattr(
+        labyrinth_module, 'LEVEL_CACHE_REVALIDATE', revalidate
+    )
+
+    path = str(tmp_path / "level.txt")
+    write_text_level(path, "Pcccc\nxxxxc\nAcccc", 10 ** 18)
+    level = Labyrinth.add_level(path=path)
+
+    assert Labyrinth(level=level, seed=0).grid.get(1, 0) in WALLS
+
+    # The tile under the start becomes a path
+    write_text_level(path, "Pcccc\ncxxxc\nAcccc", 2 * 10 ** 18)
+
+    assert (Labyrinth(level=level, seed=0).grid.get(1, 0) in WALLS) == (
+        not revalidate
+    )
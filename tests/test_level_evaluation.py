@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+""" Level evaluation tests
+
+The evaluation of a placement gives its par and the games of the random
+player, the writer writes the placements as CSV or JSON lines.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import csv
+import io
+import json
+import os
+import sys
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend import level_evaluation
+from backend.labyrinth import Labyrinth
+from backend.labyrinth import LABYRINTHS_DIRECTORY
+from backend.level_evaluation import FIELDS
+from backend.level_evaluation import EvaluationWriter
+from backend.level_evaluation import evaluate_placement
+from backend.solver import Solver
+
+AGENT_GAMES = 3
+MAX_MOVES = 200
+
+SOURCES = [
+    ('1', 'level', 1),
+    ('3', 'level', 3),
+    (
+        'level-2.txt',
+        'path',
+        os.path.join(LABYRINTHS_DIRECTORY, 'level-2.txt')
+    ),
+    (
+        'kruskal-21x15-4',
+        'generator',
+        {'width': 21, 'height': 15, 'algorithm': 'kruskal', 'seed': 4}
+    )
+]
+
+
+@pytest.mark.parametrize("source", SOURCES, ids=lambda source: source[0])
+def test_evaluate_placement(source):
+
+    for seed in range(3):
+
+        placement = evaluate_placement(source, seed, AGENT_GAMES, MAX_MOVES)
+        labyrinth = Labyrinth(
+            level=level_evaluation.source_level(source), seed=seed
+        )
+
+        assert tuple(placement) == FIELDS
+        assert placement['level'] == source[0]
+        assert placement['seed'] == seed
+        assert placement['solvable']
+        assert placement['par_moves'] == Solver(labyrinth.grid).solve()[0]
+        assert placement['agent_games'] == AGENT_GAMES
+        assert sum(
+            placement[field] for field in (
+                'agent_wins', 'fire_deaths', 'arrival_defeats', 'unfinished'
+            )
+        ) == AGENT_GAMES
+
+        # The same seed gives the same evaluation
+        assert evaluate_placement(
+            source, seed, AGENT_GAMES, MAX_MOVES
+        ) == placement
+
+
+def test_source_level_is_added_once():
+
+    source = SOURCES[2]
+
+    assert level_evaluation.source_level(source) == (
+        level_evaluation.source_level(source)
+    )
+    assert level_evaluation.source_level(SOURCES[0]) == 1
+
+
+def placements():
+    """ Placements of level 1 """
+
+    return [
+        evaluate_placement(SOURCES[0], seed, AGENT_GAMES, MAX_MOVES)
+        for seed in range(4)
+    ]
+
+
+def test_csv_writer():
+
+    output_file = io.StringIO()
+    writer = EvaluationWriter(output_file, 'csv')
+    evaluated = placements()
+
+    writer.write(evaluated[:2])
+    writer.write(evaluated[2:])
+
+    output_file.seek(0)
+    rows = list(csv.DictReader(output_file))
+
+    assert output_file.getvalue().splitlines()[0] == ','.join(FIELDS)
+    assert rows == [
+        {field: str(placement[field]) for field in FIELDS}
+        for placement in evaluated
+    ]
+
+
+def test_jsonl_writer():
+
+    output_file = io.StringIO()
+    writer = EvaluationWriter(output_file, 'jsonl')
+    evaluated = placements()
+
+    writer.write(evaluated)
+
+    assert [
+        json.loads(line) for line in output_file.getvalue().splitlines()
+    ] == evaluated
+
+
+@pytest.mark.parametrize("output_name", ["evaluation.csv", "evaluation.jsonl"])
+def test_main(monkeypatch, capsys, tmp_path, output_name):
+
+    output_path = str(tmp_path / output_name)
+    monkeypatch.setattr(sys, 'argv', [
+        'level_evaluation', '1',
+        os.path.join(LABYRINTHS_DIRECTORY, 'level-2.txt'),
+        '--placements', '20',
+        '--agent-games', '2',
+        '--max-moves', '100',
+        '--workers', '1',
+        '--output', output_path
+    ])
+
+    level_evaluation.main()
+
+    with open(output_path, 'r') as output_file:
+
+        if output_name.endswith('.jsonl'):
+            rows = [json.loads(line) for line in output_file]
+        else:
+            rows = list(csv.DictReader(output_file))
+
+    # 20 placements of each level, each one once
+    assert sorted(
+        (row['level'], int(row['seed'])) for row in rows
+    ) == sorted(
+        (level, seed)
+        for level in ('1', os.path.join(LABYRINTHS_DIRECTORY, 'level-2.txt'))
+        for seed in range(20)
+    )
+
+    report = capsys.readouterr().out
+
+    assert "Level 1 : 20 placements" in report
+    assert "solvable : 100.0%" in report
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+""" Level format tests
+
+Binary level files (.lab) written then opened give back the grid and the
+items, and a level loaded from a binary file is the level of its txt
+file.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import mmap
+import os
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend.grid import Grid
+from backend.grid import LEVEL_ITEMS
+from backend.labyrinth import Labyrinth
+from backend.labyrinth import LABYRINTHS_DIRECTORY
+from backend.level_format import binary_to_text
+from backend.level_format import open_level
+from backend.level_format import text_to_binary
+from backend.level_format import write_level
+
+LABYRINTH_TXT = "Pc0f\n1ccA\nfccx"
+
+
+def test_write_open_round_trip(tmp_path):
+
+    path = str(tmp_path / "level.lab")
+    items = {'armor': 'a', 'épée': 's'}
+
+    write_level(path, Grid.from_text(LABYRINTH_TXT), items)
+
+    with open(path, 'rb') as level_file:
+        grid, read_items = open_level(level_file)
+
+    assert (grid.width, grid.height) == (4, 3)
+    assert grid.to_text() == LABYRINTH_TXT
+    assert read_items == items
+
+
+def test_read_only_and_copy_on_write_maps(tmp_path):
+
+    path = str(tmp_path / "level.lab")
+    write_level(path, Grid.from_text(LABYRINTH_TXT), LEVEL_ITEMS)
+
+    with open(path, 'rb') as level_file:
+
+        grid, _ = open_level(level_file)
+
+        with pytest.raises(TypeError):
+            grid.lines[0][1] = 'x'
+
+        grid, _ = open_level(level_file, access=mmap.ACCESS_COPY)
+
+    grid.lines[0][1] = 'x'
+
+    with open(path, 'rb') as level_file:
+        assert open_level(level_file)[0].to_text() == LABYRINTH_TXT
+
+
+def test_not_a_level_file(tmp_path):
+
+    path = tmp_path / "level.lab"
+    path.write_bytes(b"LABX" + bytes(64))
+
+    with open(str(path), 'rb') as level_file:
+        with pytest.raises(ValueError):
+            open_level(level_file)
+
+
+@pytest.mark.parametrize("level", [1, 2])
+def test_conversions_keep_the_level(tmp_path, level):
+
+    text_path = os.path.join(
+        LABYRINTHS_DIRECTORY, "level-{}.txt".format(level)
+    )
+    binary_path = str(tmp_path / "level.lab")
+    new_text_path = str(tmp_path / "level.txt")
+
+    text_to_binary(text_path, binary_path)
+    binary_to_text(binary_path, new_text_path)
+
+    level_grid = Labyrinth.get_level(level)['grid']
+
+    with open(binary_path, 'rb') as level_file:
+        assert bytes(open_level(level_file)[0].cells) == level_grid.cells
+
+    with open(new_text_path, 'r') as level_file:
+        assert level_file.read() == level_grid.to_text() + '\n'
+
+    # A game of the binary file has the level and its items
+    binary_level = Labyrinth.add_level(path=binary_path)
+    labyrinth = Labyrinth(level=binary_level, seed=0)
+
+    assert labyrinth.grid.to_text() == Labyrinth(
+        level=level, seed=0
+    ).grid.to_text()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+""" Recording tests
+
+Recordings written then read give back the game, their replays end in
+the recorded state, and a changed level is told apart from a replay
+which does not match.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+from random import Random
+
+import pytest
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import MOVEMENTS
+from backend.labyrinth import Labyrinth
+from backend.recording import Recording
+from backend.recording import MIN_SEED
+from backend.recording import MAX_SEED
+from backend.recording import engine_state
+from backend.recording import replay
+from backend.recording import verify
+
+
+def record_game(level, seed, moves):
+    """ Record a game of random moves
+
+    Args:
+        level(int): Game level.
+        seed(int): Seed of the placement of the items and of the moves.
+        moves(int): Moves of the game at most.
+
+    Return:
+        Recording.
+
+    """
+
+    random = Random(seed)
+    recording = Recording(level=level, seed=seed)
+    engine = Engine(grid=Labyrinth(level=level, seed=seed).grid)
+
+    for _ in range(moves):
+
+        movement_name = random.choice(tuple(MOVEMENTS))
+        recording.add(movement_name)
+        engine.apply_move(movement_name)
+
+        if engine.result is not None:
+            break
+
+    recording.finish(engine)
+
+    return recording
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+@pytest.mark.parametrize("seed", [0, 7, MIN_SEED, MAX_SEED])
+def test_write_read_verify(tmp_path, level, seed):
+
+    recording = record_game(level, seed, moves=301)
+    path = str(tmp_path / "game.rec")
+
+    recording.write(path)
+    read_recording = Recording.read(path)
+
+    assert read_recording.level == level
+    assert read_recording.seed == seed
+    assert read_recording.level_checksum == recording.level_checksum
+    assert read_recording.movements == recording.movements
+    assert read_recording.final_state == recording.final_state
+    assert verify(read_recording)
+    assert engine_state(replay(read_recording)) == recording.final_state
+
+
+def test_changed_moves_do_not_verify():
+
+    labyrinth = Labyrinth(level=1, seed=3)
+    recording = Recording(level=1, seed=3)
+    engine = Engine(grid=labyrinth.grid.copy())
+
+    for movement_name in labyrinth.get_solver().solve()[1]:
+        recording.add(movement_name)
+        engine.apply_move(movement_name)
+
+    recording.finish(engine)
+
+    assert verify(recording)
+
+    # The game does not end without the last move
+    del recording.movements[-1]
+
+    assert not verify(recording)
+
+
+def test_changed_level_is_reported():
+
+    recording = record_game(level=1, seed=3, moves=200)
+    recording.level_checksum ^= 1
+
+    with pytest.raises(ValueError, match="changed since the recording"):
+        verify(recording)
+
+
+@pytest.mark.parametrize("seed", [MIN_SEED - 1, MAX_SEED + 1])
+def test_seed_out_of_range(seed):
+
+    with pytest.raises(ValueError):
+        Recording(level=1, seed=seed)
+
+
+def test_not_a_recording(tmp_path):
+
+    path = tmp_path / "game.rec"
+
+    path.write_bytes(b"hello")
+
+    with pytest.raises(ValueError, match="not a recording"):
+        Recording.read(str(path))
+
+    path.write_bytes(b"LREC\x01" + bytes(40))
+
+    with pytest.raises(ValueError, match="version"):
+        Recording.read(str(path))
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+""" Solver tests
+
+The routes of Solver.solve and Solver.solve_states win the shipped levels
+with the engine, in the number of moves of their cost.
+
+### MODIFICATIONS
+Last modification date : 18/10/2026
+By : Guillaume SADLER - https://github.com/GRELDAS
+
+"""
+
+# LIBRARY IMPORTS
+import pytest
+
+# PROGRAM IMPORTS
+from backend.engine import Engine
+from backend.engine import WIN
+from backend.grid import Grid
+from backend.labyrinth import Labyrinth
+from backend.solver import Solver
+
+SEEDS = range(10)
+
+
+def play(grid, movement_names):
+    """ Play moves on a copy of a grid, return the engine """
+
+    engine = Engine(grid=grid.copy())
+
+    for movement_name in movement_names:
+        assert engine.result is None
+        engine.apply_move(movement_name)
+
+    return engine
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_solve_wins_the_levels(level):
+
+    for seed in SEEDS:
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+        cost, movement_names = labyrinth.get_solver().solve()
+
+        engine = play(labyrinth.grid, movement_names)
+
+        assert engine.result == WIN
+        assert len(movement_names) == cost
+        assert engine.remaining_life == 5
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_solve_states_matches_solve(level):
+
+    for seed in SEEDS:
+
+        solver = Labyrinth(level=level, seed=seed).get_solver()
+
+        assert solver.solve_states()[0] == solver.solve()[0]
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_solve_states_with_fire(level):
+
+    for seed in SEEDS:
+
+        labyrinth = Labyrinth(level=level, seed=seed)
+        solver = labyrinth.get_solver()
+        cost, movement_names = solver.solve_states(fire_cost=1)
+
+        assert play(labyrinth.grid, movement_names).result == WIN
+        assert cost <= solver.solve()[0]
+
+
+def test_unsolvable_labyrinth():
+
+    # The key is only reachable through the arrival
+    solver = Solver(Grid.from_text("Pasx\ncccx\ncxxk\nccAc"))
+
+    assert solver.solve() is None
+    assert solver.solve_states() is None
+    assert solver.can_reach_arrival()
+
+
+def test_fire_shortcut():
+
+    # Fire after the last item sends the player back next to the arrival
+    labyrinth_txt = "Pcccaksf\nAxxxxxxx"
+    solver = Solver(Grid.from_text(labyrinth_txt))
+
+    assert solver.solve()[0] == 13
+
+    cost, movement_names = solver.solve_states(fire_cost=1)
+    engine = play(Grid.from_text(labyrinth_txt), movement_names)
+
+    assert cost == len(movement_names) == 8
+    assert engine.result == WIN
+    assert engine.remaining_life == 4